@@ -1,13 +1,535 @@
+import argparse
+import ast
+import json
+import keyword
+import mmap
 import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Define la ruta base donde se encuentra el dashboard.py
+RUTA_BASE = os.path.dirname(os.path.abspath(__file__))
+
+# Índice persistente del catálogo de scripts (ver descubrir_scripts)
+ARCHIVO_INDICE = os.path.join(RUTA_BASE, ".dashboard_indice.json")
+VERSION_INDICE = 1
+
+EXTENSIONES = (".py",)
+# Carpetas que no se recorren (ocultas como .git o .idea, además de estas)
+CARPETAS_IGNORADAS = {"__pycache__", "venv", "node_modules"}
+# Scripts que no son ejercicios: no salen en el menú ni se ejecutan en lote (sí se buscan).
+# Los módulos de apoyo los importan los ejercicios; benchmarks y arnés se lanzan con --ejecutar RUTA
+MODULOS_APOYO = {"almacen_agenda.py", "almacen_tareas.py", "campo_fecha.py", "indice_tareas.py",
+                 "lista_virtual.py", "modelo_agenda.py", "modelo_tareas.py"}
+PREFIJOS_NO_EJERCICIO = ("benchmark_", "arnes_")
+
+# Ejecución de scripts: entradas grabadas (una por script, misma ruta + ".txt") y límite de tiempo
+CARPETA_ENTRADAS = os.path.join(RUTA_BASE, "entradas_dashboard")
+TIEMPO_LIMITE_S = 30
+# Opciones del intérprete: sin variables PYTHON*, sin site del usuario y con E/S en UTF-8
+OPCIONES_PYTHON = ["-E", "-s", "-X", "utf8"]
+# En Linux el script se ejecuta a través de este lanzador, que al salir anota su pico de
+# memoria (VmHWM). El ru_maxrss de wait4 no sirve: el hijo hereda el pico del dashboard.
+LANZADOR = """
+import atexit, os, runpy, sys, traceback
+ruta, informe = sys.argv[1:3]
+def anotar_memoria():
+    with open("/proc/self/status") as estado, open(informe, "w") as salida:
+        salida.write(next((l.split()[1] for l in estado if l.startswith("VmHWM:")), "0"))
+atexit.register(anotar_memoria)
+sys.argv[:] = [ruta]
+sys.path[0] = os.path.dirname(ruta)
+try:
+    runpy.run_path(ruta, run_name="__main__")
+except SystemExit:
+    raise
+except BaseException as error:
+    # Traza sin los marcos del lanzador ni de runpy, como si se ejecutara el script directamente
+    marco = error.__traceback__
+    while marco is not None and marco.tb_frame.f_code.co_filename != ruta:
+        marco = marco.tb_next
+    traceback.print_exception(type(error), error, marco or error.__traceback__)
+    sys.exit(1)
+"""
+HAY_PROC = os.path.exists("/proc/self/status")
+
+# Índice invertido de la búsqueda (ver IndiceBusqueda)
+ARCHIVO_BUSQUEDA = os.path.join(RUTA_BASE, ".dashboard_busqueda.json")
+CARPETAS_BUSQUEDA = ("Parcial 01/", "Parcial 02/")
+MINIMO_PARALELO = 8  # con menos scripts por analizar no compensa arrancar procesos
+RESULTADOS_POR_SECCION = 15
+
+# Índices de líneas y páginas resaltadas que se guardan en memoria (las usadas más recientemente)
+TAM_CACHE = 64
+
+# Visor: los archivos se leen por páginas, nunca enteros
+CODIFICACION = "utf-8"  # la de todos los scripts del repositorio (con tildes y eñes)
+LINEAS_POR_PAGINA = 40
+TAM_BLOQUE = 1 << 20  # bytes leídos por vuelta al construir el índice de líneas
+
+# Resaltado de sintaxis por línea (colores ANSI)
+COLORES = {"comentario": "\033[90m", "cadena": "\033[32m", "numero": "\033[36m", "palabra": "\033[35m"}
+PATRON_SINTAXIS = re.compile(
+    r"(?P<comentario>#.*)"
+    r"|(?P<cadena>[rbfuRBFU]{0,2}(?:\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'))"
+    r"|(?P<numero>\b\d+(?:\.\d+)?\b)"
+    r"|(?P<palabra>\b(?:" + "|".join(keyword.kwlist) + r")\b)")
+
+
+def _leer_indice(archivo_indice):
+    try:
+        with open(archivo_indice, "r", encoding="utf-8") as archivo:
+            indice = json.load(archivo)
+        if indice.get("version") == VERSION_INDICE:
+            return indice
+    except (OSError, ValueError):
+        pass  # sin índice o dañado: se reconstruye
+    return {"version": VERSION_INDICE, "carpetas": {}, "scripts": {}}
+
+
+def _guardar_indice(archivo_indice, indice):
+    # Se escribe aparte y se reemplaza, así un corte nunca deja el índice a medias
+    temporal = archivo_indice + ".tmp"
+    try:
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(indice, archivo)
+        os.replace(temporal, archivo_indice)
+    except OSError as e:
+        print(f"No se pudo guardar el índice del dashboard: {e}")
+
+
+def descubrir_scripts(ruta_base=RUTA_BASE, archivo_indice=ARCHIVO_INDICE):
+    """
+    Retorna {ruta relativa: (mtime_ns, tamaño)} de todos los scripts bajo ruta_base.
+    El índice guardado recuerda el mtime y el contenido de cada carpeta: al
+    reiniciar solo se vuelve a listar una carpeta si su mtime cambió (se creó,
+    borró o renombró algo dentro); del resto basta con hacer stat.
+    """
+    anterior = _leer_indice(archivo_indice)
+    carpetas = {}
+    scripts = {}
+    pendientes = [""]
+    while pendientes:
+        relativa = pendientes.pop()
+        ruta = os.path.join(ruta_base, relativa)
+        try:
+            mtime_carpeta = os.stat(ruta).st_mtime_ns
+        except OSError:
+            continue
+        conocida = anterior["carpetas"].get(relativa)
+        if conocida and conocida[0] == mtime_carpeta:
+            _, subcarpetas, archivos = conocida
+        else:
+            subcarpetas, archivos = [], []
+            with os.scandir(ruta) as entradas:
+                for entrada in entradas:
+                    if entrada.is_dir(follow_symlinks=False):
+                        if not entrada.name.startswith(".") and entrada.name not in CARPETAS_IGNORADAS:
+                            subcarpetas.append(entrada.name)
+                    elif entrada.name.endswith(EXTENSIONES):
+                        archivos.append(entrada.name)
+        carpetas[relativa] = [mtime_carpeta, subcarpetas, archivos]
+        pendientes.extend(os.path.join(relativa, nombre) for nombre in subcarpetas)
+        for nombre in archivos:
+            relativo = os.path.join(relativa, nombre)
+            try:
+                estado = os.stat(os.path.join(ruta_base, relativo))
+            except OSError:
+                continue
+            scripts[relativo.replace(os.sep, "/")] = (estado.st_mtime_ns, estado.st_size)
+
+    indice = {"version": VERSION_INDICE, "carpetas": carpetas,
+              "scripts": {ruta: list(firma) for ruta, firma in scripts.items()}}
+    if indice != anterior:
+        _guardar_indice(archivo_indice, indice)
+    return scripts
+
+
+@lru_cache(maxsize=TAM_CACHE)
+def indice_lineas(ruta, mtime_ns, tamano):
+    """
+    Posición (en bytes) donde empieza cada línea; la última entrada es el final del archivo.
+    Con ella, ir a la línea N es O(1). Se construye leyendo por bloques y se guarda
+    por versión del archivo (mtime y tamaño forman parte de la clave).
+    """
+    inicios = array("Q", [0])
+    posicion = 0
+    with open(ruta, "rb") as archivo:
+        while True:
+            bloque = archivo.read(TAM_BLOQUE)
+            if not bloque:
+                break
+            salto = bloque.find(b"\n")
+            while salto != -1:
+                inicios.append(posicion + salto + 1)
+                salto = bloque.find(b"\n", salto + 1)
+            posicion += len(bloque)
+    if inicios[-1] != posicion:
+        inicios.append(posicion)  # última línea sin salto final
+    return inicios
+
+
+def resaltar(linea):
+    return PATRON_SINTAXIS.sub(lambda m: f"{COLORES[m.lastgroup]}{m.group()}\033[0m", linea)
+
+
+@lru_cache(maxsize=TAM_CACHE)
+def pagina(ruta, mtime_ns, tamano, primera, color):
+    """
+    Líneas [primera, primera + LINEAS_POR_PAGINA) ya numeradas (y resaltadas si `color`).
+    Solo se mapea en memoria el archivo y se decodifica el trozo de esa página.
+    """
+    inicios = indice_lineas(ruta, mtime_ns, tamano)
+    ultima = min(primera + LINEAS_POR_PAGINA, len(inicios) - 1)
+    if primera >= ultima:
+        return []
+    with open(ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        datos = mapa[inicios[primera]:inicios[ultima]]
+    lineas = datos.decode(CODIFICACION, errors="replace").splitlines()
+    if color:
+        lineas = [resaltar(linea) for linea in lineas]
+    ancho = len(str(len(inicios) - 1))
+    return [f"{numero:>{ancho}} | {linea}" for numero, linea in enumerate(lineas, start=primera + 1)]
+
+
+def paginar(ruta_script):
+    # Muestra el archivo página a página; un archivo corto se muestra entero sin preguntar
+    estado = os.stat(ruta_script)
+    version = (ruta_script, estado.st_mtime_ns, estado.st_size)
+    total = len(indice_lineas(*version)) - 1
+    color = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+    primera = 0
+    while True:
+        for linea in pagina(*version, primera, color):
+            print(linea)
+        ultima = min(primera + LINEAS_POR_PAGINA, total)
+        if primera == 0 and ultima >= total:
+            return
+        orden = input(f"-- líneas {primera + 1}-{ultima} de {total} -- "
+                      "[Enter] siguiente, 'a' anterior, número: ir a esa línea, 'q' salir: ").strip().lower()
+        if orden == "q":
+            return
+        elif orden == "":
+            if ultima >= total:
+                return
+            primera = ultima
+        elif orden == "a":
+            primera = max(0, primera - LINEAS_POR_PAGINA)
+        elif orden.isdigit():
+            primera = min(max(0, int(orden) - 1), max(0, total - 1))
+        else:
+            print("Orden no válida.")
+
+
+# ---------- Búsqueda ----------
+def analizar_script(ruta):
+    """
+    Extrae de un script (en un proceso aparte si hay muchos):
+    - definiciones: [nombre, tipo, línea] de clases, funciones, métodos y variables globales (con ast)
+    - identificadores: {nombre en minúsculas: [líneas]} de nombres, atributos y parámetros usados
+    - palabras: {palabra en minúsculas: [líneas]} del texto completo (también comentarios y cadenas)
+    """
+    with open(ruta, "r", encoding=CODIFICACION, errors="replace") as archivo:
+        texto = archivo.read()
+    palabras = defaultdict(list)
+    for numero, linea in enumerate(texto.splitlines(), start=1):
+        for palabra in dict.fromkeys(re.findall(r"\w+", linea.lower())):
+            palabras[palabra].append(numero)
+
+    definiciones = []
+    identificadores = defaultdict(set)
+    try:
+        arbol = ast.parse(texto)
+    except (SyntaxError, ValueError):
+        arbol = None  # el script no compila: queda solo la búsqueda de texto
+    if arbol is not None:
+        metodos = {id(nodo) for clase in ast.walk(arbol) if isinstance(clase, ast.ClassDef)
+                   for nodo in clase.body if isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef))}
+        for nodo in arbol.body:
+            if isinstance(nodo, ast.Assign):
+                for objetivo in nodo.targets:
+                    if isinstance(objetivo, ast.Name):
+                        definiciones.append([objetivo.id, "variable", nodo.lineno])
+        for nodo in ast.walk(arbol):
+            if isinstance(nodo, ast.ClassDef):
+                definiciones.append([nodo.name, "clase", nodo.lineno])
+            elif isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                definiciones.append([nodo.name, "método" if id(nodo) in metodos else "función", nodo.lineno])
+            elif isinstance(nodo, ast.Name):
+                identificadores[nodo.id.lower()].add(nodo.lineno)
+            elif isinstance(nodo, ast.Attribute):
+                identificadores[nodo.attr.lower()].add(nodo.lineno)
+            elif isinstance(nodo, ast.arg):
+                identificadores[nodo.arg.lower()].add(nodo.lineno)
+    return {"definiciones": definiciones,
+            "identificadores": {nombre: sorted(lineas) for nombre, lineas in identificadores.items()},
+            "palabras": palabras}
+
+
+class IndiceBusqueda:
+    """
+    Índice invertido de los scripts de Parcial 01 y Parcial 02, guardado en disco.
+    - archivos: {ruta: {"firma": [mtime_ns, tamaño], ...lo que retorna analizar_script}}
+    - _definiciones, _identificadores, _palabras: {término: {ruta}} para responder sin recorrer archivos
+    Solo se vuelven a analizar los scripts cuya firma cambió.
+    """
+    def __init__(self, archivo_indice=ARCHIVO_BUSQUEDA):
+        self.archivo_indice = archivo_indice
+        self.archivos = {}
+        self._definiciones = defaultdict(set)
+        self._identificadores = defaultdict(set)
+        self._palabras = defaultdict(set)
+        try:
+            with open(archivo_indice, "r", encoding="utf-8") as archivo:
+                guardado = json.load(archivo)
+            if guardado.get("version") == VERSION_INDICE:
+                for ruta, datos in guardado["archivos"].items():
+                    self._agregar(ruta, datos)
+        except (OSError, ValueError):
+            pass  # sin índice o dañado: se reconstruye
+
+    def _agregar(self, ruta, datos):
+        self.archivos[ruta] = datos
+        for nombre, _, _ in datos["definiciones"]:
+            self._definiciones[nombre.lower()].add(ruta)
+        for nombre in datos["identificadores"]:
+            self._identificadores[nombre].add(ruta)
+        for palabra in datos["palabras"]:
+            self._palabras[palabra].add(ruta)
+
+    def _quitar(self, ruta):
+        datos = self.archivos.pop(ruta)
+        for mapa, terminos in ((self._definiciones, [d[0].lower() for d in datos["definiciones"]]),
+                               (self._identificadores, datos["identificadores"]),
+                               (self._palabras, datos["palabras"])):
+            for termino in terminos:
+                rutas = mapa.get(termino)
+                if rutas is not None:
+                    rutas.discard(ruta)
+                    if not rutas:
+                        del mapa[termino]
+
+    def actualizar(self, scripts):
+        """
+        Sincroniza el índice con {ruta: (mtime_ns, tamaño)} (lo que da descubrir_scripts).
+        Retorna cuántos scripts se analizaron.
+        """
+        scripts = {ruta: list(firma) for ruta, firma in scripts.items() if ruta.startswith(CARPETAS_BUSQUEDA)}
+        for ruta in [r for r in self.archivos if r not in scripts]:
+            self._quitar(ruta)
+        cambiados = [r for r, firma in scripts.items()
+                     if r not in self.archivos or self.archivos[r]["firma"] != firma]
+        if not cambiados:
+            return 0
+        rutas_absolutas = [os.path.join(RUTA_BASE, r) for r in cambiados]
+        if len(cambiados) >= MINIMO_PARALELO:
+            # Primera vez (o muchos cambios): un proceso por núcleo
+            with ProcessPoolExecutor() as procesos:
+                analizados = list(procesos.map(analizar_script, rutas_absolutas, chunksize=4))
+        else:
+            analizados = [analizar_script(r) for r in rutas_absolutas]
+        for ruta, datos in zip(cambiados, analizados):
+            if ruta in self.archivos:
+                self._quitar(ruta)
+            datos["firma"] = scripts[ruta]
+            self._agregar(ruta, datos)
+        _guardar_indice(self.archivo_indice, {"version": VERSION_INDICE, "archivos": self.archivos})
+        return len(cambiados)
+
+    def buscar(self, termino):
+        """
+        Retorna (definiciones, usos, texto): [(ruta, línea, tipo)], [(ruta, línea)], [(ruta, línea)].
+        La búsqueda es por término completo, sin distinguir mayúsculas.
+        """
+        termino = termino.strip().lower()
+        definiciones = sorted((ruta, linea, tipo)
+                              for ruta in self._definiciones.get(termino, ())
+                              for nombre, tipo, linea in self.archivos[ruta]["definiciones"]
+                              if nombre.lower() == termino)
+        usos = sorted((ruta, linea)
+                      for ruta in self._identificadores.get(termino, ())
+                      for linea in self.archivos[ruta]["identificadores"][termino])
+        en_codigo = set(usos) | {(ruta, linea) for ruta, linea, _ in definiciones}
+        texto = sorted((ruta, linea)
+                       for ruta in self._palabras.get(termino, ())
+                       for linea in self.archivos[ruta]["palabras"][termino]
+                       if (ruta, linea) not in en_codigo)
+        return definiciones, usos, texto
+
+    def con_palabra(self, palabra):
+        # Rutas de los scripts que contienen la palabra en cualquier parte
+        return set(self._palabras.get(palabra.lower(), ()))
+
+
+def leer_linea(ruta_relativa, numero):
+    # Una sola línea, usando el índice de líneas del visor
+    ruta = os.path.join(RUTA_BASE, ruta_relativa)
+    estado = os.stat(ruta)
+    inicios = indice_lineas(ruta, estado.st_mtime_ns, estado.st_size)
+    with open(ruta, "rb") as archivo:
+        archivo.seek(inicios[numero - 1])
+        return archivo.read(inicios[numero] - inicios[numero - 1]).decode(CODIFICACION, errors="replace").strip()
+
+
+def mostrar_busqueda(indice, termino):
+    definiciones, usos, texto = indice.buscar(termino)
+    secciones = (("Definido en", [(r, l, f"[{t}] ") for r, l, t in definiciones]),
+                 ("Usado en", [(r, l, "") for r, l in usos]),
+                 ("Aparece en el texto de", [(r, l, "") for r, l in texto]))
+    if not (definiciones or usos or texto):
+        print(f"No se encontró '{termino}'.")
+    for titulo, resultados in secciones:
+        if not resultados:
+            continue
+        print(f"\n{titulo} ({len(resultados)}):")
+        for ruta, linea, prefijo in resultados[:RESULTADOS_POR_SECCION]:
+            print(f"  {prefijo}{ruta}:{linea}  {leer_linea(ruta, linea)}")
+        if len(resultados) > RESULTADOS_POR_SECCION:
+            print(f"  ... y {len(resultados) - RESULTADOS_POR_SECCION} más")
+
+
+# ---------- Ejecución ----------
+@dataclass
+class ResultadoEjecucion:
+    ruta: str
+    codigo: int             # código de salida (negativo: terminado por una señal)
+    segundos: float         # tiempo de reloj
+    memoria_kb: int         # pico de memoria residente (0 si el sistema no lo informa)
+    salida: str             # stdout y stderr juntos
+    vencido: bool = False   # se agotó TIEMPO_LIMITE_S y se mató el proceso
+
+    @property
+    def estado(self):
+        if self.vencido:
+            return "tiempo agotado"
+        return "ok" if self.codigo == 0 else f"error ({self.codigo})"
+
+
+def entrada_grabada(ruta_relativa):
+    # Lo que se escribirá en stdin; sin entrada grabada, stdin queda vacío (input() da EOFError)
+    try:
+        with open(os.path.join(CARPETA_ENTRADAS, ruta_relativa + ".txt"), "rb") as archivo:
+            return archivo.read()
+    except FileNotFoundError:
+        return b""
+
+
+def ejecutar_script(ruta_relativa, tiempo_limite=TIEMPO_LIMITE_S):
+    """
+    Ejecuta el script en un proceso aislado: intérprete con OPCIONES_PYTHON, carpeta de
+    trabajo temporal (los archivos que cree no ensucian el repositorio) y sin pantalla.
+    """
+    ruta = os.path.join(RUTA_BASE, ruta_relativa)
+    entorno = {k: v for k, v in os.environ.items() if k not in ("DISPLAY", "WAYLAND_DISPLAY")}
+    with tempfile.TemporaryDirectory(prefix="dashboard_") as carpeta:
+        # El informe de memoria queda fuera de la carpeta de trabajo del script
+        trabajo = os.path.join(carpeta, "trabajo")
+        os.mkdir(trabajo)
+        informe = os.path.join(carpeta, "memoria")
+        comando = ["-c", LANZADOR, ruta, informe] if HAY_PROC else [ruta]
+        inicio = time.perf_counter()
+        proceso = subprocess.Popen([sys.executable, *OPCIONES_PYTHON, *comando], cwd=trabajo, env=entorno,
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        if not hasattr(os, "wait4"):
+            # Windows: sin rusage por proceso, no se puede medir la memoria
+            try:
+                salida, _ = proceso.communicate(entrada_grabada(ruta_relativa), timeout=tiempo_limite)
+                vencido = False
+            except subprocess.TimeoutExpired:
+                proceso.kill()
+                salida, _ = proceso.communicate()
+                vencido = True
+            return ResultadoEjecucion(ruta_relativa, proceso.returncode, time.perf_counter() - inicio, 0,
+                                      salida.decode("utf-8", errors="replace"), vencido)
+
+        vencido = threading.Event()
+
+        def matar():
+            vencido.set()
+            proceso.kill()
+        temporizador = threading.Timer(tiempo_limite, matar)
+        temporizador.start()
+        partes = []
+        lector = threading.Thread(target=lambda: partes.append(proceso.stdout.read()))
+        lector.start()
+        try:
+            proceso.stdin.write(entrada_grabada(ruta_relativa))
+            proceso.stdin.close()
+        except BrokenPipeError:
+            pass  # terminó sin leer toda la entrada
+        # wait4 (en vez de wait) entrega además el uso de recursos de ese hijo
+        _, estado, uso = os.wait4(proceso.pid, 0)
+        segundos = time.perf_counter() - inicio
+        temporizador.cancel()
+        lector.join()
+        proceso.stdout.close()
+        proceso.returncode = os.waitstatus_to_exitcode(estado)
+        if HAY_PROC:
+            # VmHWM en KiB; sin informe (p. ej. proceso matado) queda en 0
+            try:
+                with open(informe) as archivo:
+                    memoria_kb = int(archivo.read() or 0)
+            except FileNotFoundError:
+                memoria_kb = 0
+        else:
+            # Sin /proc: ru_maxrss de ese hijo (en bytes en macOS, en KiB en el resto)
+            memoria_kb = uso.ru_maxrss // 1024 if sys.platform == "darwin" else uso.ru_maxrss
+        return ResultadoEjecucion(ruta_relativa, proceso.returncode, segundos, memoria_kb,
+                                  b"".join(partes).decode("utf-8", errors="replace"), vencido.is_set())
+
+
+def es_ejercicio(ruta):
+    nombre = os.path.basename(ruta)
+    return nombre not in MODULOS_APOYO and not nombre.startswith(PREFIJOS_NO_EJERCICIO)
+
+
+def opciones_menu(scripts):
+    return {str(numero): ruta for numero, ruta in enumerate(sorted(filter(es_ejercicio, scripts)), start=1)}
+
+
+def ejercicios(scripts, indice):
+    """
+    Scripts que se ejecutan en lote: los ejercicios de Parcial 01 y Parcial 02, salvo
+    las apps con Tkinter (necesitan pantalla).
+    """
+    graficos = indice.con_palabra("tkinter")
+    return [ruta for ruta in sorted(scripts)
+            if ruta.startswith(CARPETAS_BUSQUEDA) and ruta not in graficos and es_ejercicio(ruta)]
+
+
+def ejecutar_lote(rutas, tiempo_limite=TIEMPO_LIMITE_S):
+    # Cada hilo solo espera a su proceso, así hay tantos scripts en marcha como núcleos
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as hilos:
+        return list(hilos.map(lambda ruta: ejecutar_script(ruta, tiempo_limite), rutas))
+
+
+def mostrar_resultados(resultados):
+    ancho = max((len(r.ruta) for r in resultados), default=6)
+    print(f"\n{'Script':<{ancho}}  {'Estado':<15}{'Tiempo s':>9}{'Memoria MB':>12}{'Líneas':>8}")
+    for r in resultados:
+        print(f"{r.ruta:<{ancho}}  {r.estado:<15}{r.segundos:>9.3f}{r.memoria_kb / 1024:>12.1f}"
+              f"{len(r.salida.splitlines()):>8}")
+    for r in resultados:
+        if r.codigo != 0 or r.vencido:
+            print(f"\n--- Final de la salida de {r.ruta} ---")
+            print("\n".join(r.salida.splitlines()[-5:]))
 
 
 def mostrar_codigo(ruta_script):
     # Asegúrate de que la ruta al script es absoluta
     ruta_script_absoluta = os.path.abspath(ruta_script)
     try:
-        with open(ruta_script_absoluta, 'r') as archivo:
-            print(f"\n--- Código de {ruta_script} ---\n")
-            print(archivo.read())
+        print(f"\n--- Código de {ruta_script} ---\n")
+        paginar(ruta_script_absoluta)
     except FileNotFoundError:
         print("El archivo no se encontró.")
     except Exception as e:
@@ -15,35 +537,50 @@ def mostrar_codigo(ruta_script):
 
 
 def mostrar_menu():
-    # Define la ruta base donde se encuentra el dashboard.py
-    ruta_base = os.path.dirname(__file__)
-
-    opciones = {
-        '1': 'Parcial 01/Semana 02/2.1 Tarea Semana 02.py',
-        '2': 'Parcial 01/Semana 03/Programacion_(POO).py',
-        '3': 'Parcial 01/Semana 03/Programacion_tradicional.py',
-        '4': 'Parcial 01/Semana 04/EjemplosMundoReal_POO.py',
-        '5': 'Parcial 01/Semana 05/Area_Circulo.py',
-        '6': 'Parcial 01/Semana 06/Tarea_POO_vehiculos.py',
-        '7': 'Parcial 01/Semana 07/prueba.txt',
-        '8': 'Parcial 01/Semana 07/Tarea_Contructores_Destructores.py',
-
-        # Agrega aquí el resto de las rutas de los scripts
-    }
+    # Las opciones se descubren recorriendo las carpetas (con el índice guardado)
+    scripts = descubrir_scripts()
+    opciones = opciones_menu(scripts)
+    indice = None  # el índice de búsqueda se carga la primera vez que se busca
 
     while True:
         print("\nMenu Principal - Dashboard")
         # Imprime las opciones del menú
         for key in opciones:
             print(f"{key} - {opciones[key]}")
+        print("b - Buscar en el código (nombres y texto)")
+        print("e - Ejecutar scripts y comparar tiempos")
+        print("r - Volver a buscar scripts")
         print("0 - Salir")
 
         eleccion = input("Elige un script para ver su código o '0' para salir: ")
         if eleccion == '0':
             break
+        elif eleccion == 'b':
+            if indice is None:
+                indice = IndiceBusqueda()
+                indice.actualizar(scripts)
+            termino = input("Buscar: ")
+            if termino.strip():
+                mostrar_busqueda(indice, termino)
+        elif eleccion == 'e':
+            if indice is None:
+                indice = IndiceBusqueda()
+                indice.actualizar(scripts)
+            elegidos = input("Números de los scripts (separados por espacios) o 't' para todos los ejercicios: ").split()
+            if elegidos == ['t']:
+                rutas = ejercicios(scripts, indice)
+            else:
+                rutas = [opciones[n] for n in elegidos if n in opciones]
+            if rutas:
+                mostrar_resultados(ejecutar_lote(rutas))
+        elif eleccion == 'r':
+            scripts = descubrir_scripts()
+            opciones = opciones_menu(scripts)
+            if indice is not None:
+                indice.actualizar(scripts)
         elif eleccion in opciones:
             # Asegura que el path sea absoluto
-            ruta_script = os.path.join(ruta_base, opciones[eleccion])
+            ruta_script = os.path.join(RUTA_BASE, opciones[eleccion])
             mostrar_codigo(ruta_script)
         else:
             print("Opción no válida. Por favor, intenta de nuevo.")
@@ -51,4 +588,21 @@ def mostrar_menu():
 
 # Ejecutar el dashboard
 if __name__ == "__main__":
-    mostrar_menu()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Dashboard de los scripts del curso.")
+    parser.add_argument("--ejecutar", nargs="*", metavar="RUTA",
+                        help="ejecuta los scripts indicados (sin rutas: todos los ejercicios) y muestra la tabla")
+    parser.add_argument("--tiempo-limite", type=float, default=TIEMPO_LIMITE_S)
+    argumentos = parser.parse_args()
+    if argumentos.ejecutar is None:
+        mostrar_menu()
+    else:
+        scripts = descubrir_scripts()
+        if argumentos.ejecutar:
+            rutas = [ruta.replace(os.sep, "/") for ruta in argumentos.ejecutar]
+        else:
+            indice = IndiceBusqueda()
+            indice.actualizar(scripts)
+            rutas = ejercicios(scripts, indice)
+        resultados = ejecutar_lote(rutas, argumentos.tiempo_limite)
+        mostrar_resultados(resultados)
+        sys.exit(0 if all(r.codigo == 0 and not r.vencido for r in resultados) else 1)
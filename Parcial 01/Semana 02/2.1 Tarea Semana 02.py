@@ -29,9 +29,14 @@ class Personaje:
     def daño(self, enemigo):
         return self.fuerza - enemigo.defensa
 
-    def atacar(self, enemigo):
+    def golpear(self, enemigo):
+        # Mecánica del ataque, sin mensajes (la usa también el simulador por lotes)
         daño = self.daño(enemigo)
         enemigo.vida = enemigo.vida - daño
+        return daño
+
+    def atacar(self, enemigo):
+        daño = self.golpear(enemigo)
         print(self.nombre, "ha realizado", daño, "puntos de daño a", enemigo.nombre)
         if enemigo.esta_vivo():
             print("Vida de", enemigo.nombre, "es", enemigo.vida)
@@ -93,10 +98,12 @@ def combate(jugador_1, jugador_2):
         print("\nEmpate")
 
 
-personaje_1 = Guerrero("Guts", 20, 10, 4, 100, 4)
-personaje_2 = Mago("Vanessa", 5, 15, 4, 100, 3)
+# Demostración (solo al ejecutar el script, no al cargarlo desde el simulador)
+if __name__ == "__main__":
+    personaje_1 = Guerrero("Guts", 20, 10, 4, 100, 4)
+    personaje_2 = Mago("Vanessa", 5, 15, 4, 100, 3)
 
-personaje_1.atributos()
-personaje_2.atributos()
+    personaje_1.atributos()
+    personaje_2.atributos()
 
-combate(personaje_1, personaje_2)
\ No newline at end of file
+    combate(personaje_1, personaje_2)
@@ -0,0 +1,215 @@
+# ==========================================
+# COMBATE EN FORMA CERRADA Y NÚCLEO VECTORIZADO (NumPy)
+# ==========================================
+# El daño de cada golpe es una fórmula fija de los atributos (fuerza*espada -
+# defensa, inteligencia*libro - defensa): no cambia durante el combate. Por
+# eso no hace falta simular turno a turno:
+# - turnos para matar al rival = ceil(vida_rival / daño), si el daño es positivo
+#   (con daño 0 o negativo, que cura, el rival no muere nunca)
+# - el combate dura min(turnos de 1, turnos de 2, tope) y las vidas finales son
+#   vida - daño_recibido * turnos
+# resolver() aplica lo mismo a arrays enteros: rejillas de combinaciones de
+# atributos se evalúan de una vez. Los resultados coinciden exactamente con
+# el `combate` original de la tarea (ver comprobar_paridad).
+
+import argparse
+import copy
+import io
+import random
+import time
+from contextlib import redirect_stdout
+from typing import Dict, Tuple
+
+import numpy as np
+
+from simulador_combate import (CLASES, EMPATE, MAX_TURNOS, RANGOS, SIN_RESULTADO, Personaje,
+                               duelo, personaje_aleatorio, tarea)
+
+
+def duelo_cerrado(jugador_1: Personaje, jugador_2: Personaje, max_turnos: int = MAX_TURNOS) -> Tuple[int, int, int, int]:
+    """
+    Mismo resultado que simulador_combate.duelo, en O(1):
+    (resultado, turnos, daño hecho por 1, daño hecho por 2).
+    """
+    daño_1 = jugador_1.daño(jugador_2)
+    daño_2 = jugador_2.daño(jugador_1)
+    vida_1, vida_2 = jugador_1.vida, jugador_2.vida
+    if vida_1 <= 0 or vida_2 <= 0:
+        turnos = 0  # el bucle ni siquiera empieza
+    else:
+        turnos = max_turnos
+        if daño_1 > 0:
+            turnos = min(turnos, -(-vida_2 // daño_1))
+        if daño_2 > 0:
+            turnos = min(turnos, -(-vida_1 // daño_2))
+    # En cada turno atacan los dos (también el que acaba de morir): empate si caen a la vez
+    final_1 = vida_1 - daño_2 * turnos
+    final_2 = vida_2 - daño_1 * turnos
+    if final_1 > 0 and final_2 > 0:
+        resultado = SIN_RESULTADO
+    elif final_1 > 0:
+        resultado = 1
+    elif final_2 > 0:
+        resultado = 2
+    else:
+        resultado = EMPATE
+    return resultado, turnos, daño_1 * turnos, daño_2 * turnos
+
+
+def resolver(vida_1, daño_1, vida_2, daño_2, max_turnos: int = MAX_TURNOS) -> Tuple[np.ndarray, ...]:
+    """
+    Núcleo vectorizado de duelo_cerrado sobre arrays (que se combinan por broadcasting).
+    Retorna arrays (resultado, turnos, daño hecho por 1, daño hecho por 2).
+    """
+    vida_1, daño_1, vida_2, daño_2 = np.broadcast_arrays(*(np.asarray(a, dtype=np.int64)
+                                                           for a in (vida_1, daño_1, vida_2, daño_2)))
+    # ceil(vida / daño) solo donde el daño es positivo (el divisor 1 evita dividir por 0)
+    mata_1 = np.where(daño_1 > 0, -(-vida_2 // np.maximum(daño_1, 1)), max_turnos)
+    mata_2 = np.where(daño_2 > 0, -(-vida_1 // np.maximum(daño_2, 1)), max_turnos)
+    turnos = np.minimum(np.minimum(mata_1, mata_2), max_turnos)
+    turnos = np.where((vida_1 <= 0) | (vida_2 <= 0), 0, turnos)
+
+    vivo_1 = vida_1 - daño_2 * turnos > 0
+    vivo_2 = vida_2 - daño_1 * turnos > 0
+    resultado = np.select([vivo_1 & vivo_2, vivo_1, vivo_2], [SIN_RESULTADO, 1, 2], default=EMPATE)
+    return resultado, turnos, daño_1 * turnos, daño_2 * turnos
+
+
+def duelos_en_rejilla(clase_1: str, atributos_1: Dict[str, np.ndarray],
+                      clase_2: str, atributos_2: Dict[str, np.ndarray],
+                      max_turnos: int = MAX_TURNOS) -> Tuple[np.ndarray, ...]:
+    """
+    Evalúa a la vez todos los duelos descritos por arrays de atributos
+    (fuerza, inteligencia, defensa, vida, arma), combinables por broadcasting.
+    El daño se calcula con los métodos daño() de las propias clases, aplicados a
+    arrays: si cambia una fórmula en la tarea, el núcleo la sigue sin tocarlo.
+    """
+    orden = ("fuerza", "inteligencia", "defensa", "vida", "arma")
+    jugador_1 = CLASES[clase_1](clase_1, *(np.asarray(atributos_1[a], dtype=np.int64) for a in orden))
+    jugador_2 = CLASES[clase_2](clase_2, *(np.asarray(atributos_2[a], dtype=np.int64) for a in orden))
+    return resolver(jugador_1.vida, jugador_1.daño(jugador_2), jugador_2.vida, jugador_2.daño(jugador_1), max_turnos)
+
+
+# ---------- Comprobación y benchmark ----------
+def casos_limite():
+    # (clase_1, atributos_1, clase_2, atributos_2, max_turnos); atributos en el orden del constructor
+    return [
+        ("Guerrero", (10, 1, 0, 100, 10), "Mago", (1, 10, 0, 100, 10), MAX_TURNOS),  # empate: caen en el mismo turno
+        ("Guerrero", (1, 1, 10, 100, 1), "Mago", (1, 1, 10, 100, 1), MAX_TURNOS),    # daño negativo (curan): tope
+        ("Guerrero", (2, 1, 10, 100, 5), "Mago", (1, 3, 10, 100, 4), MAX_TURNOS),    # daño 0 en ambos
+        ("Guerrero", (5, 1, 0, 100, 2), "Mago", (1, 1, 20, 100, 1), MAX_TURNOS),     # solo uno hace daño
+        ("Guerrero", (1, 1, 0, 10, 1), "Mago", (1, 1, 0, 10, 1), 10),                # muere justo en el tope
+        ("Guerrero", (1, 1, 0, 11, 1), "Mago", (1, 1, 0, 11, 1), 10),                # sigue vivo al llegar al tope
+        ("Guerrero", (5, 1, 0, 0, 2), "Mago", (1, 5, 0, 100, 2), MAX_TURNOS),        # vida inicial 0
+        ("Guerrero", (5, 1, 0, -5, 2), "Mago", (1, 5, 0, -5, 2), MAX_TURNOS),        # ambos sin vida
+        ("Guerrero", (20, 1, 0, 150, 10), "Guerrero", (20, 1, 0, 150, 10), MAX_TURNOS),  # espejo
+    ]
+
+
+def resultado_combate(jugador_1: Personaje, jugador_2: Personaje, max_turnos: int = MAX_TURNOS) -> Tuple[int, int, int, int]:
+    """
+    Resultado de referencia: ejecuta el `combate` original de la tarea (sobre copias,
+    con su salida capturada) y lo lee de lo que imprime. Luego aplica el tope de turnos:
+    si el combate dura más, el resultado es SIN_RESULTADO al llegar al tope.
+    Si ninguno de los dos hace daño, `combate` no terminaría: no se ejecuta.
+    """
+    daño_1, daño_2 = jugador_1.daño(jugador_2), jugador_2.daño(jugador_1)
+    if jugador_1.vida > 0 and jugador_2.vida > 0 and daño_1 <= 0 and daño_2 <= 0:
+        return SIN_RESULTADO, max_turnos, daño_1 * max_turnos, daño_2 * max_turnos
+    copia_1, copia_2 = copy.copy(jugador_1), copy.copy(jugador_2)
+    copia_1.nombre, copia_2.nombre = "Jugador 1", "Jugador 2"
+    salida = io.StringIO()
+    with redirect_stdout(salida):
+        tarea.combate(copia_1, copia_2)
+    lineas = salida.getvalue().splitlines()
+    turnos = sum(linea.startswith("Turno ") for linea in lineas)
+    if turnos > max_turnos:
+        return SIN_RESULTADO, max_turnos, daño_1 * max_turnos, daño_2 * max_turnos
+    hechos = {"Jugador 1": 0, "Jugador 2": 0}
+    for linea in lineas:
+        if " ha realizado " in linea:
+            nombre, resto = linea.split(" ha realizado ", 1)
+            hechos[nombre] += int(resto.split()[0])
+    final = lineas[-1]
+    resultado = EMPATE if final == "Empate" else int(final.rsplit(" ", 1)[1])
+    return resultado, turnos, hechos["Jugador 1"], hechos["Jugador 2"]
+
+
+def _exigir(condicion: bool, mensaje: str) -> None:
+    # Comprobación explícita: a diferencia de assert, no desaparece con python -O
+    if not condicion:
+        raise AssertionError(mensaje)
+
+
+def comprobar_paridad(n: int = 20_000, semilla: int = 7) -> None:
+    """
+    Compara el bucle (duelo), la forma cerrada y el núcleo NumPy con el `combate`
+    original en los casos límite y en n duelos aleatorios. Lanza AssertionError
+    con el primer caso distinto.
+    """
+    rng = random.Random(semilla)
+    casos = [(CLASES[c1]("A", *a1), CLASES[c2]("B", *a2), tope) for c1, a1, c2, a2, tope in casos_limite()]
+    for _ in range(n):
+        clase_1, clase_2 = rng.choice(list(CLASES)), rng.choice(list(CLASES))
+        casos.append((personaje_aleatorio(rng, clase_1), personaje_aleatorio(rng, clase_2), rng.choice((5, 50, MAX_TURNOS))))
+
+    esperados = [resultado_combate(jugador_1, jugador_2, tope) for jugador_1, jugador_2, tope in casos]
+    for (jugador_1, jugador_2, tope), esperado in zip(casos, esperados):
+        for nombre, funcion in (("duelo", duelo), ("duelo_cerrado", duelo_cerrado)):
+            obtenido = funcion(jugador_1, jugador_2, tope)
+            _exigir(obtenido == esperado, f"{nombre} {vars(jugador_1)} {vars(jugador_2)} tope={tope}: "
+                                          f"{obtenido} != combate {esperado}")
+
+    # Núcleo: una llamada por cada tope de turnos
+    for tope in sorted({t for _, _, t in casos}):
+        grupo = [(j1, j2, e) for (j1, j2, t), e in zip(casos, esperados) if t == tope]
+        vectorial = np.stack(resolver([j1.vida for j1, _, _ in grupo], [j1.daño(j2) for j1, j2, _ in grupo],
+                                      [j2.vida for _, j2, _ in grupo], [j2.daño(j1) for j1, j2, _ in grupo],
+                                      tope), axis=1)
+        for (jugador_1, jugador_2, esperado), fila in zip(grupo, vectorial.tolist()):
+            _exigir(tuple(fila) == esperado, f"resolver {vars(jugador_1)} {vars(jugador_2)} tope={tope}: "
+                                             f"{tuple(fila)} != combate {esperado}")
+    print(f"Paridad con `combate` comprobada en {len(casos):,} duelos (bucle, forma cerrada y NumPy).")
+
+
+def atributos_aleatorios(generador: np.random.Generator, n: int) -> Dict[str, np.ndarray]:
+    return {nombre: generador.integers(minimo, maximo + 1, n) for nombre, (minimo, maximo) in RANGOS.items()}
+
+
+def benchmark(n: int, semilla: int = 2025) -> None:
+    generador = np.random.default_rng(semilla)
+    atributos_1, atributos_2 = atributos_aleatorios(generador, n), atributos_aleatorios(generador, n)
+    orden = ("fuerza", "inteligencia", "defensa", "vida", "arma")
+    muestra = min(n, 100_000)  # los métodos en Python se miden en una muestra y se extrapolan
+    parejas = [(CLASES["Guerrero"]("G", *(int(atributos_1[a][i]) for a in orden)),
+                CLASES["Mago"]("M", *(int(atributos_2[a][i]) for a in orden))) for i in range(muestra)]
+
+    tiempos = {}
+    for nombre, funcion in (("bucle turno a turno", duelo), ("forma cerrada", duelo_cerrado)):
+        inicio = time.perf_counter()
+        for jugador_1, jugador_2 in parejas:
+            funcion(jugador_1, jugador_2)
+        tiempos[nombre] = (time.perf_counter() - inicio) * n / muestra
+    inicio = time.perf_counter()
+    resultado = duelos_en_rejilla("Guerrero", atributos_1, "Mago", atributos_2)[0]
+    tiempos["NumPy (vectorizado)"] = time.perf_counter() - inicio
+
+    print(f"{n:,} duelos Guerrero contra Mago")
+    base = tiempos["bucle turno a turno"]
+    for nombre, segundos in tiempos.items():
+        print(f"  {nombre:<22}{segundos:>9.3f} s  x{base / segundos:,.1f}")
+    print(f"  victorias Guerrero: {np.count_nonzero(resultado == 1) / n:.2%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paridad y velocidad del combate en forma cerrada y con NumPy.")
+    parser.add_argument("duelos", nargs="?", type=int, default=1_000_000)
+    parser.add_argument("--sin-paridad", action="store_true", help="omite la comprobación de paridad")
+    argumentos = parser.parse_args()
+    if not argumentos.sin_paridad:
+        comprobar_paridad()
+    benchmark(argumentos.duelos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# ==========================================
+# SIMULADOR DE COMBATES POR LOTES (PRUEBAS DE EQUILIBRIO)
+# ==========================================
+# `combate` narra cada turno con print(); para millones de combates eso es
+# lo que más tarda. Aquí la mecánica va sin mensajes:
+# - duelo(): el mismo combate que `combate`, pero silencioso y con tope de turnos
+# - simular_lote(): N enfrentamientos con personajes aleatorios, repartidos en
+#   bloques entre varios procesos; cada bloque devuelve solo sus totales
+# Con la misma semilla el resultado es idéntico, haya uno o muchos procesos:
+# cada bloque tiene su propia semilla derivada de (semilla, número de bloque).
+
+import argparse
+import importlib.util
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+# El script de la tarea tiene espacios y un punto en el nombre: se carga por ruta
+_spec = importlib.util.spec_from_file_location(
+    "tarea_semana_02", os.path.join(os.path.dirname(os.path.abspath(__file__)), "2.1 Tarea Semana 02.py"))
+tarea = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tarea)
+Personaje, Guerrero, Mago = tarea.Personaje, tarea.Guerrero, tarea.Mago
+
+MAX_TURNOS = 1000     # con daño 0 o negativo un combate podría no terminar nunca
+TAM_BLOQUE = 10_000   # combates por tarea del pool (fijo: así la semilla de cada bloque no depende de los procesos)
+
+# Rangos de atributos de los personajes aleatorios (ambos extremos incluidos)
+RANGOS = {"fuerza": (1, 20), "inteligencia": (1, 20), "defensa": (0, 10), "vida": (50, 150), "arma": (1, 10)}
+CLASES = {"Guerrero": Guerrero, "Mago": Mago}
+
+# Resultado de un duelo: 1 o 2 (ganador), EMPATE (mueren los dos en el mismo turno)
+# o SIN_RESULTADO (se alcanzó el tope de turnos con ambos vivos)
+EMPATE = 0
+SIN_RESULTADO = -1
+
+
+def personaje_aleatorio(rng: random.Random, clase: str, nombre: str = "") -> Personaje:
+    stats = [rng.randint(*RANGOS[a]) for a in ("fuerza", "inteligencia", "defensa", "vida", "arma")]
+    return CLASES[clase](nombre or clase, *stats)
+
+
+def duelo(jugador_1: Personaje, jugador_2: Personaje, max_turnos: int = MAX_TURNOS) -> Tuple[int, int, int, int]:
+    """
+    Simula `combate` sin imprimir ni modificar a los personajes.
+    Retorna (resultado, turnos, daño hecho por 1, daño hecho por 2).
+    Igual que en `combate`, en cada turno ataca 1 y después 2 (aunque 1 ya lo haya matado).
+    El daño solo depende de atributos que no cambian en combate: se calcula una vez.
+    """
+    daño_1 = jugador_1.daño(jugador_2)
+    daño_2 = jugador_2.daño(jugador_1)
+    vida_1, vida_2 = jugador_1.vida, jugador_2.vida
+    turnos = 0
+    while vida_1 > 0 and vida_2 > 0 and turnos < max_turnos:
+        vida_2 -= daño_1
+        vida_1 -= daño_2
+        turnos += 1
+    if vida_1 > 0 and vida_2 > 0:
+        resultado = SIN_RESULTADO
+    elif vida_1 > 0:
+        resultado = 1
+    elif vida_2 > 0:
+        resultado = 2
+    else:
+        resultado = EMPATE
+    return resultado, turnos, daño_1 * turnos, daño_2 * turnos
+
+
+@dataclass
+class Estadisticas:
+    """
+    Totales de un lote de duelos (lado 1 contra lado 2). Se pueden sumar entre bloques.
+    """
+    combates: int = 0
+    resultados: Counter = field(default_factory=Counter)   # {resultado: combates}
+    turnos: Counter = field(default_factory=Counter)       # {turnos: combates decididos}
+    daño_1: int = 0
+    daño_2: int = 0
+
+    def agregar(self, resultado: int, turnos: int, daño_1: int, daño_2: int) -> None:
+        self.combates += 1
+        self.resultados[resultado] += 1
+        if resultado != SIN_RESULTADO:
+            self.turnos[turnos] += 1
+        self.daño_1 += daño_1
+        self.daño_2 += daño_2
+
+    def combinar(self, otra: "Estadisticas") -> None:
+        self.combates += otra.combates
+        self.resultados.update(otra.resultados)
+        self.turnos.update(otra.turnos)
+        self.daño_1 += otra.daño_1
+        self.daño_2 += otra.daño_2
+
+    def percentil_turnos(self, p: float) -> Optional[int]:
+        # Percentil de los turnos hasta el final, sobre los combates decididos
+        total = sum(self.turnos.values())
+        if not total:
+            return None
+        acumulado = 0
+        for turnos in sorted(self.turnos):
+            acumulado += self.turnos[turnos]
+            if acumulado >= p * total:
+                return turnos
+        return None
+
+    def resumen(self, nombre_1: str, nombre_2: str) -> Dict[str, float]:
+        n = self.combates or 1
+        decididos = sum(self.turnos.values()) or 1
+        return {
+            f"victorias {nombre_1} %": 100 * self.resultados[1] / n,
+            f"victorias {nombre_2} %": 100 * self.resultados[2] / n,
+            "empates %": 100 * self.resultados[EMPATE] / n,
+            "sin resultado (tope de turnos) %": 100 * self.resultados[SIN_RESULTADO] / n,
+            "turnos medios (decididos)": sum(t * c for t, c in self.turnos.items()) / decididos,
+            "turnos mediana": self.percentil_turnos(0.5) or 0,
+            "turnos p95": self.percentil_turnos(0.95) or 0,
+            f"daño medio por combate de {nombre_1}": self.daño_1 / n,
+            f"daño medio por combate de {nombre_2}": self.daño_2 / n,
+        }
+
+
+def _simular_bloque(semilla: int, bloque: int, cantidad: int, clase_1: str, clase_2: str,
+                    max_turnos: int) -> Estadisticas:
+    rng = random.Random(f"{semilla}-{bloque}")
+    estadisticas = Estadisticas()
+    for _ in range(cantidad):
+        jugador_1 = personaje_aleatorio(rng, clase_1)
+        jugador_2 = personaje_aleatorio(rng, clase_2)
+        estadisticas.agregar(*duelo(jugador_1, jugador_2, max_turnos))
+    return estadisticas
+
+
+def simular_lote(n: int, semilla: int = 0, clase_1: str = "Guerrero", clase_2: str = "Mago",
+                 max_turnos: int = MAX_TURNOS, procesos: Optional[int] = None) -> Estadisticas:
+    """
+    Simula n duelos clase_1 contra clase_2 con personajes aleatorios y retorna los totales.
+    procesos=1 lo hace todo en este proceso (útil para depurar); None usa todos los núcleos.
+    """
+    bloques = [(semilla, i, min(TAM_BLOQUE, n - inicio), clase_1, clase_2, max_turnos)
+               for i, inicio in enumerate(range(0, n, TAM_BLOQUE))]
+    total = Estadisticas()
+    if procesos == 1 or len(bloques) == 1:
+        for bloque in bloques:
+            total.combinar(_simular_bloque(*bloque))
+        return total
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        # map conserva el orden de los bloques: la suma es la misma en cada ejecución
+        for parcial in pool.map(_simular_bloque, *zip(*bloques)):
+            total.combinar(parcial)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simula muchos combates y resume el equilibrio entre clases.")
+    parser.add_argument("combates", nargs="?", type=int, default=1_000_000)
+    parser.add_argument("--semilla", type=int, default=2025)
+    parser.add_argument("--clases", nargs=2, choices=CLASES, default=["Guerrero", "Mago"])
+    parser.add_argument("--max-turnos", type=int, default=MAX_TURNOS)
+    parser.add_argument("--procesos", type=int, default=None)
+    argumentos = parser.parse_args()
+
+    inicio = time.perf_counter()
+    estadisticas = simular_lote(argumentos.combates, argumentos.semilla, *argumentos.clases,
+                                argumentos.max_turnos, argumentos.procesos)
+    segundos = time.perf_counter() - inicio
+    print(f"{estadisticas.combates:,} combates {argumentos.clases[0]} contra {argumentos.clases[1]} "
+          f"(semilla {argumentos.semilla}) en {segundos:.2f} s ({estadisticas.combates / segundos:,.0f} por segundo)")
+    for nombre, valor in estadisticas.resumen(*argumentos.clases).items():
+        print(f"  {nombre:<38}{valor:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
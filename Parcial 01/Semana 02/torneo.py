@@ -0,0 +1,254 @@
+# ==========================================
+# TORNEOS ENTRE PERSONAJES (TODOS CONTRA TODOS Y SISTEMA SUIZO) CON ELO
+# ==========================================
+# Una plantilla de miles de Guerreros y Magos creados con subir_nivel tiene
+# muchos personajes con los mismos atributos. Como el resultado de un duelo
+# solo depende de esos atributos:
+# - cada enfrentamiento (atributos de 1, atributos de 2) se calcula una sola vez
+#   y se guarda en CacheEnfrentamientos; (b, a) se obtiene de (a, b) en espejo
+# - los enfrentamientos nuevos se resuelven juntos con el núcleo NumPy de
+#   combate_rapido, repartidos en bloques entre procesos si son muchos
+# - el Elo se actualiza partida a partida, en el orden del torneo
+# Así el coste del cálculo depende de los enfrentamientos distintos, no del
+# número de emparejamientos.
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from combate_rapido import duelos_en_rejilla
+from simulador_combate import CLASES, EMPATE, MAX_TURNOS, SIN_RESULTADO, TAM_BLOQUE, Personaje, duelo
+
+# Atributos iniciales por clase: fuerza, inteligencia, defensa, vida, armas posibles
+# (las espadas son las de Guerrero.cambiar_arma)
+BASES = {"Guerrero": (10, 2, 4, 100, (8, 10)), "Mago": (2, 10, 3, 80, (2, 3, 4))}
+# Mejoras posibles al subir de nivel: (fuerza, inteligencia, defensa)
+MEJORAS = ((2, 0, 1), (0, 2, 1), (0, 0, 3), (1, 1, 1))
+
+# Puntos del jugador 1 según el resultado (sin resultado cuenta como tablas)
+PUNTUACION = {1: 1.0, 2: 0.0, EMPATE: 0.5, SIN_RESULTADO: 0.5}
+ESPEJO = {1: 2, 2: 1}
+
+Clave = Tuple[str, int, int, int, int, int]
+Resultado = Tuple[int, int, int, int]
+
+
+def generar_plantilla(n: int, semilla: int = 0, max_nivel: int = 6) -> List[Personaje]:
+    rng = random.Random(semilla)
+    plantilla = []
+    for i in range(n):
+        clase = rng.choice(list(BASES))
+        fuerza, inteligencia, defensa, vida, armas = BASES[clase]
+        personaje = CLASES[clase](f"{clase} {i + 1}", fuerza, inteligencia, defensa, vida, rng.choice(armas))
+        for _ in range(rng.randint(0, max_nivel)):
+            personaje.subir_nivel(*rng.choice(MEJORAS))
+        plantilla.append(personaje)
+    return plantilla
+
+
+def clave(personaje: Personaje) -> Clave:
+    # Todo lo que influye en un duelo: la clase (fórmula de daño) y los atributos
+    arma = personaje.espada if hasattr(personaje, "espada") else personaje.libro
+    return (type(personaje).__name__, personaje.fuerza, personaje.inteligencia,
+            personaje.defensa, personaje.vida, arma)
+
+
+def _resolver_bloque(pares: List[Tuple[Clave, Clave]], max_turnos: int) -> List[Resultado]:
+    # Agrupa por pareja de clases y resuelve cada grupo con una llamada al núcleo
+    resultados: List[Optional[Resultado]] = [None] * len(pares)
+    grupos: Dict[Tuple[str, str], List[int]] = {}
+    for i, (clave_1, clave_2) in enumerate(pares):
+        grupos.setdefault((clave_1[0], clave_2[0]), []).append(i)
+    orden = ("fuerza", "inteligencia", "defensa", "vida", "arma")
+    for (clase_1, clase_2), indices in grupos.items():
+        atributos_1 = {a: [pares[i][0][k + 1] for i in indices] for k, a in enumerate(orden)}
+        atributos_2 = {a: [pares[i][1][k + 1] for i in indices] for k, a in enumerate(orden)}
+        columnas = duelos_en_rejilla(clase_1, atributos_1, clase_2, atributos_2, max_turnos)
+        for i, fila in zip(indices, zip(*(c.tolist() for c in columnas))):
+            resultados[i] = fila
+    return resultados
+
+
+class CacheEnfrentamientos:
+    """
+    Resultados de duelos indexados por las claves de los dos personajes.
+    Solo se guarda el par ordenado (menor, mayor): el otro sentido es su espejo,
+    porque en cada turno atacan los dos y el orden no cambia el resultado.
+    """
+
+    def __init__(self, max_turnos: int = MAX_TURNOS, procesos: Optional[int] = None):
+        # procesos=None: uno por núcleo; con 1 todo se resuelve en este proceso
+        self.max_turnos = max_turnos
+        self.procesos = procesos or os.cpu_count() or 1
+        self.resultados: Dict[Tuple[Clave, Clave], Resultado] = {}
+        self.consultas = 0
+        self.segundos = 0.0
+
+    def precalcular(self, pares: Iterable[Tuple[Clave, Clave]]) -> int:
+        """
+        Resuelve de una vez los pares que aún no están en caché. Retorna cuántos eran nuevos.
+        """
+        inicio = time.perf_counter()
+        # Par a par: el coste depende de los pares pedidos, no del tamaño de la caché
+        pendientes = [par for par in {(a, b) if a <= b else (b, a) for a, b in pares} if par not in self.resultados]
+        bloques = [pendientes[i:i + TAM_BLOQUE] for i in range(0, len(pendientes), TAM_BLOQUE)]
+        if self.procesos == 1 or len(bloques) <= 1:
+            lotes = [_resolver_bloque(bloque, self.max_turnos) for bloque in bloques]
+        else:
+            with ProcessPoolExecutor(max_workers=self.procesos) as pool:
+                lotes = list(pool.map(_resolver_bloque, bloques, [self.max_turnos] * len(bloques)))
+        for bloque, lote in zip(bloques, lotes):
+            self.resultados.update(zip(bloque, lote))
+        self.segundos += time.perf_counter() - inicio
+        return len(pendientes)
+
+    def resultado(self, clave_1: Clave, clave_2: Clave) -> Resultado:
+        # El par tiene que estar precalculado
+        self.consultas += 1
+        if clave_1 <= clave_2:
+            return self.resultados[(clave_1, clave_2)]
+        resultado, turnos, daño_2, daño_1 = self.resultados[(clave_2, clave_1)]
+        return ESPEJO.get(resultado, resultado), turnos, daño_1, daño_2
+
+
+class Elo:
+    """
+    Puntuación Elo de cada competidor (por índice), actualizada tras cada partida.
+    """
+
+    def __init__(self, n: int, k: float = 32, inicial: float = 1500):
+        self.k = k
+        self.puntuacion = [inicial] * n
+
+    def actualizar(self, i: int, j: int, puntos_i: float) -> None:
+        esperado_i = 1 / (1 + 10 ** ((self.puntuacion[j] - self.puntuacion[i]) / 400))
+        cambio = self.k * (puntos_i - esperado_i)
+        self.puntuacion[i] += cambio
+        self.puntuacion[j] -= cambio
+
+
+class Torneo:
+
+    def __init__(self, plantilla: List[Personaje], cache: Optional[CacheEnfrentamientos] = None, k: float = 32):
+        self.plantilla = plantilla
+        self.claves = [clave(p) for p in plantilla]
+        self.cache = cache if cache is not None else CacheEnfrentamientos()
+        self.elo = Elo(len(plantilla), k)
+        self.puntos = [0.0] * len(plantilla)
+        self.rivales = [set() for _ in plantilla]
+        self.descansos = set()  # quienes ya descansaron en alguna ronda suiza
+        self.partidas = 0
+
+    def jugar(self, pares: Iterable[Tuple[int, int]], recordar_rivales: bool = False) -> None:
+        # Los enfrentamientos de los pares ya deben estar en la caché
+        claves, puntos, elo = self.claves, self.puntos, self.elo
+        for i, j in pares:
+            resultado = self.cache.resultado(claves[i], claves[j])[0]
+            puntos_i = PUNTUACION[resultado]
+            puntos[i] += puntos_i
+            puntos[j] += 1 - puntos_i
+            elo.actualizar(i, j, puntos_i)
+            if recordar_rivales:
+                self.rivales[i].add(j)
+                self.rivales[j].add(i)
+            self.partidas += 1
+
+    def todos_contra_todos(self) -> None:
+        # Basta con precalcular los pares de claves distintas, no los n*(n-1)/2 emparejamientos
+        self.cache.precalcular(combinations_with_replacement(sorted(set(self.claves)), 2))
+        self.jugar(combinations(range(len(self.plantilla)), 2))
+
+    def ronda_suiza(self) -> None:
+        # Empareja por puntos (y Elo) a vecinos de la clasificación que aún no se hayan enfrentado
+        orden = sorted(range(len(self.plantilla)), key=lambda i: (-self.puntos[i], -self.elo.puntuacion[i], i))
+        if len(orden) % 2:
+            # Descansa (cuenta como victoria) el peor clasificado que aún no haya descansado
+            descansa = next((i for i in reversed(orden) if i not in self.descansos), orden[-1])
+            orden.remove(descansa)
+            self.descansos.add(descansa)
+            self.puntos[descansa] += 1
+        # siguiente[p]: primera posición aún sin emparejar desde p (con saltos comprimidos,
+        # así cada ronda cuesta ~O(n) en lugar de O(n²))
+        siguiente = list(range(len(orden) + 1))
+
+        def libre(p: int) -> int:
+            while siguiente[p] != p:
+                siguiente[p] = siguiente[siguiente[p]]
+                p = siguiente[p]
+            return p
+
+        pares = []
+        p = libre(0)
+        while p < len(orden):
+            i = orden[p]
+            siguiente[p] = p + 1
+            primero = q = libre(p + 1)
+            while q < len(orden) and orden[q] in self.rivales[i]:
+                q = libre(q + 1)
+            if q == len(orden):
+                q = primero  # ya se enfrentó a todos los que quedan: el más cercano
+            pares.append((i, orden[q]))
+            siguiente[q] = q + 1
+            p = libre(p + 1)
+        self.cache.precalcular((self.claves[i], self.claves[j]) for i, j in pares)
+        self.jugar(pares, recordar_rivales=True)
+
+    def suizo(self, rondas: int) -> None:
+        for _ in range(rondas):
+            self.ronda_suiza()
+
+    def clasificacion(self, cantidad: int = 10) -> List[Tuple[str, float, float, Clave]]:
+        orden = sorted(range(len(self.plantilla)), key=lambda i: (-self.puntos[i], -self.elo.puntuacion[i], i))
+        return [(self.plantilla[i].nombre, self.puntos[i], self.elo.puntuacion[i], self.claves[i])
+                for i in orden[:cantidad]]
+
+
+# ---------- Uso desde la línea de comandos ----------
+def comprobar_cache(plantilla: List[Personaje], cache: CacheEnfrentamientos, muestras: int = 5000) -> None:
+    # Resultados de la caché (en ambos sentidos) contra el duelo turno a turno
+    rng = random.Random(1)
+    for _ in range(muestras):
+        jugador_1, jugador_2 = rng.choice(plantilla), rng.choice(plantilla)
+        clave_1, clave_2 = clave(jugador_1), clave(jugador_2)
+        cache.precalcular([(clave_1, clave_2)])
+        obtenido, esperado = cache.resultado(clave_1, clave_2), duelo(jugador_1, jugador_2, cache.max_turnos)
+        if obtenido != esperado:  # explícito: un assert desaparecería con python -O
+            raise AssertionError(f"caché {clave_1} contra {clave_2}: {obtenido} != duelo {esperado}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Torneo entre personajes con caché de enfrentamientos y Elo.")
+    parser.add_argument("personajes", nargs="?", type=int, default=2000)
+    parser.add_argument("--formato", choices=("todos", "suizo"), default="todos")
+    parser.add_argument("--rondas", type=int, default=11, help="rondas del sistema suizo")
+    parser.add_argument("--semilla", type=int, default=2025)
+    parser.add_argument("--procesos", type=int, default=None, help="por defecto, uno por núcleo")
+    argumentos = parser.parse_args()
+
+    plantilla = generar_plantilla(argumentos.personajes, argumentos.semilla)
+    torneo = Torneo(plantilla, CacheEnfrentamientos(procesos=argumentos.procesos))
+    inicio = time.perf_counter()
+    if argumentos.formato == "todos":
+        torneo.todos_contra_todos()
+    else:
+        torneo.suizo(argumentos.rondas)
+    segundos = time.perf_counter() - inicio
+
+    cache = torneo.cache
+    print(f"{len(plantilla):,} personajes ({len(set(torneo.claves)):,} con atributos distintos), "
+          f"{torneo.partidas:,} partidas en {segundos:.2f} s")
+    print(f"  enfrentamientos calculados: {len(cache.resultados):,} en {cache.segundos:.2f} s "
+          f"({torneo.partidas / max(len(cache.resultados), 1):,.1f} partidas por cálculo)")
+    print(f"\n  {'#':>3}  {'Personaje':<16}{'Puntos':>8}{'Elo':>8}  Atributos (F, I, D, V, arma)")
+    for posicion, (nombre, puntos, elo, atributos) in enumerate(torneo.clasificacion(), 1):
+        print(f"  {posicion:>3}  {nombre:<16}{puntos:>8.1f}{elo:>8.0f}  {atributos[1:]}")
+
+    comprobar_cache(plantilla, cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,29 @@
 # Programa para calcular el promedio semanal de temperatura usando Programación Orientada a Objetos (POO)
 
+from clima_en_linea import EstadisticasEnLinea
+
 # Clase que representa la información climática semanal
 class ClimaSemanal:
     def __init__(self):
-        # Atributo privado que almacena las temperaturas (encapsulamiento)
-        self.__temperaturas = []
+        # Atributo privado con las estadísticas acumuladas (encapsulamiento);
+        # no guarda la lista: sirve igual para 7 lecturas que para un flujo continuo
+        self.__estadisticas = EstadisticasEnLinea()
 
     # Metodo para ingresar las temperaturas del usuario
     def ingresar_datos(self):
         for i in range(7):
             temp = float(input(f"Ingrese la temperatura del día {i + 1}: "))
-            self.__temperaturas.append(temp)
+            self.agregar_temperatura(temp)
+
+    # Metodo para agregar una temperatura (desde input() o desde un sensor)
+    def agregar_temperatura(self, temp):
+        self.__estadisticas.agregar(temp)
 
     # Metodo para calcular el promedio de temperaturas
     def calcular_promedio(self):
-        if len(self.__temperaturas) == 0:
+        if self.__estadisticas.cantidad == 0:
             return 0
-        return sum(self.__temperaturas) / len(self.__temperaturas)
+        return self.__estadisticas.media
 
     # Metodo para mostrar el promedio calculado
     def mostrar_promedio(self):
@@ -31,4 +38,5 @@ def main():
     clima.mostrar_promedio() # Mostrar promedio
 
 # Llamado al programa principal
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
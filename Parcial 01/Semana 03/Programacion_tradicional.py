@@ -20,4 +20,5 @@ def main():
     print(f"El promedio semanal de temperatura es: {promedio:.2f}°C")  # Resultado
 
 # Llamado al programa principal
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# ==========================================
+# BENCHMARK: ANÁLISIS DE ESTACIONES CON NumPy FRENTE A LISTAS
+# ==========================================
+# Compara clima_estaciones (arrays, operaciones vectorizadas) con el enfoque de
+# Programacion_tradicional.py: una lista por estación y calcular_promedio sobre
+# cada tramo. Las listas se miden en una muestra de estaciones y se extrapolan;
+# en esa muestra también se comprueba que los resultados coinciden.
+#
+# Uso: python benchmark_estaciones.py [--estaciones 2000] [--anios 30]
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from Programacion_tradicional import calcular_promedio
+from clima_estaciones import SeriesEstaciones, generar_datos
+
+
+def cronometrar(funcion, *argumentos):
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    return time.perf_counter() - inicio, resultado
+
+
+# ---------- Versión con listas (una estación a la vez) ----------
+def semanales_listas(series):
+    return [[calcular_promedio(serie[i:i + 7]) for i in range(0, len(serie) - 6, 7)] for serie in series]
+
+
+def moviles_listas(series, ventana):
+    return [[calcular_promedio(serie[i:i + ventana]) for i in range(len(serie) - ventana + 1)] for serie in series]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NumPy frente a listas en el análisis de estaciones.")
+    parser.add_argument("--estaciones", type=int, default=2000)
+    parser.add_argument("--anios", type=int, default=30)
+    parser.add_argument("--muestra", type=int, default=20, help="estaciones medidas con listas")
+    argumentos = parser.parse_args()
+
+    series = generar_datos(argumentos.estaciones, argumentos.anios)
+    print(f"{series.estaciones:,} estaciones x {series.dias:,} días "
+          f"({series.temperaturas.size:,} lecturas, {series.temperaturas.nbytes / 2**20:.0f} MB en float32)")
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "estaciones")
+        segundos_guardar, _ = cronometrar(series.guardar, ruta)
+        segundos_abrir, mapeadas = cronometrar(SeriesEstaciones.cargar, ruta)
+        print(f"  guardar .npy: {segundos_guardar:.2f} s, abrir con memmap: {segundos_abrir * 1000:.1f} ms\n")
+
+        tiempos = {
+            "semanales": cronometrar(mapeadas.promedios_semanales),
+            "mensuales": cronometrar(mapeadas.promedios_mensuales),
+            "móviles 30 días": cronometrar(mapeadas.promedios_moviles, 30),
+            "anomalías": cronometrar(mapeadas.anomalias),
+            "percentiles 5/50/95": cronometrar(mapeadas.percentiles),
+        }
+        del mapeadas  # cierra el memmap antes de borrar la carpeta
+
+    muestra = min(argumentos.muestra, series.estaciones)
+    listas = series.temperaturas[:muestra].astype(np.float64).tolist()
+    escala = series.estaciones / muestra
+    segundos_semanales, semanales = cronometrar(semanales_listas, listas)
+    segundos_moviles, moviles = cronometrar(moviles_listas, listas, 30)
+    assert np.allclose(semanales, tiempos["semanales"][1][:muestra])
+    assert np.allclose(moviles, tiempos["móviles 30 días"][1][:muestra])
+    listas_por_calculo = {"semanales": segundos_semanales * escala, "móviles 30 días": segundos_moviles * escala}
+
+    print(f"  {'Cálculo':<22}{'NumPy s':>10}{'Listas s':>12}{'Aceleración':>13}")
+    for nombre, (segundos, _) in tiempos.items():
+        if nombre in listas_por_calculo:
+            lista = listas_por_calculo[nombre]
+            print(f"  {nombre:<22}{segundos:>10.3f}{lista:>12.1f}{lista / segundos:>12,.0f}x")
+        else:
+            print(f"  {nombre:<22}{segundos:>10.3f}{'-':>12}{'-':>13}")
+    print(f"\n  (listas: {muestra} estaciones medidas y extrapoladas; resultados comprobados en esa muestra)")
+
+
+if __name__ == "__main__":
+    main()
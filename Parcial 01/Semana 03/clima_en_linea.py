@@ -0,0 +1,197 @@
+# Estadísticas de temperatura en flujo continuo (datos de estaciones)
+#
+# Cada lectura se procesa al llegar y se descarta: la memoria no depende de
+# cuántas lecturas tenga el flujo.
+# - EstadisticasEnLinea: media, varianza (algoritmo de Welford), mínimo y máximo en O(1)
+# - VentanaMovil: promedio de las últimas N lecturas con un búfer circular de tamaño fijo
+# - leer_bloques: convierte un archivo (o stdin) en bloques de floats, de golpe por bloque
+#
+# Uso: python clima_en_linea.py [archivo ...] [--ventanas 7 30]
+#      (sin archivos, o con "-", lee de la entrada estándar)
+
+import argparse
+import math
+import sys
+from array import array
+
+TAM_BLOQUE = 1 << 16  # caracteres leídos por bloque
+# Separadores admitidos entre lecturas, además de espacios y saltos de línea
+SEPARADORES = str.maketrans(",;", "  ")
+
+
+# Clase con las estadísticas acumuladas de todas las lecturas
+class EstadisticasEnLinea:
+    def __init__(self):
+        self.cantidad = 0
+        self.media = 0.0
+        self.__m2 = 0.0  # suma de cuadrados de las diferencias con la media
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    # Metodo para agregar una lectura (Welford: estable aunque haya millones)
+    def agregar(self, valor):
+        self.cantidad += 1
+        delta = valor - self.media
+        self.media += delta / self.cantidad
+        self.__m2 += delta * (valor - self.media)
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    # Metodo para agregar un bloque de lecturas
+    def agregar_varios(self, valores):
+        for valor in valores:
+            self.agregar(valor)
+
+    # Metodo para sumar las estadísticas de otra estación o de otro archivo
+    def combinar(self, otra):
+        if otra.cantidad == 0:
+            return
+        total = self.cantidad + otra.cantidad
+        delta = otra.media - self.media
+        self.__m2 += otra.__m2 + delta * delta * self.cantidad * otra.cantidad / total
+        self.media += delta * otra.cantidad / total
+        self.cantidad = total
+        self.minimo = min(self.minimo, otra.minimo)
+        self.maximo = max(self.maximo, otra.maximo)
+
+    # Varianza muestral (n - 1); 0 con menos de dos lecturas
+    def varianza(self):
+        if self.cantidad < 2:
+            return 0.0
+        return self.__m2 / (self.cantidad - 1)
+
+    def desviacion(self):
+        return math.sqrt(self.varianza())
+
+
+# Clase con el promedio de las últimas `tamano` lecturas
+class VentanaMovil:
+    def __init__(self, tamano):
+        if tamano < 1:
+            raise ValueError("El tamaño de la ventana debe ser al menos 1")
+        self.tamano = tamano
+        self.__valores = array("d", [0.0]) * tamano  # búfer circular
+        self.__posicion = 0
+        self.__llenos = 0
+        self.__suma = 0.0
+
+    # Metodo para agregar una lectura; la más antigua sale de la ventana
+    def agregar(self, valor):
+        self.__suma += valor - self.__valores[self.__posicion]
+        self.__valores[self.__posicion] = valor
+        self.__posicion += 1
+        if self.__posicion == self.tamano:
+            self.__posicion = 0
+            # Al dar la vuelta se recalcula la suma para que no acumule error de redondeo
+            self.__suma = math.fsum(self.__valores)
+        if self.__llenos < self.tamano:
+            self.__llenos += 1
+
+    def llena(self):
+        return self.__llenos == self.tamano
+
+    # Promedio de las lecturas en la ventana (de las que haya, si aún no está llena)
+    def promedio(self):
+        if self.__llenos == 0:
+            return 0.0
+        return self.__suma / self.__llenos
+
+
+# Clase que reúne las estadísticas globales y varias ventanas móviles
+class MonitorClima:
+    def __init__(self, ventanas=(7, 30)):
+        self.estadisticas = EstadisticasEnLinea()
+        self.ventanas = {tamano: VentanaMovil(tamano) for tamano in ventanas}
+        self.descartados = 0  # textos que no eran números finitos (incluye nan e inf)
+
+    def agregar(self, valor):
+        self.estadisticas.agregar(valor)
+        for ventana in self.ventanas.values():
+            ventana.agregar(valor)
+
+    def agregar_bloque(self, valores):
+        # Cada ventana recorre el bloque completo: menos saltos entre objetos por lectura
+        self.estadisticas.agregar_varios(valores)
+        for ventana in self.ventanas.values():
+            for valor in valores:
+                ventana.agregar(valor)
+
+    def mostrar(self):
+        e = self.estadisticas
+        if e.cantidad == 0:
+            print("No se recibieron temperaturas")
+            return
+        print(f"Lecturas: {e.cantidad}" + (f" (descartados {self.descartados} textos no numéricos o no finitos)"
+                                            if self.descartados else ""))
+        print(f"Promedio: {e.media:.2f}°C  Desviación: {e.desviacion():.2f}°C")
+        print(f"Mínimo: {e.minimo:.2f}°C  Máximo: {e.maximo:.2f}°C")
+        for tamano, ventana in self.ventanas.items():
+            aviso = "" if ventana.llena() else " (ventana incompleta)"
+            print(f"Promedio de las últimas {tamano} lecturas: {ventana.promedio():.2f}°C{aviso}")
+
+
+# Función que lee un archivo de texto por bloques y devuelve arrays de floats
+def leer_bloques(archivo, tam_bloque=TAM_BLOQUE, descartados=None):
+    resto = ""
+    while True:
+        texto = archivo.read(tam_bloque)
+        if not texto:
+            break
+        texto = (resto + texto).translate(SEPARADORES)
+        partes = texto.split()
+        # Si el bloque corta un número por la mitad, esa parte espera al bloque siguiente
+        resto = partes.pop() if partes and not texto[-1].isspace() else ""
+        yield convertir(partes, descartados)
+    if resto:
+        yield convertir([resto], descartados)
+
+
+# Función que convierte textos a floats: de golpe, o uno a uno si hay textos inválidos.
+# float() acepta "nan" e "inf", pero una sola lectura así estropearía todos los promedios
+def convertir(partes, descartados=None):
+    try:
+        valores = array("d", map(float, partes))
+        if math.isfinite(sum(valores)):  # una sola suma: cualquier nan o inf la deja no finita
+            return valores
+    except ValueError:
+        pass
+    valores = array("d")
+    for parte in partes:
+        try:
+            valor = float(parte)
+        except ValueError:
+            valor = math.nan
+        if math.isfinite(valor):
+            valores.append(valor)
+        elif descartados is not None:
+            descartados.append(parte)
+    return valores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estadísticas de temperaturas leídas en flujo continuo.")
+    parser.add_argument("archivos", nargs="*", default=["-"])
+    parser.add_argument("--ventanas", nargs="+", type=int, default=[7, 30])
+    argumentos = parser.parse_args()
+
+    print("Estadísticas de temperatura en flujo continuo")
+    monitor = MonitorClima(argumentos.ventanas)
+    for nombre in argumentos.archivos:
+        archivo = sys.stdin if nombre == "-" else open(nombre, encoding="utf-8")
+        descartados = []
+        try:
+            for bloque in leer_bloques(archivo, descartados=descartados):
+                monitor.agregar_bloque(bloque)
+                monitor.descartados += len(descartados)
+                descartados.clear()
+        finally:
+            if archivo is not sys.stdin:
+                archivo.close()
+    monitor.mostrar()
+
+
+# Llamado al programa principal
+if __name__ == "__main__":
+    main()
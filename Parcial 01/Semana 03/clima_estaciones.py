@@ -0,0 +1,177 @@
+# Análisis de temperaturas de muchas estaciones a la vez (NumPy)
+#
+# calcular_promedio (Programacion_tradicional.py) promedia una lista de una
+# estación. Aquí todas las series van en un único array (estaciones x días) y
+# cada cálculo es una operación vectorizada sobre el array completo:
+# - promedios semanales, mensuales y móviles
+# - climatología por día del año, anomalías respecto de ella y percentiles
+# Las series se guardan en binario (.npy) y se pueden abrir con memmap: solo se
+# lee del disco la parte que se usa.
+#
+# Uso: python clima_estaciones.py [--estaciones 20] [--anios 3]
+
+import argparse
+import json
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DIAS_ANIO = 366  # posiciones de la climatología (incluye el 29 de febrero)
+
+
+class SeriesEstaciones:
+    """
+    Temperaturas diarias de varias estaciones: fila = estación, columna = día
+    consecutivo desde `inicio`. Las series deben estar completas (sin huecos).
+    """
+
+    def __init__(self, temperaturas: np.ndarray, inicio, nombres: Optional[Sequence[str]] = None):
+        self.temperaturas = temperaturas  # puede ser un np.memmap
+        self.inicio = np.datetime64(inicio, "D")
+        self.nombres = list(nombres) if nombres is not None else [
+            f"Estación {i + 1}" for i in range(temperaturas.shape[0])]
+
+    # ---------- Carga y guardado ----------
+    @classmethod
+    def desde_listas(cls, series: Dict[str, List[float]], inicio) -> "SeriesEstaciones":
+        # Todas las listas deben tener la misma longitud
+        return cls(np.array(list(series.values()), dtype=np.float64), inicio, series.keys())
+
+    @classmethod
+    def desde_csv(cls, ruta: str) -> "SeriesEstaciones":
+        """
+        CSV ancho: cabecera `fecha,estación 1,estación 2,...` y una fila por día consecutivo.
+        """
+        with open(ruta, encoding="utf-8") as archivo:
+            nombres = archivo.readline().strip().split(",")[1:]
+            inicio = archivo.readline().split(",", 1)[0]
+        datos = np.loadtxt(ruta, delimiter=",", skiprows=1, usecols=range(1, len(nombres) + 1),
+                           dtype=np.float64, ndmin=2)
+        return cls(np.ascontiguousarray(datos.T), inicio, nombres)
+
+    def guardar(self, ruta: str) -> None:
+        # Datos en ruta.npy; fecha de inicio y nombres en ruta.json
+        np.save(ruta + ".npy", self.temperaturas)
+        with open(ruta + ".json", "w", encoding="utf-8") as archivo:
+            json.dump({"inicio": str(self.inicio), "nombres": self.nombres}, archivo, ensure_ascii=False)
+
+    @classmethod
+    def cargar(cls, ruta: str, memmap: bool = True) -> "SeriesEstaciones":
+        with open(ruta + ".json", encoding="utf-8") as archivo:
+            meta = json.load(archivo)
+        temperaturas = np.load(ruta + ".npy", mmap_mode="r" if memmap else None)
+        return cls(temperaturas, meta["inicio"], meta["nombres"])
+
+    # ---------- Fechas ----------
+    @property
+    def estaciones(self) -> int:
+        return self.temperaturas.shape[0]
+
+    @property
+    def dias(self) -> int:
+        return self.temperaturas.shape[1]
+
+    def fechas(self) -> np.ndarray:
+        return self.inicio + np.arange(self.dias)
+
+    def dia_del_anio(self) -> np.ndarray:
+        # 0 = 1 de enero; en años no bisiestos se salta el 29 de febrero (posición 59)
+        fechas = self.fechas()
+        dia = (fechas - fechas.astype("datetime64[Y]")).astype(np.int64)
+        anio = fechas.astype("datetime64[Y]").astype(np.int64) + 1970
+        bisiesto = (anio % 4 == 0) & ((anio % 100 != 0) | (anio % 400 == 0))
+        return dia + ((dia >= 59) & ~bisiesto)
+
+    # ---------- Promedios ----------
+    def promedios_semanales(self) -> np.ndarray:
+        """
+        (estaciones, semanas completas desde el inicio): la última semana incompleta se descarta.
+        """
+        semanas = self.dias // 7
+        return self.temperaturas[:, :semanas * 7].reshape(self.estaciones, semanas, 7).mean(axis=2, dtype=np.float64)
+
+    def promedios_mensuales(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna (meses, promedios): meses como datetime64[M] y promedios (estaciones, meses).
+        """
+        meses = self.fechas().astype("datetime64[M]")
+        cortes = np.flatnonzero(np.r_[True, meses[1:] != meses[:-1]])
+        sumas = np.add.reduceat(self.temperaturas, cortes, axis=1, dtype=np.float64)
+        return meses[cortes], sumas / np.diff(np.r_[cortes, self.dias])
+
+    def promedios_moviles(self, ventana: int) -> np.ndarray:
+        """
+        Promedio de cada `ventana` días consecutivos: (estaciones, días - ventana + 1).
+        """
+        if not 1 <= ventana <= self.dias:
+            raise ValueError(f"La ventana debe estar entre 1 y {self.dias} días")
+        acumulado = np.zeros((self.estaciones, self.dias + 1))
+        np.cumsum(self.temperaturas, axis=1, dtype=np.float64, out=acumulado[:, 1:])
+        return (acumulado[:, ventana:] - acumulado[:, :-ventana]) / ventana
+
+    # ---------- Climatología, anomalías y percentiles ----------
+    def climatologia(self) -> np.ndarray:
+        """
+        Temperatura media de cada día del año en cada estación: (estaciones, 366).
+        Los días sin datos (p. ej. el 29 de febrero sin años bisiestos) quedan en NaN.
+        """
+        dia = self.dia_del_anio()
+        indices = (np.arange(self.estaciones)[:, None] * DIAS_ANIO + dia).ravel()
+        sumas = np.bincount(indices, weights=np.ravel(self.temperaturas), minlength=self.estaciones * DIAS_ANIO)
+        cuentas = np.bincount(dia, minlength=DIAS_ANIO)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sumas.reshape(self.estaciones, DIAS_ANIO) / cuentas
+
+    def anomalias(self) -> np.ndarray:
+        # Diferencia de cada día con la media de ese día del año en su estación
+        return self.temperaturas - self.climatologia()[:, self.dia_del_anio()]
+
+    def percentiles(self, q: Sequence[float] = (5, 50, 95)) -> np.ndarray:
+        # (estaciones, len(q))
+        return np.percentile(self.temperaturas, q, axis=1).T
+
+
+def generar_datos(estaciones: int, anios: int, semilla: int = 0, anio_inicio: int = 2000) -> SeriesEstaciones:
+    """
+    Series sintéticas: ciclo anual (sinusoide) distinto por estación más ruido diario.
+    Se guardan en float32 para ocupar la mitad; los cálculos acumulan en float64.
+    """
+    rng = np.random.default_rng(semilla)
+    inicio = np.datetime64(f"{anio_inicio}-01-01")
+    dias = int((np.datetime64(f"{anio_inicio + anios}-01-01") - inicio) / np.timedelta64(1, "D"))
+    series = SeriesEstaciones(np.empty((estaciones, dias), dtype=np.float32), inicio)
+    ciclo = np.sin(2 * np.pi * (series.dia_del_anio() - 105) / 365.25)
+    media = rng.uniform(5, 28, (estaciones, 1))
+    amplitud = rng.uniform(1, 12, (estaciones, 1))
+    series.temperaturas[:] = media + amplitud * ciclo + rng.normal(0, 2.5, (estaciones, dias))
+    return series
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Promedios, anomalías y percentiles de muchas estaciones.")
+    parser.add_argument("--estaciones", type=int, default=20)
+    parser.add_argument("--anios", type=int, default=3)
+    argumentos = parser.parse_args()
+
+    print("Análisis de temperaturas por estación (NumPy)")
+    series = generar_datos(argumentos.estaciones, argumentos.anios)
+    semanales = series.promedios_semanales()
+    meses, mensuales = series.promedios_mensuales()
+    moviles = series.promedios_moviles(30)
+    anomalias = series.anomalias()
+    percentiles = series.percentiles()
+    fechas = series.fechas()
+    print(f"{series.estaciones} estaciones, {series.dias} días desde {series.inicio}, "
+          f"{semanales.shape[1]} semanas, {len(meses)} meses\n")
+    print(f"{'Estación':<14}{'Media':>7}{'P5':>7}{'P50':>7}{'P95':>7}{'Mes más cálido':>16}"
+          f"{'Últ. 30 días':>14}{'Mayor anomalía':>16}")
+    for i, nombre in enumerate(series.nombres[:10]):
+        calido = meses[np.argmax(mensuales[i])]
+        extremo = np.argmax(np.abs(anomalias[i]))
+        print(f"{nombre:<14}{series.temperaturas[i].mean(dtype=np.float64):>7.2f}{percentiles[i, 0]:>7.2f}{percentiles[i, 1]:>7.2f}"
+              f"{percentiles[i, 2]:>7.2f}{str(calido):>16}{moviles[i, -1]:>14.2f}"
+              f"{anomalias[i, extremo]:>+9.2f} {fechas[extremo]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,86 @@
 # ===================================
 # EJEMPLO 1: SISTEMA DE TIENDA ONLINE
 # ===================================
+# Los precios son Decimal (sin errores de redondeo de float). Cada carrito guarda
+# la cantidad de cada producto y mantiene su total al agregar y quitar, y cada
+# producto sabe en qué carritos está: al cambiar precios solo se ajustan esos
+# carritos, sin volver a sumar sus líneas.
+
+from decimal import Decimal
+from weakref import WeakSet
+
+def a_dinero(valor):
+    # str() evita arrastrar el error de un float: 0.1 -> Decimal("0.1")
+    return valor if isinstance(valor, Decimal) else Decimal(str(valor))
+
+def validar_cantidad(cantidad):
+    # Unidades enteras (bool no cuenta): se comprueba antes de tocar el carrito
+    if not isinstance(cantidad, int) or isinstance(cantidad, bool):
+        raise TypeError("La cantidad debe ser un número entero")
+    if cantidad < 1:
+        raise ValueError("La cantidad debe ser al menos 1")
 
 class Producto:
     def __init__(self, nombre, precio):
         self.nombre = nombre
-        self.precio = precio
+        self.__precio = a_dinero(precio)
+        self.carritos = WeakSet()  # carritos que lo contienen (los abandonados se liberan solos)
+
+    @property
+    def precio(self):
+        return self.__precio
+
+    @precio.setter
+    def precio(self, nuevo):
+        Producto.actualizar_precios({self: nuevo})
+
+    @staticmethod
+    def actualizar_precios(precios):
+        # precios: {producto: nuevo precio}. Retorna cuántos carritos se ajustaron
+        ajustes = {}
+        for producto, nuevo in precios.items():
+            nuevo = a_dinero(nuevo)
+            diferencia = nuevo - producto.__precio
+            producto.__precio = nuevo
+            if diferencia:
+                for carrito in producto.carritos:
+                    ajustes[carrito] = ajustes.get(carrito, 0) + diferencia * carrito.productos[producto]
+        for carrito, ajuste in ajustes.items():
+            carrito.total += ajuste
+        return len(ajustes)
 
 class Carrito:
     def __init__(self):
-        self.productos = []
-
-    def agregar_producto(self, producto):
-        self.productos.append(producto)
+        self.productos = {}  # {producto: cantidad}
+        self.total = Decimal(0)
+
+    def agregar_producto(self, producto, cantidad=1):
+        validar_cantidad(cantidad)
+        importe = producto.precio * cantidad  # antes de cambiar nada, por si falla
+        self.productos[producto] = self.productos.get(producto, 0) + cantidad
+        producto.carritos.add(self)
+        self.total += importe
+
+    def quitar_producto(self, producto, cantidad=1):
+        validar_cantidad(cantidad)
+        actual = self.productos.get(producto, 0)
+        if actual == 0:
+            raise ValueError(f"{producto.nombre} no está en el carrito")
+        cantidad = min(cantidad, actual)  # como mucho, las que haya
+        importe = producto.precio * cantidad
+        if cantidad == actual:
+            del self.productos[producto]
+            producto.carritos.discard(self)
+        else:
+            self.productos[producto] = actual - cantidad
+        self.total -= importe
 
     def calcular_total(self):
-        return sum(p.precio for p in self.productos)
+        return self.total
+
+    def recalcular_total(self):
+        # Suma completa de las líneas (solo para comprobar el total acumulado)
+        return sum((p.precio * c for p, c in self.productos.items()), Decimal(0))
 
 class ClienteTienda:
     def __init__(self, nombre):
@@ -0,0 +1,66 @@
+# ===================================
+# BENCHMARK: TOTAL ACUMULADO Y CAMBIO DE PRECIOS EN LOTE
+# ===================================
+# Compara, con carritos de miles de líneas:
+# - consultar el total: calcular_total() (acumulado) frente a sumar todas las líneas
+# - cambiar precios de parte del catálogo: Producto.actualizar_precios() (ajusta
+#   solo los carritos afectados) frente a cambiar precios y volver a sumar cada carrito
+# Al final se comprueba que los totales acumulados coinciden con la suma completa.
+#
+# Uso: python benchmark_carrito.py [--productos 5000] [--carritos 300] [--lineas 2000]
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from EjemplosMundoReal_POO import Carrito, Producto
+
+
+def cronometrar(funcion, *argumentos):
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    return time.perf_counter() - inicio, resultado
+
+
+def precio_aleatorio(rng):
+    return Decimal(rng.randint(50, 50_000)) / 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Total acumulado y cambios de precio en lote del carrito.")
+    parser.add_argument("--productos", type=int, default=5000)
+    parser.add_argument("--carritos", type=int, default=300)
+    parser.add_argument("--lineas", type=int, default=2000)
+    parser.add_argument("--cambios", type=float, default=0.01, help="fracción del catálogo que cambia de precio")
+    argumentos = parser.parse_args()
+
+    rng = random.Random(2025)
+    catalogo = [Producto(f"Producto {i}", precio_aleatorio(rng)) for i in range(argumentos.productos)]
+    carritos = []
+    for _ in range(argumentos.carritos):
+        carrito = Carrito()
+        for producto in rng.sample(catalogo, min(argumentos.lineas, len(catalogo))):
+            carrito.agregar_producto(producto, rng.randint(1, 5))
+        carritos.append(carrito)
+    print(f"{len(carritos)} carritos de {argumentos.lineas} líneas, catálogo de {len(catalogo)} productos")
+
+    # Total en cada consulta (p. ej. cada vez que se muestra la página)
+    acumulado, _ = cronometrar(lambda: [c.calcular_total() for c in carritos])
+    sumando, _ = cronometrar(lambda: [c.recalcular_total() for c in carritos])
+    print(f"  total de todos los carritos: acumulado {acumulado * 1000:.3f} ms, "
+          f"sumando las líneas {sumando * 1000:.1f} ms (x{sumando / acumulado:,.0f})")
+
+    # Cambio de precios de una parte del catálogo. Sin el índice producto -> carritos
+    # habría que volver a sumar todos los carritos tras cambiar los precios
+    cambiados = rng.sample(catalogo, max(1, int(len(catalogo) * argumentos.cambios)))
+    en_lote, ajustados = cronometrar(Producto.actualizar_precios, {p: precio_aleatorio(rng) for p in cambiados})
+    completo, totales = cronometrar(lambda: [c.recalcular_total() for c in carritos])
+    print(f"  cambiar {len(cambiados)} precios: en lote {en_lote * 1000:.1f} ms ({ajustados} carritos ajustados), "
+          f"volviendo a sumar {completo * 1000:.1f} ms (x{completo / en_lote:,.1f})")
+
+    assert [c.calcular_total() for c in carritos] == totales
+    print("  totales acumulados comprobados contra la suma completa")
+
+if __name__ == "__main__":
+    main()
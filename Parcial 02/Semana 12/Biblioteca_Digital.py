@@ -2,7 +2,52 @@
 # SISTEMA DE GESTIÓN DE BIBLIOTECA DIGITAL
 # ==========================================
 
-from typing import List, Dict, Optional
+import csv
+import gc
+import heapq
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from operator import itemgetter
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+SUCURSAL_PRINCIPAL = "Central"
+
+# Persistencia: instantánea binaria + diario (journal) de operaciones posteriores
+ARCHIVO_INSTANTANEA = "biblioteca.snapshot"
+ARCHIVO_DIARIO = "biblioteca.journal"
+
+
+# Registro normalizado de catálogo: (titulo, autor, categoria, isbn, ejemplares, sucursal)
+RegistroCatalogo = Tuple[str, str, str, str, int, str]
+
+# Campos MARC usados por el formato "tipo MARC" de importación
+CAMPOS_MARC = {"020": "isbn", "100": "autor", "245": "titulo", "650": "categoria",
+               "852": "sucursal", "949": "ejemplares"}
+
+
+@contextmanager
+def _sin_recolector():
+    """
+    Pausa el recolector cíclico mientras se (de)serializa: con millones de
+    objetos recién creados, sus pasadas multiplican el tiempo de carga.
+    """
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
 
 
 class Libro:
@@ -11,10 +56,14 @@ class Libro:
     - autor_titulo: tupla (autor, titulo) -> inmutable por diseño
     - categoria: str
     - isbn: str (clave única en la biblioteca)
+    Usa __slots__ (sin __dict__ por instancia) e interna autor y categoría:
+    se repiten mucho en un catálogo y así cada valor distinto existe una sola vez.
     """
+    __slots__ = ("autor_titulo", "categoria", "isbn")
+
     def __init__(self, titulo: str, autor: str, categoria: str, isbn: str):
-        self.autor_titulo = (autor, titulo)  # tupla (autor, titulo)
-        self.categoria = categoria
+        self.autor_titulo = (sys.intern(autor), titulo)  # tupla (autor, titulo)
+        self.categoria = sys.intern(categoria)
         self.isbn = isbn
 
     @property
@@ -36,6 +85,8 @@ class Usuario:
     - nombre
     - prestados: lista de ISBN actuales
     """
+    __slots__ = ("nombre", "id_usuario", "prestados")
+
     def __init__(self, nombre: str, id_usuario: str):
         self.nombre = nombre
         self.id_usuario = id_usuario
@@ -45,22 +96,248 @@ class Usuario:
         return f"Usuario(id={self.id_usuario}, nombre={self.nombre}, prestados={self.prestados})"
 
 
+@dataclass
+class ResultadoImportacion:
+    """
+    Resumen de una importación masiva de catálogo.
+    """
+    leidos: int
+    insertados: int
+    duplicados: int
+    invalidos: int
+    segundos: float
+
+    @property
+    def libros_por_segundo(self) -> float:
+        return self.leidos / self.segundos if self.segundos else 0.0
+
+    def __str__(self):
+        return (f"{self.insertados} insertados, {self.duplicados} duplicados, "
+                f"{self.invalidos} inválidos en {self.segundos:.2f}s "
+                f"({self.libros_por_segundo:,.0f} libros/s)")
+
+
+class Existencias:
+    """
+    Ejemplares físicos de un mismo ISBN:
+    - por_sucursal: {sucursal: [total, prestados]}
+    - total / prestados: contadores globales, mantenidos en cada operación
+    Así la disponibilidad se consulta en O(1) sin recorrer ejemplares.
+    """
+    __slots__ = ("por_sucursal", "total", "prestados")
+
+    def __init__(self):
+        self.por_sucursal: Dict[str, List[int]] = {}
+        self.total = 0
+        self.prestados = 0
+
+    @property
+    def disponibles(self) -> int:
+        return self.total - self.prestados
+
+    def disponibles_en(self, sucursal: str) -> int:
+        contador = self.por_sucursal.get(sucursal)
+        if not contador:
+            return 0
+        return contador[0] - contador[1]
+
+    def agregar(self, sucursal: str, cantidad: int) -> None:
+        contador = self.por_sucursal.setdefault(sys.intern(sucursal), [0, 0])
+        contador[0] += cantidad
+        self.total += cantidad
+
+    def retirar(self, sucursal: str, cantidad: int) -> bool:
+        # Solo se pueden retirar ejemplares que estén en estantería
+        if cantidad <= 0 or self.disponibles_en(sucursal) < cantidad:
+            return False
+        contador = self.por_sucursal[sucursal]
+        contador[0] -= cantidad
+        self.total -= cantidad
+        if contador[0] == 0:
+            del self.por_sucursal[sucursal]
+        return True
+
+    def prestar(self, sucursal: Optional[str] = None) -> Optional[str]:
+        """
+        Marca un ejemplar como prestado y retorna la sucursal de donde salió.
+        Sin sucursal, se toma la primera que tenga ejemplares libres.
+        """
+        if self.prestados >= self.total:
+            return None
+        if sucursal is None:
+            sucursal = next(s for s, (t, p) in self.por_sucursal.items() if t > p)
+        elif self.disponibles_en(sucursal) <= 0:
+            return None
+        self.por_sucursal[sucursal][1] += 1
+        self.prestados += 1
+        return sucursal
+
+    def devolver(self, sucursal: str) -> None:
+        self.por_sucursal[sucursal][1] -= 1
+        self.prestados -= 1
+
+    def __repr__(self):
+        return f"Existencias(disponibles={self.disponibles}, total={self.total})"
+
+
 class Biblioteca:
     """
     Gestiona libros, usuarios y préstamos.
     Estructuras:
     - libros: {isbn: Libro}
     - usuarios: {id_usuario: Usuario}
-    - prestamos: {isbn: id_usuario}
+    - existencias: {isbn: Existencias} -> ejemplares por sucursal
+    - prestamos: {isbn: {id_usuario: sucursal}}
     - ids_usuarios: set() -> unicidad de usuarios
     - historial: lista de tuplas (accion, isbn, id_usuario) para trazabilidad
+
+    Estadísticas mantenidas de forma incremental (sin recorrer libros ni historial):
+    - facetas por categoría y autor, al dar de alta o baja libros
+    - préstamos por ISBN y por usuario de cada mes ("AAAA-MM")
+    - prestatarios activos: usuarios con al menos un libro en su poder
+
+    Persistencia opcional (ver activar_persistencia / cargar): el estado completo
+    se guarda como instantánea pickle y cada operación posterior se anota en un
+    diario JSON-lines numerado, que se reproduce al reiniciar.
     """
     def __init__(self):
         self.libros: Dict[str, Libro] = {}
         self.usuarios: Dict[str, Usuario] = {}
-        self.prestamos: Dict[str, str] = {}
+        self.existencias: Dict[str, Existencias] = {}
+        self.prestamos: Dict[str, Dict[str, str]] = {}
         self.ids_usuarios = set()
         self.historial: List[tuple] = []
+        # Índices de búsqueda (en minúsculas): clave -> {isbn}
+        self._indice_autor: Dict[str, Set[str]] = {}
+        self._indice_categoria: Dict[str, Set[str]] = {}
+        self._indice_palabras: Dict[str, Set[str]] = {}  # palabras del título
+        # Estadísticas incrementales
+        self._facetas_categoria: Counter = Counter()
+        self._facetas_autor: Counter = Counter()
+        self._prestamos_mes: Dict[str, Counter] = {}   # mes -> {isbn: préstamos}
+        self._lectores_mes: Dict[str, Counter] = {}    # mes -> {id_usuario: préstamos}
+        self._prestatarios_activos: Set[str] = set()
+        # Protege los contadores de existencias ante préstamos concurrentes
+        self._candado = threading.Lock()
+        # Persistencia (inactiva hasta llamar a activar_persistencia)
+        self._directorio: Optional[str] = None
+        self._diario = None
+        self._secuencia = 0  # número de la última operación anotada en el diario
+
+    # ---------- PERSISTENCIA ----------
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        for clave in ("_candado", "_diario", "_directorio"):
+            estado.pop(clave, None)
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._candado = threading.Lock()
+        self._directorio = None
+        self._diario = None
+
+    def activar_persistencia(self, directorio: str) -> None:
+        """
+        Empieza a anotar cada operación en el diario de `directorio`.
+        Si aún no hay instantánea, se escribe una con el estado actual.
+        Un directorio con instantánea solo lo puede continuar la biblioteca cargada
+        de él (Biblioteca.cargar): otra numeraría su diario desde 1 y esas
+        operaciones se saltarían al recargar.
+        """
+        existe = os.path.exists(os.path.join(directorio, ARCHIVO_INSTANTANEA))
+        if existe and (self._directorio is None
+                       or os.path.abspath(self._directorio) != os.path.abspath(directorio)):
+            raise ValueError(f"'{directorio}' ya contiene una biblioteca: use Biblioteca.cargar().")
+        os.makedirs(directorio, exist_ok=True)
+        self._directorio = directorio
+        if not existe:
+            self.guardar_instantanea()
+        else:
+            self._diario = open(os.path.join(directorio, ARCHIVO_DIARIO), "a", encoding="utf-8")
+
+    def guardar_instantanea(self) -> None:
+        """
+        Vuelca el estado completo (protocolo pickle 5) y vacía el diario.
+        La escritura es atómica: se usa un temporal y os.replace().
+        """
+        if self._directorio is None:
+            raise ValueError("La persistencia no está activada.")
+        ruta = os.path.join(self._directorio, ARCHIVO_INSTANTANEA)
+        temporal = ruta + ".tmp"
+        with open(temporal, "wb") as f, _sin_recolector():
+            pickle.dump(self, f, protocol=5)
+        os.replace(temporal, ruta)
+        # Si el proceso cae antes de vaciar el diario, las operaciones ya
+        # incluidas en la instantánea se saltan al reproducir (por _secuencia).
+        if self._diario is not None:
+            self._diario.close()
+        self._diario = open(os.path.join(self._directorio, ARCHIVO_DIARIO), "w", encoding="utf-8")
+
+    @classmethod
+    def cargar(cls, directorio: str) -> "Biblioteca":
+        """
+        Reinicio en caliente: carga la última instantánea y reproduce la cola del diario.
+        Una última línea incompleta (caída a mitad de escritura) se descarta.
+        """
+        ruta_instantanea = os.path.join(directorio, ARCHIVO_INSTANTANEA)
+        if os.path.exists(ruta_instantanea):
+            with open(ruta_instantanea, "rb") as f, _sin_recolector():
+                biblioteca = pickle.load(f)
+        else:
+            biblioteca = cls()
+
+        ruta_diario = os.path.join(directorio, ARCHIVO_DIARIO)
+        if os.path.exists(ruta_diario):
+            valido = 0
+            with open(ruta_diario, "rb") as f:
+                for linea in f:
+                    try:
+                        secuencia, accion, *args = json.loads(linea)
+                    except ValueError:
+                        break
+                    if not linea.endswith(b"\n"):
+                        break
+                    valido += len(linea)
+                    if secuencia <= biblioteca._secuencia:
+                        continue
+                    biblioteca._reproducir(accion, args)
+                    biblioteca._secuencia = secuencia
+            if valido < os.path.getsize(ruta_diario):
+                with open(ruta_diario, "r+b") as f:
+                    f.truncate(valido)
+
+        biblioteca._directorio = directorio  # la continúa quien la cargó
+        biblioteca.activar_persistencia(directorio)
+        return biblioteca
+
+    def cerrar(self) -> None:
+        if self._diario is not None:
+            self._diario.close()
+            self._diario = None
+
+    def _anotar(self, accion: str, *args) -> None:
+        if self._diario is None:
+            return
+        self._secuencia += 1
+        self._diario.write(json.dumps([self._secuencia, accion, *args], ensure_ascii=False) + "\n")
+        self._diario.flush()
+
+    def _reproducir(self, accion: str, args: list) -> None:
+        if accion == "ALTA_LIBRO":
+            titulo, autor, categoria, isbn, ejemplares, sucursal = args
+            self.anadir_libro(Libro(titulo, autor, categoria, isbn), ejemplares, sucursal)
+            return
+        operaciones = {
+            "ALTA_USUARIO": self.registrar_usuario,
+            "BAJA_USUARIO": self.dar_baja_usuario,
+            "ALTA_EJEMPLARES": self.anadir_ejemplares,
+            "BAJA_EJEMPLARES": self.retirar_ejemplares,
+            "BAJA_LIBRO": self.quitar_libro,
+            "PRESTAR": self.prestar_libro,
+            "DEVOLVER": self.devolver_libro,
+        }
+        operaciones[accion](*args)
 
     # ---------- USUARIOS ----------
     def registrar_usuario(self, nombre: str, id_usuario: str) -> bool:
@@ -69,6 +346,7 @@ class Biblioteca:
         self.ids_usuarios.add(id_usuario)
         self.usuarios[id_usuario] = Usuario(nombre, id_usuario)
         self.historial.append(("ALTA_USUARIO", "-", id_usuario))
+        self._anotar("ALTA_USUARIO", nombre, id_usuario)
         return True
 
     def dar_baja_usuario(self, id_usuario: str) -> bool:
@@ -81,44 +359,215 @@ class Biblioteca:
         self.ids_usuarios.discard(id_usuario)
         del self.usuarios[id_usuario]
         self.historial.append(("BAJA_USUARIO", "-", id_usuario))
+        self._anotar("BAJA_USUARIO", id_usuario)
         return True
 
     # ---------- LIBROS ----------
-    def anadir_libro(self, libro: Libro) -> bool:
-        if libro.isbn in self.libros:
+    def anadir_libro(
+        self,
+        libro: Libro,
+        ejemplares: int = 1,
+        sucursal: str = SUCURSAL_PRINCIPAL
+    ) -> bool:
+        if libro.isbn in self.libros or ejemplares <= 0:
             return False
         self.libros[libro.isbn] = libro
+        existencias = Existencias()
+        existencias.agregar(sucursal, ejemplares)
+        self.existencias[libro.isbn] = existencias
+        self._indexar(libro)
         self.historial.append(("ALTA_LIBRO", libro.isbn, "-"))
+        self._anotar("ALTA_LIBRO", libro.titulo, libro.autor, libro.categoria, libro.isbn, ejemplares, sucursal)
+        return True
+
+    def anadir_ejemplares(self, isbn: str, cantidad: int, sucursal: str = SUCURSAL_PRINCIPAL) -> bool:
+        if isbn not in self.libros or cantidad <= 0:
+            return False
+        with self._candado:
+            self.existencias[isbn].agregar(sucursal, cantidad)
+        self.historial.append(("ALTA_EJEMPLARES", isbn, "-"))
+        self._anotar("ALTA_EJEMPLARES", isbn, cantidad, sucursal)
+        return True
+
+    def retirar_ejemplares(self, isbn: str, cantidad: int, sucursal: str = SUCURSAL_PRINCIPAL) -> bool:
+        existencias = self.existencias.get(isbn)
+        if existencias is None:
+            return False
+        with self._candado:
+            # Debe quedar al menos un ejemplar; para eliminarlo todo está quitar_libro
+            if existencias.total - cantidad <= 0 or not existencias.retirar(sucursal, cantidad):
+                return False
+        self.historial.append(("BAJA_EJEMPLARES", isbn, "-"))
+        self._anotar("BAJA_EJEMPLARES", isbn, cantidad, sucursal)
         return True
 
     def quitar_libro(self, isbn: str) -> bool:
-        if isbn in self.prestamos:  # está prestado
+        if self.prestamos.get(isbn):  # tiene ejemplares prestados
             return False
         if isbn not in self.libros:
             return False
-        del self.libros[isbn]
+        self._desindexar(self.libros.pop(isbn))
+        del self.existencias[isbn]
+        self.prestamos.pop(isbn, None)
+        # Sus préstamos dejan de contar: un ISBN que vuelva a darse de alta empieza de cero
+        for mes in [m for m, conteo in self._prestamos_mes.items() if conteo.pop(isbn, None) and not conteo]:
+            del self._prestamos_mes[mes]
         self.historial.append(("BAJA_LIBRO", isbn, "-"))
+        self._anotar("BAJA_LIBRO", isbn)
         return True
 
+    # ---------- IMPORTACIÓN MASIVA ----------
+    def importar_catalogo(
+        self,
+        ruta: str,
+        formato: Optional[str] = None,
+        trabajadores: Optional[int] = None,
+        tam_lote: int = 5000
+    ) -> ResultadoImportacion:
+        """
+        Carga un catálogo completo desde archivo en flujo (sin leerlo entero):
+        - formato: "csv", "jsonl" o "marc" (por defecto, según la extensión)
+        - CSV/JSONL usan los campos titulo, autor, categoria, isbn y, opcionalmente,
+          ejemplares y sucursal; "marc" usa registros de líneas "020 ...", "100 ...",
+          "245 ...", "650 ...", "852 ...", "949 ..." separados por una línea en blanco
+        - los lotes se analizan en un grupo de procesos (trabajadores <= 1: en línea)
+        - los ISBN repetidos (en el archivo o ya presentes) se descartan
+        - los índices de búsqueda se construyen en una sola pasada al final
+        - se añade una única entrada resumen al historial
+        """
+        if formato is None:
+            formato = os.path.splitext(ruta)[1].lstrip(".").lower()
+        if formato not in ("csv", "jsonl", "marc"):
+            raise ValueError(f"Formato de catálogo no soportado: '{formato}'.")
+        if trabajadores is None:
+            trabajadores = os.cpu_count() or 1
+
+        inicio = time.perf_counter()
+        leidos = duplicados = invalidos = 0
+        nuevos: List[Libro] = []
+        with open(ruta, "r", encoding="utf-8", newline="") as f:
+            lotes, analizar = _preparar_lectura(f, formato, tam_lote)
+            with _sin_recolector():
+                for registros, erroneos in _procesar_lotes(analizar, lotes, trabajadores):
+                    invalidos += erroneos
+                    leidos += len(registros)
+                    for titulo, autor, categoria, isbn, ejemplares, sucursal in registros:
+                        if isbn in self.libros:
+                            duplicados += 1
+                            continue
+                        libro = Libro(titulo, autor, categoria, isbn)
+                        existencias = Existencias()
+                        existencias.agregar(sucursal, ejemplares)
+                        self.libros[isbn] = libro
+                        self.existencias[isbn] = existencias
+                        nuevos.append(libro)
+
+                for libro in nuevos:
+                    self._indexar(libro)
+
+        self.historial.append(("IMPORTAR_CATALOGO", f"{len(nuevos)} libros", "-"))
+        if self._diario is not None:
+            # Una importación masiva no se anota libro a libro: se consolida en la instantánea
+            self.guardar_instantanea()
+        return ResultadoImportacion(leidos, len(nuevos), duplicados, invalidos,
+                                    time.perf_counter() - inicio)
+
+    # ---------- ÍNDICES ----------
+    def _indexar(self, libro: Libro) -> None:
+        self._facetas_categoria[libro.categoria] += 1
+        self._facetas_autor[libro.autor] += 1
+        self._indice_autor.setdefault(libro.autor.lower(), set()).add(libro.isbn)
+        self._indice_categoria.setdefault(libro.categoria.lower(), set()).add(libro.isbn)
+        for palabra in libro.titulo.lower().split():
+            self._indice_palabras.setdefault(palabra, set()).add(libro.isbn)
+
+    def _desindexar(self, libro: Libro) -> None:
+        for facetas, clave in ((self._facetas_categoria, libro.categoria), (self._facetas_autor, libro.autor)):
+            facetas[clave] -= 1
+            if not facetas[clave]:
+                del facetas[clave]
+        claves = [(self._indice_autor, libro.autor.lower()),
+                  (self._indice_categoria, libro.categoria.lower())]
+        claves += [(self._indice_palabras, p) for p in libro.titulo.lower().split()]
+        for indice, clave in claves:
+            isbns = indice.get(clave)
+            if isbns is not None:
+                isbns.discard(libro.isbn)
+                if not isbns:
+                    del indice[clave]
+
+    @staticmethod
+    def _coincidencias(indice: Dict[str, Set[str]], consulta: str) -> Set[str]:
+        """
+        ISBN cuya clave contiene `consulta`. Recorre las claves distintas
+        (autores, categorías o palabras), no el catálogo completo.
+        """
+        encontrados: Set[str] = set()
+        for clave, isbns in indice.items():
+            if consulta in clave:
+                encontrados |= isbns
+        return encontrados
+
+    # ---------- EXISTENCIAS ----------
+    def disponibles(self, isbn: str, sucursal: Optional[str] = None) -> int:
+        """
+        Ejemplares libres de un ISBN (en total o en una sucursal). O(1).
+        """
+        existencias = self.existencias.get(isbn)
+        if existencias is None:
+            return 0
+        if sucursal is None:
+            return existencias.disponibles
+        return existencias.disponibles_en(sucursal)
+
     # ---------- PRÉSTAMOS ----------
-    def prestar_libro(self, isbn: str, id_usuario: str) -> bool:
+    def prestar_libro(
+        self,
+        isbn: str,
+        id_usuario: str,
+        sucursal: Optional[str] = None,
+        mes: Optional[str] = None
+    ) -> bool:
+        """
+        mes: "AAAA-MM" al que se imputa el préstamo en las estadísticas (por defecto, el actual).
+        """
         if isbn not in self.libros or id_usuario not in self.usuarios:
             return False
-        if isbn in self.prestamos:
-            return False  # ya prestado
-        self.prestamos[isbn] = id_usuario
+        with self._candado:
+            prestatarios = self.prestamos.setdefault(isbn, {})
+            if id_usuario in prestatarios:
+                return False  # ya tiene un ejemplar de este libro
+            origen = self.existencias[isbn].prestar(sucursal)
+            if origen is None:
+                if not prestatarios:
+                    del self.prestamos[isbn]
+                return False  # sin ejemplares disponibles
+            prestatarios[id_usuario] = origen
         self.usuarios[id_usuario].prestados.append(isbn)
+        mes = mes or date.today().strftime("%Y-%m")
+        self._prestamos_mes.setdefault(mes, Counter())[isbn] += 1
+        self._lectores_mes.setdefault(mes, Counter())[id_usuario] += 1
+        self._prestatarios_activos.add(id_usuario)
         self.historial.append(("PRESTAR", isbn, id_usuario))
+        self._anotar("PRESTAR", isbn, id_usuario, origen, mes)
         return True
 
     def devolver_libro(self, isbn: str, id_usuario: str) -> bool:
-        if self.prestamos.get(isbn) != id_usuario:
-            return False
-        self.prestamos.pop(isbn, None)
+        with self._candado:
+            prestatarios = self.prestamos.get(isbn)
+            if not prestatarios or id_usuario not in prestatarios:
+                return False
+            sucursal = prestatarios.pop(id_usuario)
+            if not prestatarios:
+                del self.prestamos[isbn]
+            self.existencias[isbn].devolver(sucursal)
         user = self.usuarios[id_usuario]
         if isbn in user.prestados:
             user.prestados.remove(isbn)
+        if not user.prestados:
+            self._prestatarios_activos.discard(id_usuario)
         self.historial.append(("DEVOLVER", isbn, id_usuario))
+        self._anotar("DEVOLVER", isbn, id_usuario)
         return True
 
     # ---------- BÚSQUEDAS ----------
@@ -131,24 +580,100 @@ class Biblioteca:
         """
         Retorna lista de libros que coincidan con cualquier filtro provisto.
         Coincidencia por 'contiene' e insensible a mayúsculas.
+        Los candidatos salen de los índices; el resultado se ordena por ISBN.
         """
-        res = []
+        return self._buscar(titulo, autor, categoria)
+
+    def _buscar(
+        self,
+        titulo: Optional[str],
+        autor: Optional[str],
+        categoria: Optional[str],
+        facetas: Optional[Dict[str, Counter]] = None
+    ) -> List[Libro]:
         t = titulo.lower() if titulo else None
         a = autor.lower() if autor else None
         c = categoria.lower() if categoria else None
+        if not (t or a or c):
+            return []
 
-        for libro in self.libros.values():
-            ok = True
+        filtros: List[Set[str]] = []
+        if a:
+            filtros.append(self._coincidencias(self._indice_autor, a))
+        if c:
+            filtros.append(self._coincidencias(self._indice_categoria, c))
+        if t:
+            # Cada trozo del título buscado está contenido en alguna palabra del título
+            for trozo in t.split():
+                filtros.append(self._coincidencias(self._indice_palabras, trozo))
+        if not filtros:
+            # Título formado solo por espacios: no hay índice que ayude
+            filtros.append(set(self.libros))
+
+        filtros.sort(key=len)
+        candidatos = filtros[0].intersection(*filtros[1:])
+        res = []
+        for isbn in sorted(candidatos):
+            libro = self.libros[isbn]
             if t and t not in libro.titulo.lower():
-                ok = False
-            if a and a not in libro.autor.lower():
-                ok = False
-            if c and c not in libro.categoria.lower():
-                ok = False
-            if (t or a or c) and ok:
-                res.append(libro)
+                continue
+            res.append(libro)
+            if facetas is not None:
+                facetas["categoria"][libro.categoria] += 1
+                facetas["autor"][libro.autor] += 1
         return res
 
+    def buscar_con_facetas(
+        self,
+        titulo: Optional[str] = None,
+        autor: Optional[str] = None,
+        categoria: Optional[str] = None
+    ) -> Tuple[List[Libro], Dict[str, Counter]]:
+        """
+        Igual que buscar(), más el conteo por categoría y autor de los resultados,
+        calculado en la misma pasada que los filtra.
+        """
+        facetas = {"categoria": Counter(), "autor": Counter()}
+        return self._buscar(titulo, autor, categoria, facetas), facetas
+
+    def buscar_con_disponibilidad(
+        self,
+        titulo: Optional[str] = None,
+        autor: Optional[str] = None,
+        categoria: Optional[str] = None
+    ) -> List[Tuple[Libro, int]]:
+        """
+        Igual que buscar(), pero cada resultado va anotado con sus ejemplares libres.
+        """
+        return [(libro, self.existencias[libro.isbn].disponibles)
+                for libro in self.buscar(titulo, autor, categoria)]
+
+    # ---------- ESTADÍSTICAS ----------
+    def facetas(self) -> Dict[str, Counter]:
+        """
+        Libros por categoría y por autor en todo el catálogo. O(1): ya están contados.
+        """
+        return {"categoria": self._facetas_categoria, "autor": self._facetas_autor}
+
+    def mas_prestados(self, k: int = 10, mes: Optional[str] = None) -> List[Tuple[Libro, int]]:
+        """
+        Top-k de libros más prestados del mes (por defecto, el actual).
+        Los libros dados de baja no aparecen: quitar_libro borra sus préstamos.
+        """
+        mes = mes or date.today().strftime("%Y-%m")
+        conteo = self._prestamos_mes.get(mes, Counter())
+        return heapq.nlargest(k, ((self.libros[isbn], veces) for isbn, veces in conteo.items()), key=itemgetter(1))
+
+    def lectores_mas_activos(self, k: int = 10, mes: Optional[str] = None) -> List[Tuple[str, int]]:
+        mes = mes or date.today().strftime("%Y-%m")
+        return self._lectores_mes.get(mes, Counter()).most_common(k)
+
+    def prestatarios_activos(self) -> FrozenSet[str]:
+        """
+        IDs de usuarios que tienen hoy al menos un libro prestado (copia inmutable).
+        """
+        return frozenset(self._prestatarios_activos)
+
     # ---------- LISTADOS ----------
     def listar_prestados_usuario(self, id_usuario: str) -> List[Libro]:
         user = self.usuarios.get(id_usuario)
@@ -161,14 +686,123 @@ class Biblioteca:
         Lista global de préstamos (isbn, id_usuario, titulo).
         """
         salida = []
-        for isbn, uid in self.prestamos.items():
+        for isbn, prestatarios in self.prestamos.items():
             titulo = self.libros[isbn].titulo if isbn in self.libros else "?"
-            salida.append((isbn, uid, titulo))
+            for uid in prestatarios:
+                salida.append((isbn, uid, titulo))
         return salida
 
 
+# ---------- LECTURA DE CATÁLOGOS (funciones de módulo: deben poder enviarse a otros procesos) ----------
+def _agrupar(elementos: Iterable, tam_lote: int) -> Iterator[list]:
+    lote = []
+    for elemento in elementos:
+        lote.append(elemento)
+        if len(lote) >= tam_lote:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def _registros_marc(lineas: Iterable[str]) -> Iterator[List[str]]:
+    registro: List[str] = []
+    for linea in lineas:
+        if linea.strip():
+            registro.append(linea)
+        elif registro:
+            yield registro
+            registro = []
+    if registro:
+        yield registro
+
+
+def _normalizar(campos: dict) -> RegistroCatalogo:
+    isbn = (campos.get("isbn") or "").strip()
+    titulo = (campos.get("titulo") or "").strip()
+    if not isbn or not titulo:
+        raise ValueError("Registro sin ISBN o sin título.")
+    ejemplares = int(campos.get("ejemplares") or 1)
+    if ejemplares <= 0:
+        raise ValueError("Cantidad de ejemplares no válida.")
+    return (titulo, (campos.get("autor") or "").strip(), (campos.get("categoria") or "").strip(),
+            isbn, ejemplares, (campos.get("sucursal") or "").strip() or SUCURSAL_PRINCIPAL)
+
+
+def _analizar_lote(convertir: Callable[[object], dict], lote: list) -> Tuple[List[RegistroCatalogo], int]:
+    registros: List[RegistroCatalogo] = []
+    invalidos = 0
+    for crudo in lote:
+        try:
+            registros.append(_normalizar(convertir(crudo)))
+        except (ValueError, TypeError, KeyError, AttributeError):
+            invalidos += 1
+    return registros, invalidos
+
+
+def _fila_csv(columnas: List[str], linea: str) -> dict:
+    return dict(zip(columnas, next(csv.reader([linea]))))
+
+
+def _objeto_jsonl(linea: str) -> dict:
+    return json.loads(linea)
+
+
+def _registro_marc(lineas: List[str]) -> dict:
+    campos = {}
+    for linea in lineas:
+        etiqueta, _, valor = linea.strip().partition(" ")
+        if etiqueta in CAMPOS_MARC:
+            valor = valor.strip()
+            if valor.startswith("$a"):
+                valor = valor[2:].strip()
+            campos[CAMPOS_MARC[etiqueta]] = valor
+    return campos
+
+
+def _preparar_lectura(f, formato: str, tam_lote: int):
+    """
+    Retorna (generador de lotes crudos, función que analiza un lote).
+    En CSV no se admiten saltos de línea dentro de los campos: el lote viaja
+    como líneas sueltas para poder repartirlo entre procesos.
+    """
+    if formato == "csv":
+        columnas = [c.strip().lower() for c in next(csv.reader([f.readline()]))]
+        lineas = (linea for linea in f if linea.strip())
+        return _agrupar(lineas, tam_lote), partial(_analizar_lote, partial(_fila_csv, columnas))
+    if formato == "jsonl":
+        lineas = (linea for linea in f if linea.strip())
+        return _agrupar(lineas, tam_lote), partial(_analizar_lote, _objeto_jsonl)
+    return _agrupar(_registros_marc(f), tam_lote), partial(_analizar_lote, _registro_marc)
+
+
+def _procesar_lotes(analizar: Callable, lotes: Iterator[list], trabajadores: int) -> Iterator:
+    """
+    Aplica `analizar` a cada lote conservando el orden. Con varios trabajadores
+    se mantiene una ventana acotada de lotes en vuelo, así la memoria no crece
+    con el tamaño del archivo.
+    """
+    if trabajadores <= 1:
+        yield from map(analizar, lotes)
+        return
+    with ProcessPoolExecutor(max_workers=trabajadores) as grupo:
+        en_vuelo = deque()
+        for lote in lotes:
+            en_vuelo.append(grupo.submit(analizar, lote))
+            if len(en_vuelo) >= 2 * trabajadores:
+                yield en_vuelo.popleft().result()
+        while en_vuelo:
+            yield en_vuelo.popleft().result()
+
+
 # --------- DEMO mínima para que "salga algo" al ejecutar ---------
 if __name__ == "__main__":
+    # Ejecutado como script, las clases se registran con el nombre del módulo: así la
+    # instantánea guarda Biblioteca_Digital.Libro (y no __main__.Libro) y otros scripts pueden cargarla
+    sys.modules.setdefault("Biblioteca_Digital", sys.modules[__name__])
+    for clase in (Libro, Usuario, ResultadoImportacion, Existencias, Biblioteca):
+        clase.__module__ = "Biblioteca_Digital"
+
     b = Biblioteca()
 
     # Usuarios (IDs únicos con set)
@@ -180,15 +814,24 @@ if __name__ == "__main__":
     b.anadir_libro(Libro("Python fácil", "Guido", "Programación", "ISBN-002"))
     b.anadir_libro(Libro("Cien años de soledad", "García Márquez", "Realismo mágico", "ISBN-003"))
 
+    # Ejemplares (varias copias del mismo ISBN en distintas sucursales)
+    b.anadir_ejemplares("ISBN-003", 2, "Norte")
+    print("Disponibles ISBN-003:", b.disponibles("ISBN-003"))
+
     # Buscar (título / autor / categoría)
     print("Buscar 'python':", b.buscar(titulo="python"))
     print("Buscar autor 'cerv':", b.buscar(autor="cerv"))
     print("Buscar categoría 'Novela':", b.buscar(categoria="novela"))
+    print("Facetas de categoría:", dict(b.facetas()["categoria"]))
 
     # Prestar / Listar / Devolver
     print("Prestar ISBN-003 a U001:", b.prestar_libro("ISBN-003", "U001"))
     print("Prestados de U001:", b.listar_prestados_usuario("U001"))
+    print("Prestar ISBN-003 a U002:", b.prestar_libro("ISBN-003", "U002"))
+    print("Buscar 'soledad' (con disponibles):", b.buscar_con_disponibilidad(titulo="soledad"))
     print("Prestados global:", b.listar_prestados())
+    print("Más prestados del mes:", b.mas_prestados(3))
+    print("Prestatarios activos:", len(b.prestatarios_activos()))
     print("Devolver ISBN-003 de U001:", b.devolver_libro("ISBN-003", "U001"))
     print("Prestados global tras devolver:", b.listar_prestados())
 
@@ -200,3 +843,24 @@ if __name__ == "__main__":
     for mov in b.historial:
         print(mov)
 
+    # Persistencia: instantánea + diario, y reinicio en caliente
+    import tempfile
+    with tempfile.TemporaryDirectory() as carpeta:
+        # Importación masiva desde CSV (ISBN-001 ya existe: se cuenta como duplicado)
+        ruta_csv = os.path.join(carpeta, "catalogo.csv")
+        with open(ruta_csv, "w", encoding="utf-8") as f:
+            f.write("titulo,autor,categoria,isbn,ejemplares\n")
+            f.write("El Quijote,Cervantes,Novela,ISBN-001,1\n")
+            for i in range(4, 1000):
+                f.write(f"Libro {i},Autor {i % 7},Ensayo,ISBN-{i:03d},2\n")
+        print("\nImportación:", b.importar_catalogo(ruta_csv, trabajadores=1))
+        print("Buscar autor 'autor 3' y título 'libro 1':", len(b.buscar(titulo="libro 1", autor="autor 3")))
+
+        b.activar_persistencia(carpeta)
+        b.registrar_usuario("Marta", "U003")
+        b.prestar_libro("ISBN-001", "U003")
+        b.cerrar()
+        recuperada = Biblioteca.cargar(carpeta)
+        print("\nTras reiniciar, prestados global:", recuperada.listar_prestados())
+        recuperada.cerrar()
+
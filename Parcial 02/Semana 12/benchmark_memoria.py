@@ -0,0 +1,62 @@
+# ==========================================
+# BENCHMARK DE MEMORIA DEL CATÁLOGO
+# ==========================================
+# Compara la huella por registro de Libro antes (atributos en __dict__, cadenas
+# repetidas sin compartir) y después (__slots__ + autor/categoría internados).
+#
+# Uso: python benchmark_memoria.py [cantidad_de_libros]   (por defecto 1.000.000)
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from Biblioteca_Digital import Libro
+
+CATEGORIAS = 40
+AUTORES = 20000
+
+
+class LibroAnterior:
+    """
+    Réplica del Libro original: __dict__ por instancia y sin internar cadenas.
+    """
+    def __init__(self, titulo: str, autor: str, categoria: str, isbn: str):
+        self.autor_titulo = (autor, titulo)
+        self.categoria = categoria
+        self.isbn = isbn
+
+
+def generar_registros(cantidad: int):
+    # Las cadenas se construyen en cada registro, como si vinieran de un archivo
+    for i in range(cantidad):
+        yield (f"Título {i}", f"Autor {i % AUTORES}", f"Categoría {i % CATEGORIAS}", f"ISBN-{i:09d}")
+
+
+def medir(clase, cantidad: int):
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    catalogo = [clase(*registro) for registro in generar_registros(cantidad)]
+    segundos = time.perf_counter() - inicio
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalogo
+    return actual, segundos
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Libros: {cantidad:,}")
+    print(f"{'Versión':<28}{'MB totales':>12}{'bytes/libro':>14}{'segundos':>10}")
+    resultados = {}
+    for nombre, clase in (("Antes (__dict__)", LibroAnterior), ("Después (__slots__ + intern)", Libro)):
+        total, segundos = medir(clase, cantidad)
+        resultados[nombre] = total
+        print(f"{nombre:<28}{total / 1e6:>12.1f}{total / cantidad:>14.1f}{segundos:>10.2f}")
+    antes, despues = resultados.values()
+    print(f"Ahorro: {100 * (1 - despues / antes):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
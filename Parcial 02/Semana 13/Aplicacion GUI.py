@@ -1,50 +1,170 @@
 from tkinter import *
 from tkinter import ttk
 
-# Función para agregar datos
-def agregar_dato():
-    dato = entrada.get()
-    if dato:
-        lista_datos.insert(END, dato)
-        tabla.insert("", END, values=(dato,))
-        entrada.delete(0, END)
-
-# Función para limpiar datos
-def limpiar_datos():
-    entrada.delete(0, END)
-    lista_datos.delete(0, END)
-    for item in tabla.get_children():
-        tabla.delete(item)
-
-# Ventana principal
-ventana = Tk()
-ventana.title("Aplicación GUI Básica")
-ventana.geometry("400x400")
-
-# Etiqueta
-etiqueta = Label(ventana, text="Ingresa un dato:")
-etiqueta.pack(pady=5)
-
-# Campo de texto
-entrada = Entry(ventana)
-entrada.pack(pady=5)
-
-# Botón Agregar
-boton_agregar = Button(ventana, text="Agregar", bg="#a6d8e7", command=agregar_dato)
-boton_agregar.pack(pady=5)
-
-# Botón Limpiar
-boton_limpiar = Button(ventana, text="Limpiar", bg="#f7b0b0", command=limpiar_datos)
-boton_limpiar.pack(pady=5)
-
-# Lista de datos
-lista_datos = Listbox(ventana)
-lista_datos.pack(pady=5)
-
-# Tabla para mostrar datos
-tabla = ttk.Treeview(ventana, columns=("Dato"), show="headings")
-tabla.heading("Dato", text="Dato")
-tabla.pack(pady=5)
+# ==========================================
+# MODELO DE DATOS COMPARTIDO
+# ==========================================
+# La lista y la tabla ya no se alimentan por separado: ambas reflejan el mismo
+# modelo y reciben los cambios por lotes, así pegar o importar miles de líneas
+# cuesta unas pocas llamadas a Tk en lugar de dos por dato.
+
+AGREGAR = "agregar"  # (AGREGAR, lista de datos nuevos)
+LIMPIAR = "limpiar"  # (LIMPIAR, None)
+
+TAM_LOTE = 2000  # filas que se insertan en la tabla por cada vuelta del bucle de Tk
+
+
+class ModeloDatos:
+    def __init__(self):
+        self._datos = []
+        self._oyentes = []
+
+    def suscribir(self, oyente):
+        self._oyentes.append(oyente)
+
+    def _notificar(self, accion, datos):
+        for oyente in self._oyentes:
+            oyente(accion, datos)
+
+    def __len__(self):
+        return len(self._datos)
+
+    def agregar_lote(self, datos):
+        datos = [d for d in datos if d]
+        if datos:
+            self._datos.extend(datos)
+            self._notificar(AGREGAR, datos)
+
+    def limpiar(self):
+        self._datos.clear()
+        self._notificar(LIMPIAR, None)
+
+
+class VistaLista:
+    """
+    Listbox: insert() acepta muchos valores en una sola llamada.
+    """
+    def __init__(self, lista, modelo):
+        self.lista = lista
+        modelo.suscribir(self.aplicar)
+
+    def aplicar(self, accion, datos):
+        if accion == AGREGAR:
+            self.lista.insert(END, *datos)
+        elif accion == LIMPIAR:
+            self.lista.delete(0, END)
+
+
+class VistaTabla:
+    """
+    Treeview: inserta fila a fila, así que los lotes grandes se reparten en
+    tandas de TAM_LOTE con after(); la ventana se redibuja entre tandas.
+    """
+    def __init__(self, tabla, modelo):
+        self.tabla = tabla
+        self._pendientes = []
+        self._programado = None
+        modelo.suscribir(self.aplicar)
+
+    def aplicar(self, accion, datos):
+        if accion == AGREGAR:
+            self._pendientes.extend(datos)
+            if self._programado is None:
+                self._programado = self.tabla.after_idle(self._volcar)
+        elif accion == LIMPIAR:
+            if self._programado is not None:
+                self.tabla.after_cancel(self._programado)
+                self._programado = None
+            self._pendientes = []
+            # Una sola orden de Tk borra todas las filas
+            self.tabla.delete(*self.tabla.get_children())
+
+    def _volcar(self):
+        tanda, self._pendientes = self._pendientes[:TAM_LOTE], self._pendientes[TAM_LOTE:]
+        for dato in tanda:
+            self.tabla.insert("", END, values=(dato,))
+        self._programado = self.tabla.after(1, self._volcar) if self._pendientes else None
+
+
+class AplicacionGUI:
+    """
+    Ventana de la app: se puede construir sobre cualquier Tk (p. ej. desde el arnés
+    de rendimiento) sin que arranque el bucle de eventos.
+    """
+    def __init__(self, ventana):
+        self.ventana = ventana
+        ventana.title("Aplicación GUI Básica")
+        ventana.geometry("400x400")
+
+        # Etiqueta
+        etiqueta = Label(ventana, text="Ingresa un dato:")
+        etiqueta.pack(pady=5)
+
+        # Campo de texto
+        self.entrada = Entry(ventana)
+        self.entrada.pack(pady=5)
+        self.entrada.bind("<<Paste>>", self.pegar)
+
+        # Botón Agregar
+        boton_agregar = Button(ventana, text="Agregar", bg="#a6d8e7", command=self.agregar_dato)
+        boton_agregar.pack(pady=5)
+
+        # Botón Importar
+        boton_importar = Button(ventana, text="Importar...", bg="#c9e7a6", command=self.importar_datos)
+        boton_importar.pack(pady=5)
+
+        # Botón Limpiar
+        boton_limpiar = Button(ventana, text="Limpiar", bg="#f7b0b0", command=self.limpiar_datos)
+        boton_limpiar.pack(pady=5)
+
+        # Lista de datos
+        self.lista_datos = Listbox(ventana)
+        self.lista_datos.pack(pady=5)
+
+        # Tabla para mostrar datos
+        self.tabla = ttk.Treeview(ventana, columns=("Dato"), show="headings")
+        self.tabla.heading("Dato", text="Dato")
+        self.tabla.pack(pady=5)
+
+        # Modelo compartido por la lista y la tabla
+        self.datos = ModeloDatos()
+        VistaLista(self.lista_datos, self.datos)
+        self.vista_tabla = VistaTabla(self.tabla, self.datos)
+
+    # Función para agregar datos
+    def agregar_dato(self):
+        dato = self.entrada.get()
+        if dato:
+            self.datos.agregar_lote([dato])
+            self.entrada.delete(0, END)
+
+    # Pegar un texto con varias líneas agrega un dato por línea
+    def pegar(self, event):
+        try:
+            texto = self.ventana.clipboard_get()
+        except TclError:
+            return None
+        if "\n" not in texto.strip():
+            return None  # pegado normal dentro del campo
+        self.datos.agregar_lote(linea.strip() for linea in texto.splitlines())
+        return "break"
+
+    # Importar un archivo de texto (un dato por línea)
+    def importar_datos(self):
+        from tkinter import filedialog  # solo hace falta al importar
+        ruta = filedialog.askopenfilename(filetypes=[("Texto", "*.txt"), ("Todos", "*.*")])
+        if ruta:
+            with open(ruta, "r", encoding="utf-8") as archivo:
+                self.datos.agregar_lote(linea.strip() for linea in archivo)
+
+    # Función para limpiar datos
+    def limpiar_datos(self):
+        self.entrada.delete(0, END)
+        self.datos.limpiar()
+
 
 # Ejecutar la app
-ventana.mainloop()
+if __name__ == "__main__":
+    ventana = Tk()
+    AplicacionGUI(ventana)
+    ventana.mainloop()
@@ -1,71 +1,307 @@
+import os
+from bisect import bisect_left
+from datetime import date
+from itertools import islice
 from tkinter import *
-from tkinter import ttk
-from tkcalendar import DateEntry
-
-# Función para agregar evento
-def agregar_evento():
-    fecha = campo_fecha.get()
-    hora = campo_hora.get()
-    descripcion = campo_desc.get()
-    if fecha and hora and descripcion:
-        tabla.insert("", END, values=(fecha, hora, descripcion))
-        actualizar_total()
-        campo_hora.delete(0, END)
-        campo_desc.delete(0, END)
-
-# Función para eliminar evento seleccionado
-def eliminar_evento():
-    seleccionado = tabla.selection()
-    for item in seleccionado:
-        tabla.delete(item)
-    actualizar_total()
-
-# Función para actualizar el total de eventos
-def actualizar_total():
-    total = len(tabla.get_children())
-    etiqueta_total.config(text=f"Total de eventos: {total}")
-
-# Crear ventana principal
-ventana = Tk()
-ventana.title("Agenda Personal")
-ventana.geometry("500x500")
-
-# Frame de entrada de datos
-frame_entrada = Frame(ventana)
-frame_entrada.pack(pady=10)
-
-Label(frame_entrada, text="Fecha:").grid(row=0, column=0)
-campo_fecha = DateEntry(frame_entrada, date_pattern='dd/mm/yyyy')
-campo_fecha.grid(row=0, column=1)
-
-Label(frame_entrada, text="Hora:").grid(row=1, column=0)
-campo_hora = Entry(frame_entrada)
-campo_hora.grid(row=1, column=1)
-
-Label(frame_entrada, text="Descripción:").grid(row=2, column=0)
-campo_desc = Entry(frame_entrada)
-campo_desc.grid(row=2, column=1)
-
-# Botones
-frame_botones = Frame(ventana)
-frame_botones.pack(pady=10)
-
-Button(frame_botones, text="Agregar Evento", bg="#a6d8e7", command=agregar_evento).grid(row=0, column=0, padx=5)
-Button(frame_botones, text="Eliminar Evento Seleccionado", bg="#f7b0b0", command=eliminar_evento).grid(row=0, column=1, padx=5)
-Button(frame_botones, text="Salir", bg="#d3d3d3", command=ventana.quit).grid(row=0, column=2, padx=5)
-
-# Tabla de eventos
-tabla = ttk.Treeview(ventana, columns=("Fecha", "Hora", "Descripción"), show="headings")
-tabla.heading("Fecha", text="Fecha")
-tabla.heading("Hora", text="Hora")
-tabla.heading("Descripción", text="Descripción")
-tabla.pack(pady=10)
-
-# Etiqueta de total de eventos
-etiqueta_total = Label(ventana, text="Total de eventos: 0")
-etiqueta_total.pack()
+from tkinter import messagebox, ttk
+from campo_fecha import CampoFecha
+from modelo_agenda import (FORMATO_FECHA, ModeloEventos, ReglaRecurrencia, iid_ocurrencia,
+                           leer_fecha, normalizar_hora)
+from almacen_agenda import AlmacenAgenda, escribir_ics, leer_ics
 
-# Ejecutar la app
-ventana.mainloop()
+# Opciones de repetición del formulario -> frecuencia de la regla
+REPETICIONES = {"No se repite": None, "Cada día": "DIARIA", "Cada semana": "SEMANAL", "Cada mes": "MENSUAL"}
+
+# Archivo SQLite con los eventos guardados
+ARCHIVO_AGENDA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "agenda.db")
+# Eventos (o filas de la tabla) procesados por cada vuelta del bucle de Tk
+TAM_LOTE = 1000
+
+
+class AgendaPersonal:
+    """
+    Ventana de la app: se puede construir sobre cualquier Tk (p. ej. desde el arnés
+    de rendimiento, con otra ruta de almacén) sin que arranque el bucle de eventos.
+    """
+    def __init__(self, ventana, ruta=ARCHIVO_AGENDA):
+        self.ventana = ventana
+        ventana.title("Agenda Personal")
+        ventana.geometry("500x600")
+
+        # Almacén persistente: se escribe en cada alta o baja
+        self.almacen = AlmacenAgenda(ruta)
+
+        # Modelo de eventos ordenado por (fecha, hora); la tabla solo refleja sus cambios
+        self.eventos = ModeloEventos()
+        # Los id nuevos no deben chocar con los guardados, aunque la carga aún no haya terminado
+        self.eventos.reservar_ids(self.almacen.ultimo_id())
+        # Claves (fecha, hora, id) de las filas de la tabla, en el mismo orden
+        self.claves_visibles = []
+        # Relleno de la tabla en curso (se hace por lotes); None si no hay ninguno
+        self.relleno_actual = None
+        # True mientras se cargan o importan eventos por lotes (ver poner_cargando)
+        self.cargando = False
+        # Ventana de fechas visible: por defecto, el año en curso
+        hoy = date.today()
+        self.ventana_fechas = [date(hoy.year, 1, 1), date(hoy.year, 12, 31)]
+
+        # Frame de entrada de datos
+        frame_entrada = Frame(ventana)
+        frame_entrada.pack(pady=10)
+
+        Label(frame_entrada, text="Fecha:").grid(row=0, column=0)
+        # Entry con calendario bajo demanda (tkcalendar se importa al abrirlo por primera vez)
+        self.campo_fecha = CampoFecha(frame_entrada)
+        self.campo_fecha.grid(row=0, column=1, sticky="w")
+
+        Label(frame_entrada, text="Hora:").grid(row=1, column=0)
+        self.campo_hora = Entry(frame_entrada)
+        self.campo_hora.grid(row=1, column=1)
+
+        Label(frame_entrada, text="Descripción:").grid(row=2, column=0)
+        self.campo_desc = Entry(frame_entrada)
+        self.campo_desc.grid(row=2, column=1)
+
+        Label(frame_entrada, text="Repetir:").grid(row=3, column=0)
+        self.repeticion = StringVar(value="No se repite")
+        OptionMenu(frame_entrada, self.repeticion, *REPETICIONES).grid(row=3, column=1, sticky="ew")
+
+        Label(frame_entrada, text="Veces (vacío = sin fin):").grid(row=4, column=0)
+        self.campo_veces = Entry(frame_entrada)
+        self.campo_veces.grid(row=4, column=1)
+
+        # Frame de la ventana de fechas visible en la tabla
+        frame_ventana = Frame(ventana)
+        frame_ventana.pack()
+        Label(frame_ventana, text="Ver desde:").pack(side=LEFT)
+        self.campo_desde = Entry(frame_ventana, width=11)
+        self.campo_desde.insert(0, self.ventana_fechas[0].strftime(FORMATO_FECHA))
+        self.campo_desde.pack(side=LEFT)
+        Label(frame_ventana, text="hasta:").pack(side=LEFT)
+        self.campo_hasta = Entry(frame_ventana, width=11)
+        self.campo_hasta.insert(0, self.ventana_fechas[1].strftime(FORMATO_FECHA))
+        self.campo_hasta.pack(side=LEFT)
+        boton_mostrar = Button(frame_ventana, text="Mostrar", command=self.mostrar_ventana)
+        boton_mostrar.pack(side=LEFT, padx=5)
+
+        # Botones
+        frame_botones = Frame(ventana)
+        frame_botones.pack(pady=10)
+
+        boton_agregar = Button(frame_botones, text="Agregar Evento", bg="#a6d8e7", command=self.agregar_evento)
+        boton_agregar.grid(row=0, column=0, padx=5)
+        boton_eliminar = Button(frame_botones, text="Eliminar Evento Seleccionado", bg="#f7b0b0", command=self.eliminar_evento)
+        boton_eliminar.grid(row=0, column=1, padx=5)
+        Button(frame_botones, text="Salir", bg="#d3d3d3", command=self.cerrar_app).grid(row=0, column=2, padx=5)
+        boton_importar = Button(frame_botones, text="Importar .ics", command=self.importar_ics)
+        boton_importar.grid(row=1, column=0, padx=5, pady=5)
+        boton_exportar = Button(frame_botones, text="Exportar .ics", command=self.exportar_ics)
+        boton_exportar.grid(row=1, column=1, padx=5, pady=5)
+        # Botones que cambian o leen todos los eventos: se desactivan durante una carga
+        self.botones_datos = [boton_mostrar, boton_agregar, boton_eliminar, boton_importar, boton_exportar]
+
+        # Tabla de eventos
+        self.tabla = ttk.Treeview(ventana, columns=("Fecha", "Hora", "Descripción"), show="headings")
+        self.tabla.heading("Fecha", text="Fecha")
+        self.tabla.heading("Hora", text="Hora")
+        self.tabla.heading("Descripción", text="Descripción")
+        self.tabla.pack(pady=10)
+
+        # Etiqueta de total de eventos
+        self.etiqueta_total = Label(ventana, text="Total de eventos: 0")
+        self.etiqueta_total.pack()
+        self.etiqueta_proximo = Label(ventana, text="Próximo: -")
+        self.etiqueta_proximo.pack()
+
+        ventana.protocol("WM_DELETE_WINDOW", self.cerrar_app)
+        # Cargar lo guardado sin retrasar la aparición de la ventana
+        ventana.after_idle(self.cargar_guardados)
 
+    # Función para leer la regla de repetición del formulario
+    def leer_regla(self):
+        frecuencia = REPETICIONES[self.repeticion.get()]
+        if frecuencia is None:
+            return None
+        veces = self.campo_veces.get().strip()
+        return ReglaRecurrencia(frecuencia, cuenta=int(veces) if veces else None)
 
+    # Función para agregar evento
+    def agregar_evento(self):
+        if self.cargando:
+            return
+        fecha = self.campo_fecha.get()
+        hora = self.campo_hora.get()
+        descripcion = self.campo_desc.get()
+        if fecha and hora and descripcion:
+            try:
+                evento, posicion = self.eventos.agregar(
+                    leer_fecha(fecha), normalizar_hora(hora), descripcion, self.leer_regla())
+            except ValueError as e:
+                messagebox.showerror("Dato no válido", str(e))
+                return
+            self.almacen.guardar([evento])
+            if evento.regla or self.relleno_actual is not None:
+                # Una serie puede aportar varias filas: se regenera solo la ventana visible
+                self.mostrar_ventana()
+            elif self.ventana_fechas[0] <= evento.fecha <= self.ventana_fechas[1]:
+                # Inserción en su posición ordenada; el iid de la fila es el id del evento
+                posicion = bisect_left(self.claves_visibles, evento.clave)
+                self.claves_visibles.insert(posicion, evento.clave)
+                self.tabla.insert("", posicion, iid=str(evento.id), values=evento.valores())
+            self.actualizar_total()
+            self.campo_hora.delete(0, END)
+            self.campo_desc.delete(0, END)
+
+    # Función para eliminar evento seleccionado (en un evento recurrente, toda la serie)
+    def eliminar_evento(self):
+        if self.cargando:
+            return
+        seleccionado = self.tabla.selection()
+        hay_series = False
+        for item in seleccionado:
+            id_evento = int(item.split("@")[0])
+            if "@" in item:
+                hay_series = True
+                if id_evento in self.eventos:  # varias filas de la misma serie
+                    self.eventos.eliminar(id_evento)
+                    self.almacen.borrar(id_evento)
+            else:
+                clave = self.eventos.evento(id_evento).clave
+                self.eventos.eliminar(id_evento)
+                self.almacen.borrar(id_evento)
+                del self.claves_visibles[bisect_left(self.claves_visibles, clave)]
+        if hay_series or self.relleno_actual is not None:
+            self.mostrar_ventana()
+        else:
+            self.tabla.delete(*seleccionado)
+        self.actualizar_total()
+
+    # Función para mostrar en la tabla las filas de la ventana de fechas elegida.
+    # Las filas se insertan por lotes con after(), así una ventana enorme no congela la app.
+    def mostrar_ventana(self):
+        try:
+            self.ventana_fechas[:] = [leer_fecha(self.campo_desde.get()), leer_fecha(self.campo_hasta.get())]
+        except ValueError:
+            messagebox.showerror("Dato no válido", "Las fechas deben tener el formato dd/mm/aaaa.")
+            return
+        self.tabla.delete(*self.tabla.get_children())
+        self.claves_visibles.clear()
+        self.relleno_actual = self.eventos.ocurrencias(*self.ventana_fechas)
+        self.rellenar_tabla(self.relleno_actual)
+
+    def rellenar_tabla(self, ocurrencias):
+        if ocurrencias is not self.relleno_actual:
+            return  # se empezó otro relleno: este se abandona
+        lote = list(islice(ocurrencias, TAM_LOTE))
+        for ocurrencia in lote:
+            clave, evento, fecha = ocurrencia
+            self.claves_visibles.append(clave)
+            self.tabla.insert("", END, iid=iid_ocurrencia(ocurrencia), values=evento.valores(fecha))
+        if len(lote) == TAM_LOTE:
+            self.ventana.after(1, self.rellenar_tabla, ocurrencias)
+        else:
+            self.relleno_actual = None
+
+    # Función para marcar el inicio o el fin de una carga: mientras dura, los botones
+    # de datos quedan desactivados (la tabla y el modelo aún no están completos)
+    def poner_cargando(self, cargando):
+        self.cargando = cargando
+        for boton in self.botones_datos:
+            boton.config(state=DISABLED if cargando else NORMAL)
+
+    # Función para procesar un iterador por lotes sin bloquear la ventana.
+    # Si un lote falla, la carga se da por terminada y se avisa con al_fallar(error)
+    def procesar_por_lotes(self, elementos, procesar, al_terminar, al_fallar=None):
+        if not self.cargando:
+            self.poner_cargando(True)
+        try:
+            lote = list(islice(elementos, TAM_LOTE))
+            if lote:
+                procesar(lote)
+        except Exception as e:
+            self.poner_cargando(False)
+            if al_fallar is not None:
+                al_fallar(e)
+            else:
+                self.terminar_carga()
+                messagebox.showerror("Error al cargar", str(e))
+            return
+        if lote:
+            self.etiqueta_total.config(text=f"Cargando... {self.eventos.total} eventos")
+            self.ventana.after(1, self.procesar_por_lotes, elementos, procesar, al_terminar, al_fallar)
+        else:
+            self.poner_cargando(False)
+            al_terminar()
+
+    # Función para cargar los eventos guardados al iniciar
+    def cargar_guardados(self):
+        def incorporar(lote):
+            for evento in lote:
+                self.eventos.incorporar(evento)
+        self.procesar_por_lotes(self.almacen.leer(), incorporar, self.terminar_carga)
+
+    def terminar_carga(self):
+        self.mostrar_ventana()
+        self.actualizar_total()
+
+    # Función para importar un archivo .ics (se lee en flujo y se guarda por lotes)
+    def importar_ics(self):
+        if self.cargando:
+            return
+        from tkinter import filedialog  # solo hace falta al importar o exportar
+        ruta = filedialog.askopenfilename(filetypes=[("iCalendar", "*.ics"), ("Todos", "*.*")])
+        if ruta:
+            self.importar_desde(ruta)
+
+    def importar_desde(self, ruta):
+        try:
+            archivo = open(ruta, "r", encoding="utf-8")
+        except OSError as e:
+            messagebox.showerror("Importación", f"No se pudo abrir el archivo: {e}")
+            return
+        errores = []
+
+        def guardar_lote(lote):
+            self.almacen.guardar([self.eventos.agregar(*campos)[0] for campos in lote])
+
+        def terminar():
+            archivo.close()
+            self.terminar_carga()
+            if errores:
+                messagebox.showwarning("Importación", f"Se omitieron {len(errores)} eventos no válidos.")
+
+        def fallar(error):
+            # Los lotes anteriores al error ya quedaron guardados
+            archivo.close()
+            self.terminar_carga()
+            messagebox.showerror("Importación", f"La importación se detuvo: {error}")
+        self.procesar_por_lotes(leer_ics(archivo, errores), guardar_lote, terminar, fallar)
+
+    # Función para exportar todos los eventos a .ics (en flujo desde el almacén)
+    def exportar_ics(self):
+        from tkinter import filedialog
+        ruta = filedialog.asksaveasfilename(defaultextension=".ics", filetypes=[("iCalendar", "*.ics")])
+        if not ruta:
+            return
+        with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+            escritos = escribir_ics(archivo, self.almacen.leer())
+        messagebox.showinfo("Exportación", f"Se exportaron {escritos} eventos.")
+
+    # Función para actualizar el total de eventos y el próximo evento
+    def actualizar_total(self):
+        self.etiqueta_total.config(text=f"Total de eventos: {self.eventos.total}")
+        proximo = self.eventos.proximo()
+        texto = f"Próximo: {' '.join(proximo[0].valores(proximo[1]))}" if proximo else "Próximo: -"
+        self.etiqueta_proximo.config(text=texto)
+
+    # Función para cerrar la app y el almacén
+    def cerrar_app(self):
+        self.almacen.cerrar()
+        self.ventana.destroy()
+
+
+# Ejecutar la app
+if __name__ == "__main__":
+    ventana = Tk()
+    AgendaPersonal(ventana)
+    ventana.mainloop()
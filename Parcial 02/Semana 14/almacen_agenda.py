@@ -0,0 +1,192 @@
+# ==========================================
+# ALMACÉN DE LA AGENDA (SQLite) E IMPORTACIÓN/EXPORTACIÓN iCalendar
+# ==========================================
+# - Los eventos se guardan en SQLite con un índice por (fecha, hora), así las
+#   lecturas salen ya ordenadas y por rangos sin ordenar en memoria.
+# - Los archivos .ics se leen y escriben línea a línea (generadores): un
+#   calendario enorme nunca se carga entero en memoria.
+
+import sqlite3
+from datetime import date, datetime, timezone
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from modelo_agenda import Evento, ReglaRecurrencia
+
+# Campos de un evento leído de un .ics: (fecha, hora, descripcion, regla)
+CamposEvento = Tuple[date, str, str, Optional[ReglaRecurrencia]]
+
+FRECUENCIAS_ICS = {"DAILY": "DIARIA", "WEEKLY": "SEMANAL", "MONTHLY": "MENSUAL"}
+LARGO_LINEA_ICS = 75  # octetos por línea antes de plegar (RFC 5545)
+
+
+class AlmacenAgenda:
+    """
+    Eventos de la agenda en SQLite. Las series recurrentes se guardan una vez, con su regla.
+    """
+    def __init__(self, ruta: str):
+        self.conexion = sqlite3.connect(ruta)
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        self.conexion.execute(
+            "CREATE TABLE IF NOT EXISTS eventos ("
+            "id INTEGER PRIMARY KEY, fecha TEXT NOT NULL, hora TEXT NOT NULL, descripcion TEXT NOT NULL, "
+            "frecuencia TEXT, intervalo INTEGER, hasta TEXT, cuenta INTEGER)")
+        self.conexion.execute("CREATE INDEX IF NOT EXISTS idx_eventos_fecha ON eventos (fecha, hora)")
+        self.conexion.commit()
+
+    def ultimo_id(self) -> int:
+        return self.conexion.execute("SELECT COALESCE(MAX(id), 0) FROM eventos").fetchone()[0]
+
+    def guardar(self, eventos: Iterable[Evento]) -> None:
+        """
+        Inserta o reemplaza un lote de eventos en una sola transacción.
+        """
+        filas = []
+        for e in eventos:
+            regla = e.regla
+            filas.append((e.id, e.fecha.isoformat(), e.hora, e.descripcion,
+                          regla.frecuencia if regla else None,
+                          regla.intervalo if regla else None,
+                          regla.hasta.isoformat() if regla and regla.hasta else None,
+                          regla.cuenta if regla else None))
+        with self.conexion:
+            self.conexion.executemany("INSERT OR REPLACE INTO eventos VALUES (?, ?, ?, ?, ?, ?, ?, ?)", filas)
+
+    def borrar(self, id_evento: int) -> None:
+        with self.conexion:
+            self.conexion.execute("DELETE FROM eventos WHERE id = ?", (id_evento,))
+
+    def leer(self, desde: Optional[date] = None, hasta: Optional[date] = None) -> Iterator[Evento]:
+        """
+        Genera los eventos ordenados por (fecha, hora) usando el índice.
+        Con rango: los eventos únicos de [desde, hasta] y las series que empiezan antes de `hasta`.
+        """
+        consulta = "SELECT * FROM eventos"
+        parametros: tuple = ()
+        if desde is not None and hasta is not None:
+            consulta += " WHERE (fecha BETWEEN ? AND ?) OR (frecuencia IS NOT NULL AND fecha <= ?)"
+            parametros = (desde.isoformat(), hasta.isoformat(), hasta.isoformat())
+        cursor = self.conexion.execute(consulta + " ORDER BY fecha, hora", parametros)
+        for id_evento, fecha, hora, descripcion, frecuencia, intervalo, fin, cuenta in cursor:
+            regla = None
+            if frecuencia:
+                regla = ReglaRecurrencia(frecuencia, intervalo, date.fromisoformat(fin) if fin else None, cuenta)
+            yield Evento(id_evento, date.fromisoformat(fecha), hora, descripcion, regla)
+
+    def cerrar(self) -> None:
+        self.conexion.close()
+
+
+# ---------- iCalendar (.ics) ----------
+def _lineas_desplegadas(archivo: TextIO) -> Iterator[str]:
+    # Una línea que empieza con espacio o tabulador continúa la anterior
+    anterior = None
+    for linea in archivo:
+        linea = linea.rstrip("\r\n")
+        if linea[:1] in (" ", "\t") and anterior is not None:
+            anterior += linea[1:]
+            continue
+        if anterior is not None:
+            yield anterior
+        anterior = linea
+    if anterior is not None:
+        yield anterior
+
+
+def _desescapar(texto: str) -> str:
+    resultado, i = [], 0
+    while i < len(texto):
+        if texto[i] == "\\" and i + 1 < len(texto):
+            siguiente = texto[i + 1]
+            resultado.append("\n" if siguiente in "nN" else siguiente)
+            i += 2
+        else:
+            resultado.append(texto[i])
+            i += 1
+    return "".join(resultado)
+
+
+def _escapar(texto: str) -> str:
+    return (texto.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\n", "\\n"))
+
+
+def _leer_fecha_hora(valor: str) -> Tuple[date, str]:
+    # 20260305, 20260305T100000 o 20260305T100000Z
+    fecha = date(int(valor[0:4]), int(valor[4:6]), int(valor[6:8]))
+    hora = f"{valor[9:11]}:{valor[11:13]}" if "T" in valor else "00:00"
+    return fecha, hora
+
+
+def _leer_regla(valor: str) -> ReglaRecurrencia:
+    partes = dict(p.split("=", 1) for p in valor.split(";") if "=" in p)
+    if partes.get("FREQ") not in FRECUENCIAS_ICS:
+        raise ValueError(f"Frecuencia no soportada: {partes.get('FREQ')}")
+    hasta = _leer_fecha_hora(partes["UNTIL"])[0] if "UNTIL" in partes else None
+    cuenta = int(partes["COUNT"]) if "COUNT" in partes else None
+    return ReglaRecurrencia(FRECUENCIAS_ICS[partes["FREQ"]], int(partes.get("INTERVAL", 1)), hasta, cuenta)
+
+
+def leer_ics(archivo: TextIO, errores: Optional[List[str]] = None) -> Iterator[CamposEvento]:
+    """
+    Genera (fecha, hora, descripcion, regla) por cada VEVENT, sin leer el archivo entero.
+    Los eventos que no se pueden interpretar se saltan (y se anotan en `errores`).
+    """
+    propiedades = None
+    for linea in _lineas_desplegadas(archivo):
+        if linea == "BEGIN:VEVENT":
+            propiedades = {}
+        elif linea == "END:VEVENT" and propiedades is not None:
+            try:
+                fecha, hora = _leer_fecha_hora(propiedades["DTSTART"])
+                regla = _leer_regla(propiedades["RRULE"]) if "RRULE" in propiedades else None
+                yield fecha, hora, _desescapar(propiedades.get("SUMMARY", "")), regla
+            except (KeyError, ValueError, IndexError) as e:
+                if errores is not None:
+                    errores.append(f"{propiedades.get('UID', '?')}: {e}")
+            propiedades = None
+        elif propiedades is not None and ":" in linea:
+            nombre, valor = linea.split(":", 1)
+            # Se ignoran los parámetros (DTSTART;TZID=...:valor)
+            propiedades[nombre.split(";", 1)[0].upper()] = valor
+
+
+def _plegar(linea: str) -> str:
+    codificada = linea.encode("utf-8")
+    if len(codificada) <= LARGO_LINEA_ICS:
+        return linea + "\r\n"
+    trozos, inicio = [], 0
+    while inicio < len(codificada):
+        fin = min(inicio + (LARGO_LINEA_ICS if not trozos else LARGO_LINEA_ICS - 1), len(codificada))
+        while fin < len(codificada) and (codificada[fin] & 0xC0) == 0x80:
+            fin -= 1  # no partir un carácter UTF-8 por la mitad
+        trozos.append(codificada[inicio:fin].decode("utf-8"))
+        inicio = fin
+    return "\r\n ".join(trozos) + "\r\n"
+
+
+def escribir_ics(archivo: TextIO, eventos: Iterable[Evento]) -> int:
+    """
+    Escribe los eventos en formato iCalendar a medida que llegan. Retorna cuántos escribió.
+    """
+    frecuencias = {v: k for k, v in FRECUENCIAS_ICS.items()}
+    sello = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    archivo.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Agenda Personal//ES\r\n")
+    escritos = 0
+    for e in eventos:
+        lineas = ["BEGIN:VEVENT",
+                  f"UID:{e.id}@agenda-personal",
+                  f"DTSTAMP:{sello}",
+                  f"DTSTART:{e.fecha.strftime('%Y%m%d')}T{e.hora.replace(':', '')}00",
+                  f"SUMMARY:{_escapar(e.descripcion)}"]
+        if e.regla:
+            regla = f"RRULE:FREQ={frecuencias[e.regla.frecuencia]};INTERVAL={e.regla.intervalo}"
+            if e.regla.hasta:
+                regla += f";UNTIL={e.regla.hasta.strftime('%Y%m%d')}"
+            if e.regla.cuenta:
+                regla += f";COUNT={e.regla.cuenta}"
+            lineas.append(regla)
+        lineas.append("END:VEVENT")
+        archivo.write("".join(_plegar(linea) for linea in lineas))
+        escritos += 1
+    archivo.write("END:VCALENDAR\r\n")
+    return escritos
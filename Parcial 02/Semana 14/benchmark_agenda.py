@@ -0,0 +1,108 @@
+# ==========================================
+# BENCHMARK DE IMPORTACIÓN / EXPORTACIÓN iCalendar
+# ==========================================
+# Genera un .ics sintético y mide, en segundos por cada 10.000 eventos:
+# - escritura del .ics en flujo
+# - lectura (análisis) del .ics en flujo
+# - importación al modelo + SQLite por lotes (como hace la app)
+# - exportación desde SQLite
+# - inserción por lotes en un ttk.Treeview (solo si hay pantalla; usar xvfb-run)
+#
+# Uso: python benchmark_agenda.py [cantidad_de_eventos]   (por defecto 100.000)
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+from almacen_agenda import AlmacenAgenda, escribir_ics, leer_ics
+from modelo_agenda import Evento, ModeloEventos, ReglaRecurrencia
+
+TAM_LOTE = 1000
+
+
+def eventos_sinteticos(cantidad: int):
+    inicio = date(2026, 1, 1)
+    for i in range(cantidad):
+        regla = ReglaRecurrencia("SEMANAL") if i % 100 == 0 else None
+        yield Evento(i + 1, inicio + timedelta(days=i % 730), f"{i % 24:02d}:{(i * 7) % 60:02d}",
+                     f"Evento {i}", regla)
+
+
+def lotes(iterable, tam):
+    iterador = iter(iterable)
+    while True:
+        lote = list(islice(iterador, tam))
+        if not lote:
+            return
+        yield lote
+
+
+def cronometrar(nombre, cantidad, funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<32}{segundos:>10.2f}{segundos * 10_000 / cantidad:>16.3f}")
+    return resultado
+
+
+def medir_treeview(modelo: ModeloEventos, cantidad: int) -> None:
+    from tkinter import END, Tk, TclError, ttk
+    try:
+        ventana = Tk()
+    except TclError:
+        print("(sin pantalla: se omite el Treeview; ejecutar con xvfb-run -a)")
+        return
+    tabla = ttk.Treeview(ventana, columns=("Fecha", "Hora", "Descripción"), show="headings")
+    tabla.pack()
+
+    def insertar():
+        for lote in lotes(modelo.ocurrencias(date(2026, 1, 1), date(2027, 12, 31)), TAM_LOTE):
+            for clave, evento, fecha in lote:
+                tabla.insert("", END, values=evento.valores(fecha))
+            ventana.update()  # lo que permite after() entre lotes en la app
+
+    cronometrar("Treeview (por lotes)", cantidad, insertar)
+    cronometrar("Treeview vaciar", cantidad, lambda: tabla.delete(*tabla.get_children()))
+    ventana.destroy()
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_ics = os.path.join(carpeta, "agenda.ics")
+        print(f"Eventos: {cantidad:,}")
+        print(f"{'Operación':<32}{'segundos':>10}{'s / 10k eventos':>16}")
+
+        def escribir():
+            with open(ruta_ics, "w", encoding="utf-8", newline="") as f:
+                escribir_ics(f, eventos_sinteticos(cantidad))
+        cronometrar("Escribir .ics", cantidad, escribir)
+
+        def leer():
+            with open(ruta_ics, "r", encoding="utf-8") as f:
+                return sum(1 for _ in leer_ics(f))
+        cronometrar("Leer .ics", cantidad, leer)
+
+        modelo = ModeloEventos()
+        almacen = AlmacenAgenda(os.path.join(carpeta, "agenda.db"))
+
+        def importar():
+            with open(ruta_ics, "r", encoding="utf-8") as f:
+                for lote in lotes(leer_ics(f), TAM_LOTE):
+                    almacen.guardar([modelo.agregar(*campos)[0] for campos in lote])
+        cronometrar("Importar (modelo + SQLite)", cantidad, importar)
+
+        def exportar():
+            with open(os.path.join(carpeta, "salida.ics"), "w", encoding="utf-8", newline="") as f:
+                escribir_ics(f, almacen.leer())
+        cronometrar("Exportar desde SQLite", cantidad, exportar)
+        almacen.cerrar()
+
+        medir_treeview(modelo, cantidad)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# ==========================================
+# CAMPO DE FECHA CON CALENDARIO BAJO DEMANDA
+# ==========================================
+# tkcalendar (y babel, que importa) tarda en cargar, y el DateEntry construye
+# su calendario emergente junto con el campo. Aquí la fecha se escribe en un
+# Entry normal; el calendario solo se importa y se construye la primera vez
+# que se abre, y después se reutiliza. Sin tkcalendar queda el Entry solo.
+
+import importlib.util
+from datetime import date
+from tkinter import Button, Entry, Frame, Toplevel
+
+from modelo_agenda import FORMATO_FECHA, leer_fecha
+
+# Se comprueba si está instalado sin importarlo
+HAY_TKCALENDAR = importlib.util.find_spec("tkcalendar") is not None
+
+
+class CampoFecha(Frame):
+    """
+    Entry con la fecha en dd/mm/aaaa (por defecto, hoy) y un botón que abre el calendario.
+    Tiene get(), delete() e insert() como un Entry, que es lo que usa la app.
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.entrada = Entry(self, width=12)
+        self.entrada.insert(0, date.today().strftime(FORMATO_FECHA))
+        self.entrada.pack(side="left")
+        self._emergente = None
+        self._calendario = None
+        if HAY_TKCALENDAR:
+            Button(self, text="📅", padx=2, pady=0, command=self.abrir_calendario).pack(side="left")
+
+    def get(self) -> str:
+        return self.entrada.get()
+
+    def delete(self, primero, ultimo=None) -> None:
+        self.entrada.delete(primero, ultimo)
+
+    def insert(self, indice, texto: str) -> None:
+        self.entrada.insert(indice, texto)
+
+    def abrir_calendario(self) -> None:
+        if self._emergente is None:
+            from tkcalendar import Calendar  # solo la primera vez que se abre
+            self._emergente = Toplevel(self)
+            self._emergente.withdraw()
+            self._emergente.title("Elegir fecha")
+            self._emergente.transient(self.winfo_toplevel())
+            self._emergente.protocol("WM_DELETE_WINDOW", self._emergente.withdraw)
+            self._calendario = Calendar(self._emergente, selectmode="day", date_pattern="dd/mm/yyyy")
+            self._calendario.pack()
+            self._calendario.bind("<<CalendarSelected>>", self._elegir)
+        try:
+            self._calendario.selection_set(leer_fecha(self.get()))
+        except ValueError:
+            pass  # fecha escrita a medias: el calendario conserva la anterior
+        x = self.entrada.winfo_rootx()
+        y = self.entrada.winfo_rooty() + self.entrada.winfo_height()
+        self._emergente.geometry(f"+{x}+{y}")
+        self._emergente.deiconify()
+        self._calendario.focus_set()
+
+    def _elegir(self, event) -> None:
+        self.entrada.delete(0, "end")
+        self.entrada.insert(0, self._calendario.get_date())
+        self._emergente.withdraw()
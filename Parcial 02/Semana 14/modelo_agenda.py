@@ -0,0 +1,328 @@
+# ==========================================
+# MODELO DE EVENTOS ORDENADO POR FECHA Y HORA
+# ==========================================
+# La agenda ya no depende de las filas del Treeview: los eventos viven en
+# una lista de claves (fecha, hora, id) siempre ordenada con bisect, así:
+# - la posición de inserción en la tabla se conoce en O(log N)
+# - el total se mantiene sin contar filas
+# - "eventos entre dos fechas" y "próximo evento" son búsquedas binarias
+# Los eventos recurrentes se guardan una sola vez (con su regla) y sus
+# ocurrencias se generan bajo demanda, solo para la ventana de fechas visible.
+
+import heapq
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+FORMATO_FECHA = "%d/%m/%Y"  # el mismo que usa el DateEntry de la app
+
+# Frecuencias admitidas (subconjunto de FREQ de RRULE) -> días por paso (None: por meses)
+FRECUENCIAS = {"DIARIA": 1, "SEMANAL": 7, "MENSUAL": None}
+
+# Ventanas (desde, hasta) cuyas series expandidas se guardan; al pasar de aquí sale la menos usada
+MAX_VENTANAS_CACHE = 64
+
+
+@dataclass(frozen=True)
+class ReglaRecurrencia:
+    """
+    Regla de repetición al estilo RRULE: FREQ, INTERVAL y, opcionalmente, UNTIL o COUNT.
+    Como en RRULE, una regla mensual salta los meses que no tienen ese día (p. ej. el 31).
+    """
+    frecuencia: str
+    intervalo: int = 1
+    hasta: Optional[date] = None
+    cuenta: Optional[int] = None
+
+    def __post_init__(self):
+        if self.frecuencia not in FRECUENCIAS:
+            raise ValueError(f"Frecuencia no soportada: '{self.frecuencia}'.")
+        if self.intervalo < 1 or (self.cuenta is not None and self.cuenta < 1):
+            raise ValueError("El intervalo y las repeticiones deben ser positivos.")
+
+    def fechas(self, inicio: date, desde: date, hasta: date) -> Iterator[date]:
+        """
+        Genera perezosamente las fechas de ocurrencia dentro de [desde, hasta].
+        Con frecuencia diaria o semanal salta directamente a la primera de la ventana.
+        """
+        if self.hasta is not None:
+            hasta = min(hasta, self.hasta)
+        dias = FRECUENCIAS[self.frecuencia]
+        if dias is not None:
+            paso = dias * self.intervalo
+            n = max(0, -(-(desde - inicio).days // paso))  # primer paso dentro de la ventana
+            while self.cuenta is None or n < self.cuenta:
+                fecha = inicio + timedelta(days=n * paso)
+                if fecha > hasta:
+                    return
+                yield fecha
+                n += 1
+            return
+
+        # Mensual: sin cuenta se puede empezar en el mes de `desde`; con cuenta hay
+        # que contar desde el inicio porque los meses saltados no cuentan
+        meses_hasta_desde = (desde.year - inicio.year) * 12 + desde.month - inicio.month
+        n = 0 if self.cuenta else max(0, meses_hasta_desde // self.intervalo)
+        generadas = 0
+        while self.cuenta is None or generadas < self.cuenta:
+            total_meses = inicio.month - 1 + n * self.intervalo
+            anio, mes = inicio.year + total_meses // 12, total_meses % 12 + 1
+            n += 1
+            if date(anio, mes, 1) > hasta:
+                return
+            try:
+                fecha = date(anio, mes, inicio.day)
+            except ValueError:
+                continue  # el mes no tiene ese día
+            generadas += 1
+            if fecha >= desde and fecha <= hasta:
+                yield fecha
+
+
+@dataclass
+class Evento:
+    id: int
+    fecha: date  # en un evento recurrente, la primera ocurrencia
+    hora: str  # "HH:MM"
+    descripcion: str
+    regla: Optional[ReglaRecurrencia] = None
+
+    @property
+    def clave(self) -> Tuple[date, str, int]:
+        return (self.fecha, self.hora, self.id)
+
+    def valores(self, fecha: Optional[date] = None) -> Tuple[str, str, str]:
+        # Columnas del Treeview (para una ocurrencia, con su propia fecha)
+        descripcion = f"{self.descripcion} ↻" if self.regla else self.descripcion
+        return ((fecha or self.fecha).strftime(FORMATO_FECHA), self.hora, descripcion)
+
+
+# Fila visible de la agenda: clave de orden (fecha, hora, id), evento y fecha concreta
+Ocurrencia = Tuple[Tuple[date, str, int], Evento, date]
+
+
+def iid_ocurrencia(ocurrencia: Ocurrencia) -> str:
+    # iid de la fila en el Treeview: "id" para eventos únicos, "id@fecha" para ocurrencias
+    clave, evento, fecha = ocurrencia
+    return f"{evento.id}@{fecha.isoformat()}" if evento.regla else str(evento.id)
+
+
+def _flujo_serie(evento: Evento, fechas: List[date]) -> Iterator[Ocurrencia]:
+    # Función aparte: cada generador queda ligado a su evento (una expresión generadora
+    # en el bucle leería la variable del bucle al consumirse, es decir, la última serie)
+    return (((fecha, evento.hora, evento.id), evento, fecha) for fecha in fechas)
+
+
+def leer_fecha(texto: str) -> date:
+    return datetime.strptime(texto.strip(), FORMATO_FECHA).date()
+
+
+def normalizar_hora(texto: str) -> str:
+    """
+    Acepta "H:MM" o "HH:MM" y retorna "HH:MM" (para que ordene bien como texto).
+    """
+    coincidencia = re.fullmatch(r"\s*(\d{1,2}):(\d{2})\s*", texto)
+    if not coincidencia:
+        raise ValueError("La hora debe tener el formato HH:MM.")
+    horas, minutos = int(coincidencia.group(1)), int(coincidencia.group(2))
+    if horas > 23 or minutos > 59:
+        raise ValueError("La hora no es válida.")
+    return f"{horas:02d}:{minutos:02d}"
+
+
+class ModeloEventos:
+    """
+    Eventos de la agenda:
+    - _eventos: {id: Evento}
+    - _claves: lista ordenada de (fecha, hora, id) de los eventos únicos
+    - _recurrentes: {id: Evento con regla}, una entrada por serie
+    - _cache: {(desde, hasta): {id: [fechas]}} ocurrencias ya expandidas por ventana
+      (LRU de como mucho MAX_VENTANAS_CACHE ventanas, con todas sus series)
+    """
+    def __init__(self):
+        self._eventos: Dict[int, Evento] = {}
+        self._claves: List[Tuple[date, str, int]] = []
+        self._recurrentes: Dict[int, Evento] = {}
+        self._cache: "OrderedDict[Tuple[date, date], Dict[int, List[date]]]" = OrderedDict()
+        self._siguiente_id = 1
+
+    @property
+    def total(self) -> int:
+        # Eventos definidos: cada serie recurrente cuenta una vez
+        return len(self._claves) + len(self._recurrentes)
+
+    def __len__(self):
+        return len(self._claves)
+
+    def __iter__(self):
+        return (self._eventos[clave[2]] for clave in self._claves)
+
+    def __contains__(self, id_evento: int) -> bool:
+        return id_evento in self._eventos or id_evento in self._recurrentes
+
+    def evento(self, id_evento: int) -> Evento:
+        return self._eventos.get(id_evento) or self._recurrentes[id_evento]
+
+    def agregar(
+        self,
+        fecha: date,
+        hora: str,
+        descripcion: str,
+        regla: Optional[ReglaRecurrencia] = None
+    ) -> Tuple[Evento, Optional[int]]:
+        """
+        Retorna el evento creado y su posición en el orden (fecha, hora).
+        Un evento recurrente no tiene una posición única: se retorna None.
+        """
+        evento = Evento(self._siguiente_id, fecha, hora, descripcion, regla)
+        self._siguiente_id += 1
+        if regla is not None:
+            self._recurrentes[evento.id] = evento
+            return evento, None
+        self._eventos[evento.id] = evento
+        posicion = bisect_left(self._claves, evento.clave)
+        self._claves.insert(posicion, evento.clave)
+        return evento, posicion
+
+    def reservar_ids(self, ultimo_id: int) -> None:
+        """
+        Evita reutilizar id ya guardados (hasta `ultimo_id`) en eventos nuevos.
+        """
+        self._siguiente_id = max(self._siguiente_id, ultimo_id + 1)
+
+    def incorporar(self, evento: Evento) -> Optional[int]:
+        """
+        Añade un evento que ya tiene id (p. ej. leído del almacén) y retorna su posición.
+        """
+        self.reservar_ids(evento.id)
+        if evento.regla is not None:
+            self._recurrentes[evento.id] = evento
+            return None
+        self._eventos[evento.id] = evento
+        posicion = bisect_left(self._claves, evento.clave)
+        self._claves.insert(posicion, evento.clave)
+        return posicion
+
+    def editar_regla(self, id_evento: int, regla: ReglaRecurrencia) -> None:
+        self._recurrentes[id_evento].regla = regla
+        self._invalidar(id_evento)
+
+    def _invalidar(self, id_evento: int) -> None:
+        # Una búsqueda por ventana guardada, no por serie expandida
+        for series in self._cache.values():
+            series.pop(id_evento, None)
+
+    def eliminar(self, id_evento: int) -> Optional[int]:
+        """
+        Quita el evento y retorna la posición que ocupaba (None si era una serie recurrente).
+        """
+        if id_evento in self._recurrentes:
+            del self._recurrentes[id_evento]
+            self._invalidar(id_evento)
+            return None
+        evento = self._eventos.pop(id_evento)
+        posicion = bisect_left(self._claves, evento.clave)
+        del self._claves[posicion]
+        return posicion
+
+    def en_rango(self, desde: date, hasta: date) -> List[Evento]:
+        """
+        Eventos con desde <= fecha <= hasta, en orden. O(log N + resultados).
+        """
+        inicio = bisect_left(self._claves, (desde,))
+        fin = bisect_left(self._claves, (date.fromordinal(hasta.toordinal() + 1),))
+        return [self._eventos[clave[2]] for clave in self._claves[inicio:fin]]
+
+    def _series_en_ventana(self, desde: date, hasta: date) -> Dict[int, List[date]]:
+        # Fechas de cada serie en la ventana; solo se expanden las que no estén ya guardadas
+        clave = (desde, hasta)
+        series = self._cache.get(clave)
+        if series is None:
+            series = self._cache[clave] = {}
+            if len(self._cache) > MAX_VENTANAS_CACHE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(clave)
+        for id_evento, evento in self._recurrentes.items():
+            if id_evento not in series:
+                series[id_evento] = list(evento.regla.fechas(evento.fecha, desde, hasta))
+        return series
+
+    def ocurrencias(self, desde: date, hasta: date) -> Iterator[Ocurrencia]:
+        """
+        Filas de la ventana [desde, hasta] en orden: eventos únicos (búsqueda binaria)
+        mezclados con las ocurrencias de cada serie, generadas solo para esa ventana.
+        """
+        flujos = [((e.clave, e, e.fecha) for e in self.en_rango(desde, hasta))]
+        series = self._series_en_ventana(desde, hasta)
+        for id_evento, evento in self._recurrentes.items():
+            flujos.append(_flujo_serie(evento, series[id_evento]))
+        return heapq.merge(*flujos, key=lambda ocurrencia: ocurrencia[0])
+
+    def proximo(self, ahora: Optional[datetime] = None) -> Optional[Tuple[Evento, date]]:
+        """
+        Próximo evento (y fecha de la ocurrencia) en o después de `ahora`.
+        O(log N) para los eventos únicos, más la siguiente fecha de cada serie.
+        """
+        ahora = ahora or datetime.now()
+        limite = (ahora.date(), ahora.strftime("%H:%M"))
+        candidatos = []
+        posicion = bisect_left(self._claves, limite)
+        if posicion < len(self._claves):
+            evento = self._eventos[self._claves[posicion][2]]
+            candidatos.append((evento.clave, evento, evento.fecha))
+        for evento in self._recurrentes.values():
+            # La ocurrencia de hoy puede haber pasado ya: se mira hasta la siguiente
+            for fecha in evento.regla.fechas(evento.fecha, ahora.date(), date.max):
+                if (fecha, evento.hora) >= limite:
+                    candidatos.append(((fecha, evento.hora, evento.id), evento, fecha))
+                    break
+        if not candidatos:
+            return None
+        _, evento, fecha = min(candidatos, key=lambda c: c[0])
+        return evento, fecha
+
+
+# Comprobación rápida al ejecutar el módulo: varias series que se solapan en la ventana
+if __name__ == "__main__":
+    modelo = ModeloEventos()
+    semanal = ReglaRecurrencia("SEMANAL")
+    modelo.agregar(date(2026, 3, 2), "08:00", "Gimnasio", semanal)
+    modelo.agregar(date(2026, 3, 2), "18:00", "Inglés", semanal)
+    modelo.agregar(date(2026, 3, 4), "12:00", "Reunión", ReglaRecurrencia("DIARIA", 2))
+    modelo.agregar(date(2026, 3, 9), "10:00", "Dentista")
+    filas = list(modelo.ocurrencias(date(2026, 3, 1), date(2026, 3, 15)))
+    for fila in filas:
+        print(iid_ocurrencia(fila), *fila[1].valores(fila[2]))
+
+    esperadas = sorted([(date(2026, 3, d), "08:00", "Gimnasio") for d in (2, 9)]
+                       + [(date(2026, 3, d), "18:00", "Inglés") for d in (2, 9)]
+                       + [(date(2026, 3, d), "12:00", "Reunión") for d in range(4, 16, 2)]
+                       + [(date(2026, 3, 9), "10:00", "Dentista")])
+    obtenidas = [(fecha, evento.hora, evento.descripcion) for _, evento, fecha in filas]
+    if obtenidas != esperadas:
+        raise AssertionError(f"Ocurrencias incorrectas:\n{obtenidas}\n!=\n{esperadas}")
+    iids = [iid_ocurrencia(fila) for fila in filas]
+    if len(set(iids)) != len(iids):
+        raise AssertionError(f"iid repetidos: {iids}")
+
+    for dia in range(MAX_VENTANAS_CACHE + 10):  # recorrer muchas ventanas no hace crecer la caché sin límite
+        list(modelo.ocurrencias(date(2026, 1, 1) + timedelta(days=dia), date(2026, 2, 1) + timedelta(days=dia)))
+    if len(modelo._cache) > MAX_VENTANAS_CACHE:
+        raise AssertionError(f"La caché tiene {len(modelo._cache)} ventanas")
+
+    # Con más series que ventanas guardadas, volver a la misma ventana no expande nada
+    for i in range(2000):
+        modelo.agregar(date(2026, 1, 1 + i % 28), "07:00", f"Serie {i}", semanal)
+    anio = (date(2026, 1, 1), date(2026, 12, 31))
+    antes = dict(modelo._series_en_ventana(*anio))
+    list(modelo.ocurrencias(*anio))
+    if any(modelo._cache[anio][i] is not fechas for i, fechas in antes.items()):
+        raise AssertionError("La ventana repetida volvió a expandir series")
+    modelo.editar_regla(antes.popitem()[0], ReglaRecurrencia("SEMANAL", 2))  # solo se invalida esa serie
+    if any(modelo._cache[anio][i] is not fechas for i, fechas in antes.items()):
+        raise AssertionError("Editar una serie invalidó las demás")
+    print(f"\n{len(filas)} ocurrencias correctas; caché acotada a {len(modelo._cache)} ventanas")
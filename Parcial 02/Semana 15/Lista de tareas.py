@@ -1,58 +1,77 @@
+import os
 from tkinter import *
+from modelo_tareas import ModeloTareas
+from lista_virtual import ListaVirtual
+from almacen_tareas import AlmacenTareas
+
+# Archivo SQLite donde se guardan las tareas entre ejecuciones
+ARCHIVO_TAREAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tareas.db")
+
+
+class ListaTareas:
+    """
+    Ventana de la app: se puede construir sobre cualquier Tk (p. ej. desde el arnés
+    de rendimiento, con otra ruta de almacén) sin que arranque el bucle de eventos.
+    """
+    def __init__(self, ventana, ruta=ARCHIVO_TAREAS):
+        self.ventana = ventana
+        ventana.title("Lista de Tareas")
+        ventana.geometry("400x400")
+
+        # Modelo con las tareas: cada cambio se notifica a la vista
+        self.tareas = ModeloTareas()
+
+        # Campo de entrada (deshabilitado hasta que el almacén esté listo)
+        self.entrada = Entry(ventana, width=40, state=DISABLED)
+        self.entrada.pack(pady=10)
+
+        # Botones
+        Button(ventana, text="Añadir Tarea", command=self.agregar_tarea).pack(pady=5)
+        Button(ventana, text="Marcar como Completada", command=self.marcar_completada).pack(pady=5)
+        Button(ventana, text="Eliminar Tarea", command=self.eliminar_tarea).pack(pady=5)
+
+        # Lista de tareas (virtual: solo dibuja las filas visibles del modelo)
+        self.lista = ListaVirtual(ventana, self.tareas, width=50)
+        self.lista.pack(pady=10)
+
+        # Almacén: carga las tareas guardadas y guarda cada cambio sin bloquear la ventana
+        self.almacen = AlmacenTareas(ruta, ventana, self.tareas, al_estar_listo=self.almacen_listo)
+        ventana.protocol("WM_DELETE_WINDOW", self.cerrar_app)
+
+    # Función para agregar tarea
+    def agregar_tarea(self):
+        tarea = self.entrada.get()
+        if tarea:
+            self.tareas.agregar(tarea)
+            self.entrada.delete(0, END)
+
+    # Función para marcar como completada
+    def marcar_completada(self):
+        seleccion = self.lista.curselection()
+        if seleccion:
+            index = seleccion[0]
+            self.tareas.completar(index)
+
+    # Función para eliminar tarea
+    def eliminar_tarea(self):
+        seleccion = self.lista.curselection()
+        if seleccion:
+            index = seleccion[0]
+            self.tareas.eliminar(index)
+
+    # Función para habilitar la entrada cuando el almacén ya conoce los id guardados
+    def almacen_listo(self):
+        self.entrada.config(state=NORMAL)
+        self.entrada.focus()
+
+    # Función para cerrar la app guardando los cambios pendientes
+    def cerrar_app(self):
+        self.almacen.cerrar()
+        self.ventana.destroy()
 
-# Lista para guardar las tareas
-tareas = []
-
-# Función para agregar tarea
-def agregar_tarea():
-    tarea = entrada.get()
-    if tarea:
-        tareas.append({"texto": tarea, "completada": False})
-        entrada.delete(0, END)
-        actualizar_lista()
-
-# Función para marcar como completada
-def marcar_completada():
-    seleccion = lista.curselection()
-    if seleccion:
-        index = seleccion[0]
-        tareas[index]["completada"] = True
-        actualizar_lista()
-
-# Función para eliminar tarea
-def eliminar_tarea():
-    seleccion = lista.curselection()
-    if seleccion:
-        index = seleccion[0]
-        tareas.pop(index)
-        actualizar_lista()
-
-# Función para actualizar la lista visual
-def actualizar_lista():
-    lista.delete(0, END)
-    for tarea in tareas:
-        texto = tarea["texto"]
-        if tarea["completada"]:
-            texto += " ✔️"
-        lista.insert(END, texto)
-
-# Crear ventana principal
-ventana = Tk()
-ventana.title("Lista de Tareas")
-ventana.geometry("400x400")
-
-# Campo de entrada
-entrada = Entry(ventana, width=40)
-entrada.pack(pady=10)
-
-# Botones
-Button(ventana, text="Añadir Tarea", command=agregar_tarea).pack(pady=5)
-Button(ventana, text="Marcar como Completada", command=marcar_completada).pack(pady=5)
-Button(ventana, text="Eliminar Tarea", command=eliminar_tarea).pack(pady=5)
-
-# Lista de tareas
-lista = Listbox(ventana, width=50)
-lista.pack(pady=10)
 
 # Ejecutar la app
-ventana.mainloop()
+if __name__ == "__main__":
+    ventana = Tk()
+    ListaTareas(ventana)
+    ventana.mainloop()
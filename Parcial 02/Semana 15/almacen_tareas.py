@@ -0,0 +1,124 @@
+# ==========================================
+# ALMACÉN PERSISTENTE DE TAREAS (SQLite EN SEGUNDO PLANO)
+# ==========================================
+# Todo el acceso a disco ocurre en un hilo trabajador con su propia conexión
+# SQLite. El hilo de Tk solo encola pedidos y recoge resultados con after(),
+# así la ventana nunca se bloquea esperando al disco:
+# - al arrancar, las tareas se leen por lotes y se van incorporando al modelo
+# - cada cambio del modelo se encola y se guarda (commit agrupado)
+
+import queue
+import sqlite3
+import threading
+from typing import Callable, Optional
+
+from modelo_tareas import ACTUALIZAR, ELIMINAR, INSERTAR, ModeloTareas
+
+INTERVALO_MS = 50          # cada cuánto recoge el hilo de Tk los resultados
+LOTES_POR_RECOGIDA = 2     # lotes incorporados por recogida, para no congelar la ventana
+
+
+class AlmacenTareas:
+    """
+    Guarda un ModeloTareas en SQLite desde un hilo trabajador.
+    `al_estar_listo` se llama (en el hilo de Tk) cuando ya se conoce el último id
+    guardado; desde ese momento se pueden crear tareas nuevas sin chocar.
+    """
+    def __init__(self, ruta: str, ventana, modelo: ModeloTareas,
+                 al_estar_listo: Optional[Callable[[], None]] = None, tam_lote: int = 2000):
+        self.ruta = ruta
+        self.ventana = ventana
+        self.modelo = modelo
+        self.al_estar_listo = al_estar_listo
+        self.tam_lote = tam_lote
+        self._pedidos: queue.Queue = queue.Queue()
+        # Cola acotada: si la ventana va atrasada, el hilo espera antes de leer más
+        self._resultados: queue.Queue = queue.Queue(maxsize=4)
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+        self._hilo.start()
+        modelo.suscribir(self.aplicar)
+        self._id_recogida = ventana.after(INTERVALO_MS, self._recoger)
+
+    # ---------- Hilo de Tk ----------
+    def aplicar(self, accion: str, indice: int, tarea) -> None:
+        if accion == INSERTAR:
+            self._pedidos.put(("INSERT INTO tareas (id, texto, completada) VALUES (?, ?, ?)",
+                               (tarea["id"], tarea["texto"], int(tarea["completada"]))))
+        elif accion == ACTUALIZAR:
+            self._pedidos.put(("UPDATE tareas SET texto = ?, completada = ? WHERE id = ?",
+                               (tarea["texto"], int(tarea["completada"]), tarea["id"])))
+        elif accion == ELIMINAR:
+            self._pedidos.put(("DELETE FROM tareas WHERE id = ?", (tarea["id"],)))
+        # CARGAR: son tareas que ya vienen del almacén
+
+    def _recoger(self) -> None:
+        for _ in range(LOTES_POR_RECOGIDA):
+            try:
+                tipo, dato = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            if tipo == "tope":
+                self.modelo.reservar_ids(dato)
+                if self.al_estar_listo:
+                    self.al_estar_listo()
+            elif tipo == "lote":
+                self.modelo.cargar_lote(dato)
+            elif tipo == "error":
+                print(f"Error en el almacén de tareas: {dato}")
+        self._id_recogida = self.ventana.after(INTERVALO_MS, self._recoger)
+
+    def cerrar(self) -> None:
+        """
+        Detiene la recogida y espera a que se guarden los cambios pendientes.
+        """
+        self.ventana.after_cancel(self._id_recogida)
+        self._pedidos.put(None)
+        # Si la carga inicial sigue en curso, se vacían resultados para que el hilo termine
+        while self._hilo.is_alive():
+            try:
+                self._resultados.get_nowait()
+            except queue.Empty:
+                pass
+            self._hilo.join(timeout=0.05)
+
+    # ---------- Hilo trabajador ----------
+    def _trabajar(self) -> None:
+        try:
+            conexion = sqlite3.connect(self.ruta)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.execute("CREATE TABLE IF NOT EXISTS tareas ("
+                             "id INTEGER PRIMARY KEY, texto TEXT NOT NULL, completada INTEGER NOT NULL)")
+            tope = conexion.execute("SELECT COALESCE(MAX(id), 0) FROM tareas").fetchone()[0]
+            self._resultados.put(("tope", tope))
+        except sqlite3.Error as e:
+            # Sin almacén la app sigue funcionando en memoria
+            self._resultados.put(("error", e))
+            self._resultados.put(("tope", 0))
+            return
+
+        with conexion:
+            ultimo = 0
+            while True:
+                filas = conexion.execute(
+                    "SELECT id, texto, completada FROM tareas WHERE id > ? ORDER BY id LIMIT ?",
+                    (ultimo, self.tam_lote)).fetchall()
+                if not filas:
+                    break
+                ultimo = filas[-1][0]
+                lote = [{"id": i, "texto": texto, "completada": bool(c)} for i, texto, c in filas]
+                self._resultados.put(("lote", lote))
+
+        while True:
+            pedido = self._pedidos.get()
+            if pedido is None:
+                break
+            try:
+                conexion.execute(*pedido)
+                # Commit agrupado: solo cuando no quedan más cambios en la cola
+                if self._pedidos.empty():
+                    conexion.commit()
+            except sqlite3.Error as e:
+                self._resultados.put(("error", e))
+        conexion.commit()
+        conexion.close()
@@ -0,0 +1,118 @@
+# ==========================================
+# BENCHMARK: RECONSTRUCCIÓN COMPLETA vs CAMBIOS PUNTUALES EN EL LISTBOX
+# ==========================================
+# Mide el coste por acción (añadir, completar, eliminar) con la estrategia
+# original (borrar y reinsertar todo el Listbox), con VistaListbox y con
+# ListaVirtual, además del tiempo de arranque de ambos widgets ya cargados.
+#
+# Necesita un servidor X; en máquinas sin pantalla se ejecuta con Xvfb:
+#     xvfb-run -a python benchmark_lista.py [tamaño1 tamaño2 ...]
+
+import sys
+import time
+from tkinter import END, Listbox, Tk, TclError
+
+from lista_virtual import ListaVirtual
+from modelo_tareas import ModeloTareas, VistaListbox, texto_tarea
+
+TAMANOS = [1_000, 10_000, 50_000]
+ACCIONES = 50
+
+
+def reconstruir(lista, tareas):
+    # Estrategia original de actualizar_lista()
+    lista.delete(0, END)
+    for tarea in tareas:
+        lista.insert(END, texto_tarea(tarea))
+
+
+def medir_reconstruccion(ventana, tamano):
+    lista = Listbox(ventana)
+    tareas = [{"texto": f"Tarea {i}", "completada": False} for i in range(tamano)]
+    reconstruir(lista, tareas)
+    inicio = time.perf_counter()
+    for i in range(ACCIONES):
+        tareas.append({"texto": f"Nueva {i}", "completada": False})
+        reconstruir(lista, tareas)
+        tareas[i]["completada"] = True
+        reconstruir(lista, tareas)
+        tareas.pop(0)
+        reconstruir(lista, tareas)
+        ventana.update_idletasks()
+    lista.destroy()
+    return (time.perf_counter() - inicio) / (3 * ACCIONES)
+
+
+def medir_diferencial(ventana, tamano):
+    lista = Listbox(ventana)
+    modelo = ModeloTareas()
+    for i in range(tamano):
+        modelo.agregar(f"Tarea {i}")
+    VistaListbox(lista, modelo)
+    inicio = time.perf_counter()
+    for i in range(ACCIONES):
+        modelo.agregar(f"Nueva {i}")
+        modelo.completar(i)
+        modelo.eliminar(0)
+        ventana.update_idletasks()
+    lista.destroy()
+    return (time.perf_counter() - inicio) / (3 * ACCIONES)
+
+
+def medir_virtual(ventana, tamano):
+    modelo = ModeloTareas()
+    for i in range(tamano):
+        modelo.agregar(f"Tarea {i}")
+    inicio = time.perf_counter()
+    lista = ListaVirtual(ventana, modelo)
+    lista.pack()
+    ventana.update()
+    arranque = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    for i in range(ACCIONES):
+        modelo.agregar(f"Nueva {i}")
+        modelo.completar(i)
+        modelo.eliminar(0)
+        ventana.update()
+    lista.destroy()
+    return (time.perf_counter() - inicio) / (3 * ACCIONES), arranque
+
+
+def medir_arranque_listbox(ventana, tamano):
+    modelo = ModeloTareas()
+    for i in range(tamano):
+        modelo.agregar(f"Tarea {i}")
+    inicio = time.perf_counter()
+    lista = Listbox(ventana)
+    VistaListbox(lista, modelo)
+    lista.pack()
+    ventana.update()
+    arranque = time.perf_counter() - inicio
+    lista.destroy()
+    return arranque
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or TAMANOS
+    try:
+        ventana = Tk()
+    except TclError as e:
+        sys.exit(f"No hay pantalla disponible ({e}). Ejecuta con: xvfb-run -a python benchmark_lista.py")
+    print("Milisegundos por acción")
+    print(f"{'Tareas':>10}{'reconstruir':>14}{'diferencial':>14}{'virtual':>14}")
+    for tamano in tamanos:
+        completo = medir_reconstruccion(ventana, tamano)
+        delta = medir_diferencial(ventana, tamano)
+        virtual, _ = medir_virtual(ventana, tamano)
+        print(f"{tamano:>10,}{completo * 1000:>14.3f}{delta * 1000:>14.3f}{virtual * 1000:>14.3f}")
+
+    print("\nArranque con la lista ya cargada (segundos)")
+    print(f"{'Tareas':>10}{'Listbox':>14}{'virtual':>14}")
+    for tamano in tamanos + [500_000]:
+        _, arranque_virtual = medir_virtual(ventana, tamano)
+        print(f"{tamano:>10,}{medir_arranque_listbox(ventana, tamano):>14.3f}{arranque_virtual:>14.3f}")
+    ventana.destroy()
+
+
+if __name__ == "__main__":
+    main()
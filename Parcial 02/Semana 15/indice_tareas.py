@@ -0,0 +1,189 @@
+# ==========================================
+# ÍNDICE DE BÚSQUEDA Y VISTA FILTRADA DE TAREAS
+# ==========================================
+# El índice se mantiene con cada cambio del modelo, así filtrar no exige
+# recorrer todas las tareas:
+# - palabras: {palabra: {id}} más un vocabulario ordenado para buscar por prefijo
+# - estados: bytearray indexado por id (0 = no existe, 1 = pendiente, 2 = completada)
+#   Un int de Python como conjunto de bits es inmutable: cada cambio lo copiaría entero.
+
+import re
+from bisect import bisect_left, insort
+from typing import Callable, Dict, List, Optional, Set
+
+from modelo_tareas import ACTUALIZAR, CARGAR, ELIMINAR, INSERTAR, RECARGAR, ModeloTareas
+
+PENDIENTE = 1
+COMPLETADA = 2
+
+# Estado elegido en el filtro -> patrón de bytes buscado en el mapa de estados
+ESTADOS = {
+    "Todas": re.compile(b"[\x01\x02]"),
+    "Pendientes": re.compile(b"\x01"),
+    "Completadas": re.compile(b"\x02"),
+}
+
+
+def palabras(texto: str) -> List[str]:
+    return re.findall(r"\w+", texto.lower())
+
+
+class IndiceTareas:
+    """
+    Índice incremental de las tareas de un ModeloTareas por palabra y por estado.
+    """
+    def __init__(self, modelo: ModeloTareas):
+        self._por_id: Dict[int, Dict] = {}
+        self._palabras: Dict[str, Set[int]] = {}
+        self._vocabulario: List[str] = []  # claves de _palabras, ordenadas
+        self._estados = bytearray()
+        for tarea in modelo:
+            self._agregar(tarea)
+        modelo.suscribir(self.aplicar)
+
+    def tarea(self, id_tarea: int) -> Dict:
+        return self._por_id[id_tarea]
+
+    def aplicar(self, accion: str, indice: int, tarea) -> None:
+        if accion == INSERTAR:
+            self._agregar(tarea)
+        elif accion == CARGAR:
+            for t in tarea:
+                self._agregar(t)
+        elif accion == ACTUALIZAR:
+            self._estados[tarea["id"]] = COMPLETADA if tarea["completada"] else PENDIENTE
+        elif accion == ELIMINAR:
+            self._quitar(tarea)
+
+    def _agregar(self, tarea: Dict) -> None:
+        id_tarea = tarea["id"]
+        self._por_id[id_tarea] = tarea
+        if id_tarea >= len(self._estados):
+            self._estados.extend(bytes(max(id_tarea + 1 - len(self._estados), len(self._estados))))
+        self._estados[id_tarea] = COMPLETADA if tarea["completada"] else PENDIENTE
+        for palabra in set(palabras(tarea["texto"])):
+            ids = self._palabras.get(palabra)
+            if ids is None:
+                ids = self._palabras[palabra] = set()
+                insort(self._vocabulario, palabra)
+            ids.add(id_tarea)
+
+    def _quitar(self, tarea: Dict) -> None:
+        id_tarea = tarea["id"]
+        del self._por_id[id_tarea]
+        self._estados[id_tarea] = 0
+        for palabra in set(palabras(tarea["texto"])):
+            ids = self._palabras[palabra]
+            ids.discard(id_tarea)
+            if not ids:
+                del self._palabras[palabra]
+                del self._vocabulario[bisect_left(self._vocabulario, palabra)]
+
+    def _con_prefijo(self, prefijo: str) -> Set[int]:
+        encontrados: Set[int] = set()
+        posicion = bisect_left(self._vocabulario, prefijo)
+        while posicion < len(self._vocabulario) and self._vocabulario[posicion].startswith(prefijo):
+            encontrados |= self._palabras[self._vocabulario[posicion]]
+            posicion += 1
+        return encontrados
+
+    def buscar(self, consulta: str, estado: str = "Todas") -> List[int]:
+        """
+        Ids (ordenados) de las tareas con alguna palabra que empiece por cada
+        término de la consulta y con el estado pedido.
+        """
+        terminos = palabras(consulta)
+        if not terminos:
+            return [m.start() for m in ESTADOS[estado].finditer(self._estados)]
+        conjuntos = sorted((self._con_prefijo(t) for t in terminos), key=len)
+        ids = conjuntos[0].intersection(*conjuntos[1:])
+        if estado != "Todas":
+            buscado = PENDIENTE if estado == "Pendientes" else COMPLETADA
+            ids = [i for i in ids if self._estados[i] == buscado]
+        return sorted(ids)
+
+    def coincide(self, tarea: Dict, consulta: str, estado: str = "Todas") -> bool:
+        if estado == "Pendientes" and tarea["completada"]:
+            return False
+        if estado == "Completadas" and not tarea["completada"]:
+            return False
+        propias = palabras(tarea["texto"])
+        return all(any(p.startswith(t) for p in propias) for t in palabras(consulta))
+
+
+class VistaFiltrada:
+    """
+    Fuente para ListaVirtual con las tareas que pasan el filtro actual.
+    Sin filtro es transparente (mismos índices que el modelo). Con filtro guarda
+    la lista ordenada de ids que coinciden y traduce los cambios del modelo.
+    """
+    def __init__(self, modelo: ModeloTareas, indice: IndiceTareas):
+        self.modelo = modelo
+        self.indice = indice
+        self.consulta = ""
+        self.estado = "Todas"
+        self._ids: Optional[List[int]] = None
+        self._oyentes: List[Callable] = []
+        modelo.suscribir(self.aplicar)
+
+    def suscribir(self, oyente: Callable) -> None:
+        self._oyentes.append(oyente)
+
+    def _notificar(self, accion: str, indice: int, tarea) -> None:
+        for oyente in self._oyentes:
+            oyente(accion, indice, tarea)
+
+    def __len__(self):
+        return len(self.modelo) if self._ids is None else len(self._ids)
+
+    def __getitem__(self, indice: int) -> Dict:
+        if self._ids is None:
+            return self.modelo[indice]
+        return self.indice.tarea(self._ids[indice])
+
+    def posicion_en_modelo(self, indice: int) -> int:
+        if self._ids is None:
+            return indice
+        return self.modelo.posicion(self._ids[indice])
+
+    def filtrar(self, consulta: str, estado: str = "Todas") -> None:
+        self.consulta = consulta
+        self.estado = estado
+        if not palabras(consulta) and estado == "Todas":
+            self._ids = None
+        else:
+            self._ids = self.indice.buscar(consulta, estado)
+        self._notificar(RECARGAR, 0, None)
+
+    def aplicar(self, accion: str, indice: int, tarea) -> None:
+        if self._ids is None:
+            self._notificar(accion, indice, tarea)
+            return
+        if accion == CARGAR:
+            for t in tarea:
+                if self.indice.coincide(t, self.consulta, self.estado):
+                    posicion = bisect_left(self._ids, t["id"])
+                    self._ids.insert(posicion, t["id"])
+                    self._notificar(INSERTAR, posicion, t)
+            return
+
+        posicion = bisect_left(self._ids, tarea["id"])
+        presente = posicion < len(self._ids) and self._ids[posicion] == tarea["id"]
+        if accion == INSERTAR:
+            if self.indice.coincide(tarea, self.consulta, self.estado):
+                self._ids.insert(posicion, tarea["id"])
+                self._notificar(INSERTAR, posicion, tarea)
+        elif presente and accion == ELIMINAR:
+            del self._ids[posicion]
+            self._notificar(ELIMINAR, posicion, tarea)
+        elif accion == ACTUALIZAR:
+            # Un cambio de estado puede hacer que la tarea entre o salga del filtro
+            coincide = self.indice.coincide(tarea, self.consulta, self.estado)
+            if presente and coincide:
+                self._notificar(ACTUALIZAR, posicion, tarea)
+            elif presente:
+                del self._ids[posicion]
+                self._notificar(ELIMINAR, posicion, tarea)
+            elif coincide:
+                self._ids.insert(posicion, tarea["id"])
+                self._notificar(INSERTAR, posicion, tarea)
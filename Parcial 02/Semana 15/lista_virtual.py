@@ -0,0 +1,163 @@
+# ==========================================
+# LISTA VIRTUAL (SOLO DIBUJA LAS FILAS VISIBLES)
+# ==========================================
+# Sustituye al Listbox cuando hay cientos de miles de tareas: el widget no
+# guarda una fila por tarea, sino un puñado de textos en un Canvas que se
+# rellenan desde el modelo según la posición de la barra de desplazamiento.
+# Cada redibujado cuesta O(filas visibles), sin importar el tamaño de la lista.
+
+from tkinter import Canvas, Frame, Scrollbar, font
+from typing import Optional
+
+from modelo_tareas import ACTUALIZAR, CARGAR, COLOR_COMPLETADA, ELIMINAR, INSERTAR, RECARGAR, texto_tarea
+
+COLOR_SELECCION = "#cce4f7"
+
+
+class ListaVirtual(Frame):
+    """
+    Lista desplazable sobre un modelo con __len__, __getitem__ y suscribir().
+    Imita lo que usan las apps del Listbox: curselection(), selection_set() y see(),
+    siempre con índices del modelo.
+    """
+    def __init__(self, master, modelo, width: int = 50, height: int = 10, **kwargs):
+        super().__init__(master, **kwargs)
+        self.modelo = modelo
+        self.fuente = font.nametofont("TkDefaultFont")
+        self.alto_fila = self.fuente.metrics("linespace") + 2
+        ancho = self.fuente.measure("0") * width
+
+        self.canvas = Canvas(self, width=ancho, height=self.alto_fila * height,
+                             background="white", highlightthickness=1, takefocus=1)
+        self.barra = Scrollbar(self, orient="vertical", command=self.yview)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.barra.pack(side="right", fill="y")
+
+        self.primera = 0                       # índice del modelo en la fila superior
+        self.seleccion: Optional[int] = None   # índice del modelo seleccionado
+        self._filas = []                       # ids de texto reutilizados del Canvas
+        self._fondo = self.canvas.create_rectangle(0, 0, 0, 0, fill=COLOR_SELECCION, width=0, state="hidden")
+        self._pendiente = False
+
+        self.canvas.bind("<Configure>", self._al_redimensionar)
+        self.canvas.bind("<Button-1>", self._al_pulsar)
+        self.canvas.bind("<MouseWheel>", self._al_rueda)
+        self.canvas.bind("<Button-4>", lambda e: self.yview("scroll", -3, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.yview("scroll", 3, "units"))
+        self.canvas.bind("<Up>", lambda e: self._mover_seleccion(-1))
+        self.canvas.bind("<Down>", lambda e: self._mover_seleccion(1))
+        modelo.suscribir(self.aplicar)
+
+    # ---------- API compatible con Listbox ----------
+    def curselection(self):
+        return () if self.seleccion is None else (self.seleccion,)
+
+    def selection_set(self, indice: int) -> None:
+        self.seleccion = indice
+        self._programar()
+
+    def selection_clear(self) -> None:
+        self.seleccion = None
+        self._programar()
+
+    def see(self, indice: int) -> None:
+        visibles = self._visibles()
+        if indice < self.primera:
+            self.primera = indice
+        elif indice >= self.primera + visibles:
+            self.primera = indice - visibles + 1
+        self._programar()
+
+    def yview(self, *args) -> None:
+        """
+        Protocolo de la Scrollbar: ("moveto", fracción) o ("scroll", n, "units"|"pages").
+        """
+        total = len(self.modelo)
+        if args[0] == "moveto":
+            self.primera = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            paso = int(args[1])
+            if args[2] == "pages":
+                paso *= max(1, self._visibles() - 1)
+            self.primera += paso
+        self._programar()
+
+    # ---------- Cambios del modelo ----------
+    def aplicar(self, accion: str, indice: int, tarea) -> None:
+        if accion in (INSERTAR, CARGAR):
+            if self.seleccion is not None and self.seleccion >= indice:
+                self.seleccion += len(tarea) if accion == CARGAR else 1
+        elif accion == ELIMINAR:
+            if self.seleccion == indice:
+                self.seleccion = None
+            elif self.seleccion is not None and self.seleccion > indice:
+                self.seleccion -= 1
+        elif accion == RECARGAR:
+            self.seleccion = None
+            self.primera = 0
+        elif accion == ACTUALIZAR:
+            if not self.primera <= indice < self.primera + len(self._filas):
+                return  # fila fuera de pantalla: no hay nada que redibujar
+        self._programar()
+
+    # ---------- Dibujo ----------
+    def _visibles(self) -> int:
+        return max(1, self.canvas.winfo_height() // self.alto_fila)
+
+    def _programar(self) -> None:
+        # Agrupa varios cambios seguidos en un solo redibujado
+        if not self._pendiente:
+            self._pendiente = True
+            self.after_idle(self._pintar)
+
+    def _pintar(self) -> None:
+        self._pendiente = False
+        total = len(self.modelo)
+        visibles = self._visibles()
+        self.primera = max(0, min(self.primera, total - visibles))
+
+        while len(self._filas) < visibles + 1:
+            y = len(self._filas) * self.alto_fila + 1
+            self._filas.append(self.canvas.create_text(4, y, anchor="nw", font=self.fuente))
+
+        for fila, id_texto in enumerate(self._filas):
+            indice = self.primera + fila
+            if indice < total:
+                tarea = self.modelo[indice]
+                color = COLOR_COMPLETADA if tarea["completada"] else "black"
+                self.canvas.itemconfigure(id_texto, text=texto_tarea(tarea), fill=color)
+            else:
+                self.canvas.itemconfigure(id_texto, text="")
+
+        if self.seleccion is not None and 0 <= self.seleccion - self.primera < len(self._filas):
+            y = (self.seleccion - self.primera) * self.alto_fila + 1
+            self.canvas.coords(self._fondo, 0, y, self.canvas.winfo_width(), y + self.alto_fila)
+            self.canvas.itemconfigure(self._fondo, state="normal")
+        else:
+            self.canvas.itemconfigure(self._fondo, state="hidden")
+
+        if total:
+            self.barra.set(self.primera / total, min(1.0, (self.primera + visibles) / total))
+        else:
+            self.barra.set(0.0, 1.0)
+
+    # ---------- Eventos ----------
+    def _al_redimensionar(self, event) -> None:
+        self._programar()
+
+    def _al_pulsar(self, event) -> None:
+        self.canvas.focus_set()
+        indice = self.primera + event.y // self.alto_fila
+        if indice < len(self.modelo):
+            self.selection_set(indice)
+
+    def _al_rueda(self, event) -> None:
+        self.yview("scroll", -3 if event.delta > 0 else 3, "units")
+
+    def _mover_seleccion(self, paso: int) -> None:
+        if not len(self.modelo):
+            return
+        actual = self.seleccion if self.seleccion is not None else self.primera - paso
+        indice = max(0, min(len(self.modelo) - 1, actual + paso))
+        self.selection_set(indice)
+        self.see(indice)
@@ -0,0 +1,132 @@
+# ==========================================
+# MODELO DE TAREAS CON NOTIFICACIÓN DE CAMBIOS
+# ==========================================
+# Las apps de tareas (Semana 15 y Semana 16) guardan aquí sus tareas. Cada
+# operación avisa a los oyentes con un cambio puntual, de modo que la vista
+# aplica solo la diferencia (una fila) en lugar de redibujar la lista entera.
+
+from bisect import bisect_left
+from tkinter import END
+from typing import Callable, Dict, List
+
+# Tipos de cambio que reciben los oyentes: (accion, indice, tarea)
+INSERTAR = "insertar"
+ACTUALIZAR = "actualizar"
+ELIMINAR = "eliminar"
+CARGAR = "cargar"  # lote leído del almacén: `tarea` es la lista de tareas del lote
+RECARGAR = "recargar"  # cambió todo el contenido (p. ej. un filtro nuevo): `tarea` es None
+
+COLOR_COMPLETADA = "#888888"
+
+
+def texto_tarea(tarea: Dict) -> str:
+    texto = tarea["texto"]
+    if tarea["completada"]:
+        texto += " ✔️"
+    return texto
+
+
+class ModeloTareas:
+    """
+    Lista de tareas ({"id": int, "texto": str, "completada": bool}) que notifica
+    a sus oyentes cada cambio como (accion, indice, tarea).
+    Los id son crecientes y estables, así que la lista siempre está ordenada por id.
+    """
+    def __init__(self):
+        self._tareas: List[Dict] = []
+        self._oyentes: List[Callable[[str, int, Dict], None]] = []
+        self._siguiente_id = 1
+
+    def suscribir(self, oyente: Callable[[str, int, Dict], None]) -> None:
+        self._oyentes.append(oyente)
+
+    def _notificar(self, accion: str, indice: int, tarea: Dict) -> None:
+        for oyente in self._oyentes:
+            oyente(accion, indice, tarea)
+
+    def __len__(self):
+        return len(self._tareas)
+
+    def __getitem__(self, indice: int) -> Dict:
+        return self._tareas[indice]
+
+    def __iter__(self):
+        return iter(self._tareas)
+
+    def posicion(self, id_tarea: int) -> int:
+        """
+        Índice actual de la tarea con ese id (búsqueda binaria, la lista está ordenada por id).
+        """
+        return bisect_left(self._tareas, id_tarea, key=lambda t: t["id"])
+
+    def reservar_ids(self, ultimo_id: int) -> None:
+        """
+        Evita reutilizar id ya guardados (hasta `ultimo_id`) en tareas nuevas.
+        """
+        self._siguiente_id = max(self._siguiente_id, ultimo_id + 1)
+
+    def cargar_lote(self, tareas: List[Dict]) -> None:
+        """
+        Incorpora tareas ya guardadas (ordenadas por id) en su posición.
+        """
+        if not tareas:
+            return
+        indice = bisect_left(self._tareas, tareas[0]["id"], key=lambda t: t["id"])
+        self._tareas[indice:indice] = tareas
+        self.reservar_ids(tareas[-1]["id"])
+        self._notificar(CARGAR, indice, tareas)
+
+    def agregar(self, texto: str) -> int:
+        tarea = {"id": self._siguiente_id, "texto": texto, "completada": False}
+        self._siguiente_id += 1
+        self._tareas.append(tarea)
+        indice = len(self._tareas) - 1
+        self._notificar(INSERTAR, indice, tarea)
+        return indice
+
+    def completar(self, indice: int) -> None:
+        tarea = self._tareas[indice]
+        if tarea["completada"]:
+            return
+        tarea["completada"] = True
+        self._notificar(ACTUALIZAR, indice, tarea)
+
+    def eliminar(self, indice: int) -> Dict:
+        tarea = self._tareas.pop(indice)
+        self._notificar(ELIMINAR, indice, tarea)
+        return tarea
+
+
+class VistaListbox:
+    """
+    Refleja un ModeloTareas en un Listbox aplicando solo el cambio recibido:
+    cada acción cuesta un número constante de llamadas a Tk.
+    """
+    def __init__(self, lista, modelo: ModeloTareas):
+        self.lista = lista
+        lista.delete(0, END)
+        for indice, tarea in enumerate(modelo):
+            self.aplicar(INSERTAR, indice, tarea)
+        modelo.suscribir(self.aplicar)
+
+    def aplicar(self, accion: str, indice: int, tarea: Dict) -> None:
+        if accion == INSERTAR:
+            self.lista.insert(indice, texto_tarea(tarea))
+        elif accion == ACTUALIZAR:
+            # El Listbox no permite cambiar el texto de una fila: se reemplaza en su sitio
+            seleccionada = self.lista.selection_includes(indice)
+            self.lista.delete(indice)
+            self.lista.insert(indice, texto_tarea(tarea))
+            if seleccionada:
+                self.lista.selection_set(indice)
+        elif accion == ELIMINAR:
+            self.lista.delete(indice)
+            return
+        elif accion == CARGAR:
+            self.lista.insert(indice, *(texto_tarea(t) for t in tarea))
+            for desplazamiento, t in enumerate(tarea):
+                if t["completada"]:
+                    self.lista.itemconfig(indice + desplazamiento, foreground=COLOR_COMPLETADA)
+            return
+        if tarea["completada"]:
+            self.lista.itemconfig(indice, foreground=COLOR_COMPLETADA)
@@ -1,70 +1,123 @@
+import os
+import sys
 from tkinter import *
 
-# Lista de tareas
-tareas = []
-
-# Función para actualizar la lista visual
-def actualizar_lista():
-    lista.delete(0, END)
-    for tarea in tareas:
-        texto = tarea["texto"]
-        if tarea["completada"]:
-            texto += " ✔️"
-        lista.insert(END, texto)
-
-# Función para agregar tarea
-def agregar_tarea(event=None):
-    texto = entrada.get()
-    if texto:
-        tareas.append({"texto": texto, "completada": False})
-        entrada.delete(0, END)
-        actualizar_lista()
-
-# Función para marcar como completada
-def marcar_completada(event=None):
-    seleccion = lista.curselection()
-    if seleccion:
-        index = seleccion[0]
-        tareas[index]["completada"] = True
-        actualizar_lista()
-
-# Función para eliminar tarea
-def eliminar_tarea(event=None):
-    seleccion = lista.curselection()
-    if seleccion:
-        index = seleccion[0]
-        tareas.pop(index)
-        actualizar_lista()
-
-# Función para cerrar la app
-def cerrar_app(event=None):
-    ventana.destroy()
-
-# Crear ventana principal
-ventana = Tk()
-ventana.title("Gestión de Tareas")
-ventana.geometry("400x400")
-
-# Campo de entrada
-entrada = Entry(ventana, width=40)
-entrada.pack(pady=10)
-entrada.focus()
-
-# Lista de tareas
-lista = Listbox(ventana, width=50)
-lista.pack(pady=10)
-
-# Botones
-Button(ventana, text="Añadir Tarea", command=agregar_tarea).pack(pady=5)
-Button(ventana, text="Marcar como Completada", command=marcar_completada).pack(pady=5)
-Button(ventana, text="Eliminar Tarea", command=eliminar_tarea).pack(pady=5)
-
-# Atajos de teclado
-ventana.bind("<Return>", agregar_tarea)
-ventana.bind("<c>", marcar_completada)
-ventana.bind("<d>", eliminar_tarea)
-ventana.bind("<Delete>", eliminar_tarea)
-ventana.bind("<Escape>", cerrar_app)
+# El modelo de tareas se comparte con la app de la Semana 15
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Semana 15"))
+from modelo_tareas import ModeloTareas
+from lista_virtual import ListaVirtual
+from almacen_tareas import AlmacenTareas
+from indice_tareas import ESTADOS, IndiceTareas, VistaFiltrada
+
+# Archivo SQLite donde se guardan las tareas entre ejecuciones
+ARCHIVO_TAREAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tareas.db")
+
+# Espera tras la última tecla antes de aplicar el filtro
+ESPERA_FILTRO_MS = 200
+
+
+class GestionTareas:
+    """
+    Ventana de la app: se puede construir sobre cualquier Tk (p. ej. desde el arnés
+    de rendimiento, con otra ruta de almacén) sin que arranque el bucle de eventos.
+    """
+    def __init__(self, ventana, ruta=ARCHIVO_TAREAS):
+        self.ventana = ventana
+        ventana.title("Gestión de Tareas")
+        ventana.geometry("400x450")
+
+        # Modelo con las tareas: cada cambio se notifica al índice y a la vista
+        self.tareas = ModeloTareas()
+        self.indice = IndiceTareas(self.tareas)
+        self.visibles = VistaFiltrada(self.tareas, self.indice)  # lo que muestra la lista según el filtro
+        self.filtro_pendiente = None
+
+        # Campo de entrada (deshabilitado hasta que el almacén esté listo)
+        self.entrada = Entry(ventana, width=40, state=DISABLED)
+        self.entrada.pack(pady=10)
+
+        # Barra de filtro: texto (por prefijo de palabra) y estado
+        frame_filtro = Frame(ventana)
+        frame_filtro.pack()
+        Label(frame_filtro, text="Filtrar:").pack(side=LEFT)
+        self.texto_filtro = StringVar()
+        self.texto_filtro.trace_add("write", self.programar_filtro)
+        self.campo_filtro = Entry(frame_filtro, width=25, textvariable=self.texto_filtro)
+        self.campo_filtro.pack(side=LEFT, padx=5)
+        # Sin la etiqueta de la ventana: escribir "c" o "d" en el filtro no dispara los atajos
+        self.campo_filtro.bindtags((str(self.campo_filtro), "Entry", "all"))
+        self.estado_filtro = StringVar(value="Todas")
+        OptionMenu(frame_filtro, self.estado_filtro, *ESTADOS, command=self.aplicar_filtro).pack(side=LEFT)
+
+        # Lista de tareas (virtual: solo dibuja las filas visibles del filtro actual)
+        self.lista = ListaVirtual(ventana, self.visibles, width=50)
+        self.lista.pack(pady=10)
+
+        # Botones
+        Button(ventana, text="Añadir Tarea", command=self.agregar_tarea).pack(pady=5)
+        Button(ventana, text="Marcar como Completada", command=self.marcar_completada).pack(pady=5)
+        Button(ventana, text="Eliminar Tarea", command=self.eliminar_tarea).pack(pady=5)
+
+        # Atajos de teclado
+        ventana.bind("<Return>", self.agregar_tarea)
+        ventana.bind("<c>", self.marcar_completada)
+        ventana.bind("<d>", self.eliminar_tarea)
+        ventana.bind("<Delete>", self.eliminar_tarea)
+        ventana.bind("<Escape>", self.cerrar_app)
+        ventana.protocol("WM_DELETE_WINDOW", self.cerrar_app)
+
+        # Almacén: carga las tareas guardadas y guarda cada cambio sin bloquear la ventana
+        self.almacen = AlmacenTareas(ruta, ventana, self.tareas, al_estar_listo=self.almacen_listo)
+
+    # Función para traducir la selección de la lista (filtrada) a un índice del modelo
+    def indice_seleccionado(self):
+        seleccion = self.lista.curselection()
+        if seleccion:
+            return self.visibles.posicion_en_modelo(seleccion[0])
+        return None
+
+    # Función para agregar tarea
+    def agregar_tarea(self, event=None):
+        texto = self.entrada.get()
+        if texto:
+            self.tareas.agregar(texto)
+            self.entrada.delete(0, END)
+
+    # Función para marcar como completada
+    def marcar_completada(self, event=None):
+        index = self.indice_seleccionado()
+        if index is not None:
+            self.tareas.completar(index)
+
+    # Función para eliminar tarea
+    def eliminar_tarea(self, event=None):
+        index = self.indice_seleccionado()
+        if index is not None:
+            self.tareas.eliminar(index)
+
+    # Funciones del filtro: cada tecla reinicia la espera, así solo se filtra al dejar de escribir
+    def programar_filtro(self, *args):
+        if self.filtro_pendiente is not None:
+            self.ventana.after_cancel(self.filtro_pendiente)
+        self.filtro_pendiente = self.ventana.after(ESPERA_FILTRO_MS, self.aplicar_filtro)
+
+    def aplicar_filtro(self, *args):
+        self.filtro_pendiente = None
+        self.visibles.filtrar(self.texto_filtro.get(), self.estado_filtro.get())
+
+    # Función para habilitar la entrada cuando el almacén ya conoce los id guardados
+    def almacen_listo(self):
+        self.entrada.config(state=NORMAL)
+        self.entrada.focus()
+
+    # Función para cerrar la app guardando los cambios pendientes
+    def cerrar_app(self, event=None):
+        self.almacen.cerrar()
+        self.ventana.destroy()
+
 
 # Ejecutar la app
-ventana.mainloop()
+if __name__ == "__main__":
+    ventana = Tk()
+    GestionTareas(ventana)
+    ventana.mainloop()
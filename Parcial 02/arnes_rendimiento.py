@@ -0,0 +1,312 @@
+# ==========================================
+# ARNÉS DE RENDIMIENTO DE LAS APPS Tk (SIN PANTALLA)
+# ==========================================
+# Construye cada app (Semanas 13 a 16) sobre una ventana Tk propia dentro de
+# un Xvfb, le inyecta acciones sintéticas (altas, bajas, atajos de teclado)
+# y mide, para tamaños de datos crecientes:
+# - la latencia de cada acción hasta que Tk terminó de procesarla (update())
+# - los bloqueos del bucle de eventos durante la carga: un "latido" con after()
+#   debería llegar cada LATIDO_MS; cualquier hueco mayor es tiempo congelado
+#
+# Uso: python arnes_rendimiento.py [--apps 13 14 15 16] [--tamanos 1000 10000 100000]
+# Si no hay DISPLAY, el arnés arranca su propio Xvfb (hace falta tenerlo instalado).
+
+import argparse
+import importlib.util
+import os
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Callable, Dict, List
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+
+LATIDO_MS = 10        # periodo del latido que detecta bloqueos
+BLOQUEO_MS = 50       # un hueco mayor entre latidos cuenta como bloqueo
+LIMITE_CARGA_S = 600  # tiempo máximo de espera a que una app termine de cargar
+
+
+# ---------- Entorno ----------
+@contextmanager
+def pantalla_virtual():
+    """
+    Usa el DISPLAY actual o, si no hay, arranca un Xvfb en un número libre.
+    """
+    if os.environ.get("DISPLAY"):
+        yield
+        return
+    if shutil.which("Xvfb") is None:
+        sys.exit("No hay DISPLAY ni Xvfb instalado (o ejecutar con: xvfb-run -a python arnes_rendimiento.py)")
+    lector, escritor = os.pipe()
+    proceso = subprocess.Popen(
+        ["Xvfb", "-displayfd", str(escritor), "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+        pass_fds=(escritor,), stderr=subprocess.DEVNULL)
+    os.close(escritor)
+    numero = b""
+    while not numero.endswith(b"\n"):
+        trozo = os.read(lector, 16)
+        if not trozo:
+            sys.exit("Xvfb no pudo arrancar.")
+        numero += trozo
+    os.close(lector)
+    os.environ["DISPLAY"] = f":{numero.decode().strip()}"
+    try:
+        yield
+    finally:
+        proceso.terminate()
+        proceso.wait()
+        del os.environ["DISPLAY"]
+
+
+def cargar_modulo(ruta_relativa: str, nombre: str):
+    # Los scripts tienen espacios en el nombre: se cargan por ruta, con su carpeta en sys.path
+    ruta = os.path.join(CARPETA, ruta_relativa)
+    carpeta = os.path.dirname(ruta)
+    if carpeta not in sys.path:
+        sys.path.insert(0, carpeta)
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+# ---------- Mediciones ----------
+class Latido:
+    """
+    Callback periódico con after(): registra cuánto se retrasa cada latido.
+    """
+    def __init__(self, ventana):
+        self.ventana = ventana
+        self.huecos: List[float] = []
+        self._ultimo = time.perf_counter()
+        self._id = ventana.after(LATIDO_MS, self._latir)
+
+    def _latir(self) -> None:
+        ahora = time.perf_counter()
+        self.huecos.append((ahora - self._ultimo) * 1000 - LATIDO_MS)
+        self._ultimo = ahora
+        self._id = self.ventana.after(LATIDO_MS, self._latir)
+
+    def detener(self) -> Dict[str, float]:
+        self.ventana.after_cancel(self._id)
+        bloqueos = [h for h in self.huecos if h > BLOQUEO_MS]
+        return {"bloqueos": len(bloqueos), "bloqueado_ms": sum(bloqueos), "max_hueco_ms": max(self.huecos, default=0.0)}
+
+
+def esperar(ventana, condicion: Callable[[], bool], limite_s: float = LIMITE_CARGA_S) -> float:
+    """
+    Procesa eventos de Tk hasta que se cumple la condición. Retorna los segundos transcurridos.
+    """
+    inicio = time.perf_counter()
+    while not condicion():
+        if time.perf_counter() - inicio > limite_s:
+            raise TimeoutError("La app no terminó a tiempo.")
+        ventana.update()
+        time.sleep(0.001)
+    return time.perf_counter() - inicio
+
+
+def medir(ventana, accion: Callable[[], None]) -> float:
+    # Latencia de una acción: desde que se dispara hasta que Tk la procesó y redibujó
+    inicio = time.perf_counter()
+    accion()
+    ventana.update()
+    return (time.perf_counter() - inicio) * 1000
+
+
+def pulsar(ventana, widget, tecla: str) -> None:
+    # Los eventos de teclado van al widget con el foco
+    widget.focus_force()
+    ventana.update()
+    widget.event_generate(tecla)
+
+
+def escribir(entrada, texto: str) -> None:
+    entrada.delete(0, "end")
+    entrada.insert(0, texto)
+
+
+# ---------- Escenarios: uno por app ----------
+def escenario_semana13(ventana, carpeta: str, tamano: int, repeticiones: int) -> Dict:
+    app = cargar_modulo("Semana 13/Aplicacion GUI.py", "aplicacion_gui").AplicacionGUI(ventana)
+    ventana.update()
+    resultado: Dict = {"acciones": {}}
+
+    # Alta masiva: pegar N líneas en el campo de texto
+    ventana.clipboard_clear()
+    ventana.clipboard_append("\n".join(f"Dato {i}" for i in range(tamano)))
+    latido = Latido(ventana)
+    resultado["acciones"]["pegar N líneas"] = [medir(ventana, lambda: pulsar(ventana, app.entrada, "<<Paste>>"))]
+    resultado["carga_s"] = esperar(ventana, lambda: app.vista_tabla._programado is None)
+    resultado.update(latido.detener())
+
+    altas = resultado["acciones"]["agregar"] = []
+    for i in range(repeticiones):
+        escribir(app.entrada, f"Nuevo {i}")
+        altas.append(medir(ventana, app.agregar_dato))
+    resultado["acciones"]["limpiar"] = [medir(ventana, app.limpiar_datos)]
+    ventana.destroy()
+    return resultado
+
+
+def escenario_semana14(ventana, carpeta: str, tamano: int, repeticiones: int) -> Dict:
+    modulo = cargar_modulo("Semana 14/Agenda personal.py", "agenda_personal")
+    from almacen_agenda import AlmacenAgenda
+    from modelo_agenda import FORMATO_FECHA, Evento
+
+    # Eventos ya guardados, repartidos por el año en curso (la ventana visible por defecto)
+    ruta = os.path.join(carpeta, "agenda.db")
+    inicio_anio = date(date.today().year, 1, 1)
+    almacen = AlmacenAgenda(ruta)
+    almacen.guardar(Evento(i + 1, inicio_anio + timedelta(days=i % 365), f"{i % 24:02d}:{i % 60:02d}", f"Evento {i}")
+                    for i in range(tamano))
+    almacen.cerrar()
+
+    latido = Latido(ventana)
+    inicio = time.perf_counter()
+    app = modulo.AgendaPersonal(ventana, ruta)
+    ventana.update()
+    resultado: Dict = {"acciones": {}, "primer_dibujo_ms": (time.perf_counter() - inicio) * 1000}
+    esperar(ventana, lambda: not app.cargando and app.relleno_actual is None and app.eventos.total == tamano)
+    resultado["carga_s"] = time.perf_counter() - inicio
+    resultado.update(latido.detener())
+
+    altas = resultado["acciones"]["agregar"] = []
+    for i in range(repeticiones):
+        escribir(app.campo_fecha, (inicio_anio + timedelta(days=i)).strftime(FORMATO_FECHA))
+        escribir(app.campo_hora, "12:30")
+        escribir(app.campo_desc, f"Nuevo {i}")
+        altas.append(medir(ventana, app.agregar_evento))
+    bajas = resultado["acciones"]["eliminar"] = []
+    for _ in range(repeticiones):
+        app.tabla.selection_set(app.tabla.get_children()[0])
+        bajas.append(medir(ventana, app.eliminar_evento))
+    resultado["acciones"]["mostrar ventana"] = [medir(ventana, app.mostrar_ventana)]
+    app.cerrar_app()
+    return resultado
+
+
+def guardar_tareas(ruta: str, tamano: int) -> None:
+    # Mismo esquema que AlmacenTareas
+    conexion = sqlite3.connect(ruta)
+    conexion.execute("CREATE TABLE tareas (id INTEGER PRIMARY KEY, texto TEXT NOT NULL, completada INTEGER NOT NULL)")
+    conexion.executemany("INSERT INTO tareas VALUES (?, ?, ?)",
+                         ((i, f"Tarea {i} comprar pan leche", i % 3 == 0) for i in range(1, tamano + 1)))
+    conexion.commit()
+    conexion.close()
+
+
+def cargar_tareas(ventana, clase, carpeta: str, tamano: int):
+    ruta = os.path.join(carpeta, "tareas.db")
+    guardar_tareas(ruta, tamano)
+    latido = Latido(ventana)
+    inicio = time.perf_counter()
+    app = clase(ventana, ruta)
+    ventana.update()
+    resultado: Dict = {"acciones": {}, "primer_dibujo_ms": (time.perf_counter() - inicio) * 1000}
+    esperar(ventana, lambda: len(app.tareas) == tamano)
+    resultado["carga_s"] = time.perf_counter() - inicio
+    resultado.update(latido.detener())
+    return app, resultado
+
+
+def escenario_semana15(ventana, carpeta: str, tamano: int, repeticiones: int) -> Dict:
+    clase = cargar_modulo("Semana 15/Lista de tareas.py", "lista_de_tareas").ListaTareas
+    app, resultado = cargar_tareas(ventana, clase, carpeta, tamano)
+
+    altas = resultado["acciones"]["agregar"] = []
+    completadas = resultado["acciones"]["completar"] = []
+    bajas = resultado["acciones"]["eliminar"] = []
+    for i in range(repeticiones):
+        escribir(app.entrada, f"Nueva {i}")
+        altas.append(medir(ventana, app.agregar_tarea))
+        app.lista.selection_set(tamano // 2 + i)
+        completadas.append(medir(ventana, app.marcar_completada))
+        bajas.append(medir(ventana, app.eliminar_tarea))
+    app.cerrar_app()
+    return resultado
+
+
+def escenario_semana16(ventana, carpeta: str, tamano: int, repeticiones: int) -> Dict:
+    clase = cargar_modulo("Semana 16/Cierre tecla Espace.py", "cierre_tecla_espace").GestionTareas
+    app, resultado = cargar_tareas(ventana, clase, carpeta, tamano)
+
+    # Acciones por atajos de teclado, como las haría el usuario
+    altas = resultado["acciones"]["Enter (agregar)"] = []
+    completadas = resultado["acciones"]["c (completar)"] = []
+    bajas = resultado["acciones"]["d (eliminar)"] = []
+    for i in range(repeticiones):
+        escribir(app.entrada, f"Nueva {i}")
+        altas.append(medir(ventana, lambda: pulsar(ventana, app.entrada, "<Return>")))
+        app.lista.selection_set(tamano // 2 + i)
+        completadas.append(medir(ventana, lambda: pulsar(ventana, app.lista.canvas, "<c>")))
+        bajas.append(medir(ventana, lambda: pulsar(ventana, app.lista.canvas, "<d>")))
+
+    # Filtro: cada tecla solo reprograma la espera; el filtrado se mide aparte
+    teclas = resultado["acciones"]["tecla en el filtro"] = []
+    filtros = resultado["acciones"]["aplicar filtro"] = []
+    for consulta in ("t", "ta", "tarea", "tarea le", "tarea lech"):
+        teclas.append(medir(ventana, lambda: app.texto_filtro.set(consulta)))
+        filtros.append(medir(ventana, app.aplicar_filtro))
+    app.texto_filtro.set("")
+    resultado["acciones"]["quitar filtro"] = [medir(ventana, app.aplicar_filtro)]
+    app.cerrar_app()
+    return resultado
+
+
+ESCENARIOS = {
+    "13": ("Semana 13 - Aplicación GUI", escenario_semana13),
+    "14": ("Semana 14 - Agenda personal", escenario_semana14),
+    "15": ("Semana 15 - Lista de tareas", escenario_semana15),
+    "16": ("Semana 16 - Gestión de tareas", escenario_semana16),
+}
+
+
+# ---------- Informe ----------
+def imprimir(tamano: int, resultado: Dict) -> None:
+    resumen = f"  N = {tamano:,}: carga {resultado['carga_s']:.2f} s"
+    if "primer_dibujo_ms" in resultado:
+        resumen += f", primer dibujo {resultado['primer_dibujo_ms']:.0f} ms"
+    resumen += (f", {resultado['bloqueos']} bloqueos > {BLOQUEO_MS} ms"
+                f" ({resultado['bloqueado_ms']:.0f} ms en total, máx. {resultado['max_hueco_ms']:.0f} ms)")
+    print(resumen)
+    print(f"    {'acción':<22}{'n':>5}{'mediana ms':>12}{'p95 ms':>10}{'máx ms':>10}")
+    for accion, latencias in resultado["acciones"].items():
+        ordenadas = sorted(latencias)
+        p95 = ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * 0.95))]
+        print(f"    {accion:<22}{len(latencias):>5}{statistics.median(latencias):>12.2f}"
+              f"{p95:>10.2f}{ordenadas[-1]:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia y bloqueos de las apps Tk con datos crecientes.")
+    parser.add_argument("--apps", nargs="+", choices=ESCENARIOS, default=list(ESCENARIOS))
+    parser.add_argument("--tamanos", nargs="+", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeticiones", type=int, default=20)
+    argumentos = parser.parse_args()
+
+    from tkinter import Tk
+    with pantalla_virtual():
+        for clave in argumentos.apps:
+            titulo, escenario = ESCENARIOS[clave]
+            print(titulo)
+            for tamano in argumentos.tamanos:
+                with tempfile.TemporaryDirectory() as carpeta:
+                    ventana = Tk()
+                    try:
+                        imprimir(tamano, escenario(ventana, carpeta, tamano, argumentos.repeticiones))
+                    except ImportError as e:
+                        # falta alguna dependencia de la app
+                        print(f"  omitida: {e}")
+                        ventana.destroy()
+                        break
+
+
+if __name__ == "__main__":
+    main()
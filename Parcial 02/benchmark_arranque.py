@@ -0,0 +1,102 @@
+# ==========================================
+# BENCHMARK DE ARRANQUE DE LAS APPS Tk
+# ==========================================
+# Para cada app (Semanas 13 a 16), en un proceso nuevo cada vez (arranque en frío):
+# - importación: `python -X importtime`, cargando solo el script (sin crear ventanas);
+#   se listan los módulos de primer nivel que más tardan
+# - primer cuadro: tiempo de reloj desde que se lanza el proceso hasta que la
+#   ventana está visible (wait_visibility), con la app construida. Necesita
+#   pantalla: sin DISPLAY se omite (ejecutar con xvfb-run -a)
+#
+# Uso: python benchmark_arranque.py [--repeticiones 5]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+
+# app -> (script, clase, ¿recibe ruta de almacén?)
+APPS = {
+    "Semana 13": ("Semana 13/Aplicacion GUI.py", "AplicacionGUI", False),
+    "Semana 14": ("Semana 14/Agenda personal.py", "AgendaPersonal", True),
+    "Semana 15": ("Semana 15/Lista de tareas.py", "ListaTareas", True),
+    "Semana 16": ("Semana 16/Cierre tecla Espace.py", "GestionTareas", True),
+}
+
+# Código del proceso hijo: argv = [modo, inicio, script, clase, ruta_almacén | ""]
+HIJO = """
+import importlib.util, os, sys, time
+modo, inicio, script, clase, ruta = sys.argv[1:6]
+sys.path.insert(0, os.path.dirname(script))
+spec = importlib.util.spec_from_file_location("app", script)
+modulo = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(modulo)
+if modo == "ventana":
+    from tkinter import Tk
+    ventana = Tk()
+    app = getattr(modulo, clase)(ventana, *([ruta] if ruta else []))
+    ventana.wait_visibility(ventana)
+    print(time.time() - float(inicio))
+    getattr(app, "cerrar_app", ventana.destroy)()
+"""
+
+
+def ejecutar(modo: str, script: str, clase: str, ruta: str, *opciones: str) -> subprocess.CompletedProcess:
+    argumentos = [modo, str(time.time()), os.path.join(CARPETA, script), clase, ruta]
+    return subprocess.run([sys.executable, *opciones, "-c", HIJO, *argumentos],
+                          capture_output=True, text=True, timeout=120)
+
+
+def tiempos_importacion(script: str, clase: str):
+    """
+    Retorna (total_ms, [(ms, módulo)]) de los módulos de primer nivel, de mayor a menor.
+    """
+    salida = ejecutar("importar", script, clase, "", "-X", "importtime").stderr
+    modulos = []
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        if not nombre.startswith("  "):  # sin sangría extra: importado desde el primer nivel
+            modulos.append((int(acumulado) / 1000, nombre.strip()))
+    modulos.sort(reverse=True)
+    return sum(ms for ms, _ in modulos), modulos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de importación y hasta el primer cuadro de cada app.")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    argumentos = parser.parse_args()
+    hay_pantalla = bool(os.environ.get("DISPLAY"))
+
+    for nombre, (script, clase, con_almacen) in APPS.items():
+        print(nombre)
+        total, modulos = tiempos_importacion(script, clase)
+        print(f"  importación (-X importtime): {total:.1f} ms")
+        for ms, modulo in modulos[:6]:
+            print(f"    {ms:8.1f} ms  {modulo}")
+
+        if not hay_pantalla:
+            print("  primer cuadro: omitido (sin DISPLAY; ejecutar con xvfb-run -a)")
+            continue
+        tiempos = []
+        for _ in range(argumentos.repeticiones):
+            with tempfile.TemporaryDirectory() as carpeta:
+                ruta = os.path.join(carpeta, "datos.db") if con_almacen else ""
+                resultado = ejecutar("ventana", script, clase, ruta)
+                if resultado.returncode != 0:
+                    print(f"  primer cuadro: error\n{resultado.stderr}")
+                    break
+                tiempos.append(float(resultado.stdout.strip().splitlines()[-1]) * 1000)
+        if tiempos:
+            print(f"  primer cuadro: mediana {statistics.median(tiempos):.0f} ms, "
+                  f"mín. {min(tiempos):.0f} ms ({len(tiempos)} arranques)")
+
+
+if __name__ == "__main__":
+    main()